@@ -2,6 +2,10 @@
 Configuration file for the weights of dimensions and metrics in the Metacognitive Analysis Framework.
 """
 
+from types import MappingProxyType
+import math
+import numpy as np
+
 # Dimension weights (must sum to 1.0)
 DIMENSION_WEIGHTS = {
     "knowledge_awareness": 0.25,  # w₁
@@ -50,15 +54,36 @@ METRIC_WEIGHTS = {
     }
 }
 
+# Freeze the weight tables so the arrays derived from them below stay in sync
+DIMENSION_WEIGHTS = MappingProxyType(DIMENSION_WEIGHTS)
+METRIC_WEIGHTS = MappingProxyType({dimension: MappingProxyType(weights)
+                                   for dimension, weights in METRIC_WEIGHTS.items()})
+
 # Ensure weights sum to 1.0
 def validate_weights():
     """Validate that all weight sets sum to approximately 1.0."""
-    assert abs(sum(DIMENSION_WEIGHTS.values()) - 1.0) < 1e-10, "Dimension weights must sum to 1.0"
+    assert math.isclose(math.fsum(DIMENSION_WEIGHTS.values()), 1.0, rel_tol=1e-9, abs_tol=1e-12), \
+        "Dimension weights must sum to 1.0"
     
     for dimension, weights in METRIC_WEIGHTS.items():
-        assert abs(sum(weights.values()) - 1.0) < 1e-10, f"Metric weights for {dimension} must sum to 1.0"
-    
-    print("All weights validated successfully.")
+        assert math.isclose(math.fsum(weights.values()), 1.0, rel_tol=1e-9, abs_tol=1e-12), \
+            f"Metric weights for {dimension} must sum to 1.0"
+
+validate_weights()
+
+def _weight_array(weights):
+    """Build a read-only float array of the weight values, in definition order."""
+    array = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+    array.flags.writeable = False
+    return array
+
+# Names and weights as parallel sequences, in the order defined above, for vectorized scoring
+DIM_NAMES = tuple(DIMENSION_WEIGHTS)
+DIM_W = _weight_array(DIMENSION_WEIGHTS)
+METRIC_ARRAYS = MappingProxyType({
+    dimension: (tuple(weights), _weight_array(weights))
+    for dimension, weights in METRIC_WEIGHTS.items()
+})
 
 if __name__ == "__main__":
-    validate_weights()
\ No newline at end of file
+    print("All weights validated successfully.")
\ No newline at end of file
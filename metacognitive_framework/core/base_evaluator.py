@@ -3,9 +3,31 @@ Base Evaluator - Abstract base class for all dimension evaluators in the Metacog
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Tuple, Optional
-import json
+from typing import Dict, Any, List, Tuple, Optional, Sequence
+import numpy as np
+import math
 import os
+import logging
+from .serialization import dump_json, ensure_dir
+
+logger = logging.getLogger(__name__)
+
+
+class _MetricEntry:
+    """
+    Weight and score of a single metric tracked by an evaluator.
+    Uses __slots__ to keep per-metric storage small and attribute access fast.
+    """
+    
+    __slots__ = ('weight', 'score')
+    
+    def __init__(self, weight: float, score: float = 0.0):
+        self.weight = weight
+        self.score = score
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Convert the entry to a dictionary for serialization."""
+        return {'weight': self.weight, 'score': self.score}
 
 
 class BaseEvaluator(ABC):
@@ -24,9 +46,17 @@ class BaseEvaluator(ABC):
             weight: Weight of this dimension in the overall confidence score
         """
         self.name = name
+        self._slug = name.lower().replace(' ', '_')  # Filename prefix used by save_results
         self.weight = weight
-        self.metrics = {}  # Dictionary to store metrics and their weights
+        self.metrics: Dict[str, _MetricEntry] = {}  # Metric weights and scores by name
         self.results = {}  # Store evaluation results
+        self.verbose = False  # Log each results file written by save_results
+        self._total_weight = 0.0  # Running sum of metric weights
+        self._score_cache: Optional[float] = None  # Memoized result of calculate_dimension_score
+        # Parallel weight/score arrays for the weighted sum, rebuilt lazily after add_metric
+        self._metric_index: Dict[str, int] = {}
+        self._weights_arr: Optional[np.ndarray] = None
+        self._scores_arr: Optional[np.ndarray] = None
     
     def add_metric(self, name: str, weight: float):
         """
@@ -36,13 +66,39 @@ class BaseEvaluator(ABC):
             name: Name of the metric
             weight: Weight of this metric within the dimension
         """
-        if sum(metric['weight'] for metric in self.metrics.values()) + weight > 1.0:
+        new_total = self._total_weight + weight
+        if new_total > 1.0 and not math.isclose(new_total, 1.0, rel_tol=1e-9, abs_tol=1e-12):
             raise ValueError(f"Adding metric '{name}' would exceed total weight of 1.0")
         
-        self.metrics[name] = {
-            'weight': weight,
-            'score': 0.0
-        }
+        if name in self.metrics:
+            new_total -= self.metrics[name].weight
+        
+        self.metrics[name] = _MetricEntry(weight)
+        self._total_weight = new_total
+        self._weights_arr = self._scores_arr = None
+        self._score_cache = None
+    
+    def add_metrics(self, names: Sequence[str], weights: np.ndarray):
+        """
+        Add several metrics at once from parallel sequences of names and weights,
+        such as an entry of config.weights.METRIC_ARRAYS. When these are all of the
+        evaluator's metrics, the weight array is used for scoring as it is.
+        
+        Args:
+            names: Names of the metrics
+            weights: Weight of each metric within the dimension, in the order of names
+        """
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (len(names),):
+            raise ValueError(f"Expected {len(names)} weights, got {weights.size}")
+        
+        for name, weight in zip(names, weights.tolist()):
+            self.add_metric(name, weight)
+        
+        if list(self.metrics) == list(names):
+            self._metric_index = {name: index for index, name in enumerate(names)}
+            self._weights_arr = weights
+            self._scores_arr = np.array([self.metrics[name].score for name in names], dtype=float)
     
     def set_metric_score(self, metric_name: str, score: float):
         """
@@ -58,23 +114,31 @@ class BaseEvaluator(ABC):
         if not 0 <= score <= 1:
             raise ValueError(f"Score must be between 0 and 1, got {score}")
         
-        self.metrics[metric_name]['score'] = score
+        self.metrics[metric_name].score = score
+        if self._scores_arr is not None:
+            self._scores_arr[self._metric_index[metric_name]] = score
+        self._score_cache = None
+    
+    def _build_arrays(self):
+        """Build the weight and score arrays from the current metrics."""
+        self._metric_index = {name: index for index, name in enumerate(self.metrics)}
+        self._weights_arr = np.array([entry.weight for entry in self.metrics.values()], dtype=float)
+        self._scores_arr = np.array([entry.score for entry in self.metrics.values()], dtype=float)
     
     def calculate_dimension_score(self) -> float:
         """
         Calculate the overall score for this dimension using the weighted sum of metrics.
+        The result is cached until a metric is added or its score is set.
         
         Returns:
             The weighted score for this dimension
         """
-        if not self.metrics:
-            return 0.0
-        
-        total_score = 0.0
-        for metric_name, metric_data in self.metrics.items():
-            total_score += metric_data['score'] * metric_data['weight']
+        if self._score_cache is None:
+            if self._weights_arr is None:
+                self._build_arrays()
+            self._score_cache = float(np.dot(self._scores_arr, self._weights_arr))
         
-        return total_score
+        return self._score_cache
     
     @abstractmethod
     def evaluate(self, llm_response: str, **kwargs) -> float:
@@ -91,28 +155,29 @@ class BaseEvaluator(ABC):
         """
         pass
     
-    def save_results(self, output_dir: str, run_id: str):
+    def save_results(self, output_dir: str, run_id: str, pretty: bool = False):
         """
         Save evaluation results to a JSON file.
         
         Args:
             output_dir: Directory to save results
             run_id: Unique identifier for this evaluation run
+            pretty: Whether to write indented JSON instead of compact output
         """
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
         
         result_data = {
             'dimension': self.name,
             'dimension_weight': self.weight,
             'dimension_score': self.calculate_dimension_score(),
-            'metrics': self.metrics,
+            'metrics': {name: entry.to_dict() for name, entry in self.metrics.items()},
             'additional_data': self.results
         }
         
-        filename = f"{self.name.lower().replace(' ', '_')}_{run_id}.json"
+        filename = f"{self._slug}_{run_id}.json"
         filepath = os.path.join(output_dir, filename)
         
-        with open(filepath, 'w') as f:
-            json.dump(result_data, f, indent=2)
+        dump_json(result_data, filepath, pretty=pretty)
         
-        print(f"Results saved to {filepath}")
\ No newline at end of file
+        if self.verbose:
+            logger.info("Results saved to %s", filepath)
\ No newline at end of file
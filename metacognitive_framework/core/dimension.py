@@ -2,10 +2,16 @@
 Dimension - Class representing a dimension in the Metacognitive Analysis Framework.
 """
 
-from typing import Dict, List, Any, Callable, Optional
+from typing import Dict, List, Any, Callable, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from .metric import Metric
-import json
+from .serialization import dump_json, ensure_dir
+import numpy as np
+import math
 import os
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class Dimension:
@@ -14,15 +20,20 @@ class Dimension:
     Each dimension contains multiple metrics and has an overall weight in the framework.
     """
     
-    def __init__(self, name: str, weight: float):
+    _INITIAL_CAPACITY = 16  # Metric slots reserved before the arrays need to grow
+    
+    def __init__(self, name: str, weight: float, parallel: bool = False):
         """
         Initialize a new dimension.
         
         Args:
             name: Name of the dimension
             weight: Weight of this dimension in the overall framework (0 to 1)
+            parallel: Whether evaluate runs the metrics concurrently in a thread
+                pool; only safe if their evaluation functions are thread-safe
         """
         self.name = name
+        self._slug = name.lower().replace(' ', '_')  # Filename prefix used by save_results
         
         if not 0 <= weight <= 1:
             raise ValueError(f"Weight must be between 0 and 1, got {weight}")
@@ -30,6 +41,17 @@ class Dimension:
         
         self.metrics: Dict[str, Metric] = {}
         self.metadata = {}  # For storing additional information about the dimension
+        self.verbose = False  # Log each results file written by save_results
+        self.parallel = parallel  # Evaluate the metrics concurrently
+        self._total_weight = 0.0  # Running sum of metric weights
+        self._score_cache: Optional[float] = None  # Memoized result of calculate_score
+        
+        # Structure-of-arrays storage for metric weights and scores. Slot i belongs
+        # to self._names[i]; the arrays are over-allocated and grown by doubling.
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._weights = np.zeros(self._INITIAL_CAPACITY)
+        self._scores = np.zeros(self._INITIAL_CAPACITY)
     
     def add_metric(self, metric: Metric):
         """
@@ -39,31 +61,92 @@ class Dimension:
             metric: Metric object to add
         """
         # Check if total weight would exceed 1.0
-        total_weight = sum(m.weight for m in self.metrics.values())
-        if total_weight + metric.weight > 1.0 + 1e-10:  # Allow small floating point error
-            raise ValueError(f"Adding metric '{metric.name}' with weight {metric.weight} would exceed total weight of 1.0 (current: {total_weight})")
+        new_total = self._total_weight + metric.weight
+        if new_total > 1.0 and not math.isclose(new_total, 1.0, rel_tol=1e-9, abs_tol=1e-12):  # Allow small floating point error
+            raise ValueError(f"Adding metric '{metric.name}' with weight {metric.weight} would exceed total weight of 1.0 (current: {self._total_weight})")
+        
+        replaced = self.metrics.get(metric.name)
+        if replaced is not None:
+            # Reuse the replaced metric's slot and hand its score back to it
+            index = self._index[metric.name]
+            replaced._detach()
+            new_total -= replaced.weight
+        else:
+            index = len(self._names)
+            if index == len(self._weights):
+                self._weights = np.concatenate((self._weights, np.zeros(index)))
+                self._scores = np.concatenate((self._scores, np.zeros(index)))
+            self._names.append(metric.name)
+            self._index[metric.name] = index
         
+        self._weights[index] = metric.weight
+        self._scores[index] = metric.score
         self.metrics[metric.name] = metric
+        self._total_weight = new_total
+        metric._dimension = self
+        metric._index = index
+        self._score_cache = None
+    
+    def _update_weight(self, index: int, weight: float):
+        """Record a metric's new weight and discard the cached dimension score."""
+        self._total_weight += weight - float(self._weights[index])
+        self._weights[index] = weight
+        self._score_cache = None
+    
+    def _update_score(self, index: int, score: float):
+        """Record a metric's new score and discard the cached dimension score."""
+        self._scores[index] = score
+        self._score_cache = None
+    
+    def set_scores(self, scores: Sequence[float]):
+        """
+        Set the scores of all metrics at once.
+        
+        Args:
+            scores: One score between 0 and 1 per metric, in the order the metrics were added
+        """
+        scores = np.asarray(scores, dtype=float)
+        if scores.shape != (len(self._names),):
+            raise ValueError(f"Expected {len(self._names)} scores, got {scores.size}")
+        if np.any((scores < 0) | (scores > 1)):
+            raise ValueError("Scores must be between 0 and 1")
+        
+        self._scores[:len(self._names)] = scores
+        self._score_cache = None
     
     def calculate_score(self) -> float:
         """
         Calculate the overall score for this dimension based on its metrics.
+        The result is cached until a metric is added or its score changes.
         
         Returns:
             Score between 0 and 1
         """
-        if not self.metrics:
-            return 0.0
+        if self._score_cache is None:
+            count = len(self._names)
+            self._score_cache = float(np.dot(self._scores[:count], self._weights[:count]))
         
-        total_score = 0.0
-        for metric in self.metrics.values():
-            total_score += metric.score * metric.weight
+        return self._score_cache
+    
+    def _evaluate_metric(self, metric: Metric, args: tuple, kwargs: Dict[str, Any]):
+        """
+        Evaluate a single metric, reporting errors instead of raising them.
         
-        return total_score
+        Args:
+            metric: Metric to evaluate
+            args, kwargs: Arguments to pass to the metric's evaluate function
+        """
+        # Each metric may need specific arguments, so let them handle their own evaluation
+        try:
+            metric.evaluate(*args, **kwargs)
+        except Exception as e:
+            logger.error("Error evaluating metric '%s': %s", metric.name, e)
+            # Continue with other metrics instead of failing completely
     
     def evaluate(self, *args, **kwargs) -> float:
         """
-        Evaluate all metrics in this dimension.
+        Evaluate all metrics in this dimension, concurrently if the dimension
+        was created with parallel=True.
         
         Args:
             *args, **kwargs: Arguments to pass to each metric's evaluate function
@@ -71,25 +154,26 @@ class Dimension:
         Returns:
             Overall dimension score
         """
-        for metric in self.metrics.values():
-            # Each metric may need specific arguments, so let them handle their own evaluation
-            try:
-                metric.evaluate(*args, **kwargs)
-            except Exception as e:
-                print(f"Error evaluating metric '{metric.name}': {e}")
-                # Continue with other metrics instead of failing completely
+        if self.parallel and len(self.metrics) > 1:
+            with ThreadPoolExecutor(max_workers=len(self.metrics)) as executor:
+                list(executor.map(lambda metric: self._evaluate_metric(metric, args, kwargs),
+                                  self.metrics.values()))
+        else:
+            for metric in self.metrics.values():
+                self._evaluate_metric(metric, args, kwargs)
         
         return self.calculate_score()
     
-    def save_results(self, output_dir: str, run_id: str):
+    def save_results(self, output_dir: str, run_id: str, pretty: bool = False):
         """
         Save evaluation results to a JSON file.
         
         Args:
             output_dir: Directory to save results
             run_id: Unique identifier for this evaluation run
+            pretty: Whether to write indented JSON instead of compact output
         """
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
         
         result_data = {
             'dimension': self.name,
@@ -99,10 +183,10 @@ class Dimension:
             'metadata': self.metadata
         }
         
-        filename = f"{self.name.lower().replace(' ', '_')}_{run_id}.json"
+        filename = f"{self._slug}_{run_id}.json"
         filepath = os.path.join(output_dir, filename)
         
-        with open(filepath, 'w') as f:
-            json.dump(result_data, f, indent=2)
+        dump_json(result_data, filepath, pretty=pretty)
         
-        print(f"Results saved to {filepath}")
\ No newline at end of file
+        if self.verbose:
+            logger.info("Results saved to %s", filepath)
\ No newline at end of file
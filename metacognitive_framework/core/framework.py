@@ -3,11 +3,17 @@ Framework - Main class for the Metacognitive Analysis Framework.
 Combines all dimensions and calculates the overall confidence score.
 """
 
-from typing import Dict, List, Any, Optional
-import json
+from typing import Dict, List, Any, Optional, Sequence
 import os
+import math
 import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from .dimension import Dimension
+from .serialization import dump_json, ensure_dir
+
+logger = logging.getLogger(__name__)
 
 
 class MetacognitiveFramework:
@@ -20,10 +26,43 @@ class MetacognitiveFramework:
         """Initialize the framework with empty dimensions."""
         self.dimensions: Dict[str, Dimension] = {}
         self.results = {}  # Store evaluation results
+        self.verbose = False  # Log each results file written by save_results
         self.metadata = {
             'creation_time': datetime.datetime.now().isoformat(),
             'description': 'Metacognitive Analysis Framework for evaluating LLM reasoning'
         }
+        self._total_weight = 0.0  # Running sum of dimension weights
+        self._dim_weights_arr: Optional[np.ndarray] = None  # Dimension weights, rebuilt lazily
+    
+    @classmethod
+    def from_config(cls, dimensions: Sequence[Dimension]) -> "MetacognitiveFramework":
+        """
+        Create a framework whose dimensions are weighted as configured in config/weights.py.
+        Each dimension's weight is taken from config.weights.DIM_W by its snake_case
+        name, and the configured weight array is used for scoring as it is.
+        
+        Args:
+            dimensions: Dimensions to add; each must have a configured weight
+        
+        Returns:
+            The framework, with its dimensions in configuration order
+        """
+        # Imported here so the core package does not require config on the import path
+        from config.weights import DIM_NAMES, DIM_W
+        
+        by_slug = {dimension._slug: dimension for dimension in dimensions}
+        unknown = by_slug.keys() - set(DIM_NAMES)
+        if unknown:
+            raise ValueError(f"No configured weight for dimensions: {', '.join(sorted(unknown))}")
+        
+        framework = cls()
+        indices = [index for index, name in enumerate(DIM_NAMES) if name in by_slug]
+        for index in indices:
+            dimension = by_slug[DIM_NAMES[index]]
+            dimension.weight = float(DIM_W[index])
+            framework.add_dimension(dimension)
+        framework._dim_weights_arr = DIM_W if len(indices) == len(DIM_NAMES) else DIM_W[indices]
+        return framework
     
     def add_dimension(self, dimension: Dimension):
         """
@@ -33,11 +72,23 @@ class MetacognitiveFramework:
             dimension: Dimension object to add
         """
         # Check if total weight would exceed 1.0
-        total_weight = sum(d.weight for d in self.dimensions.values())
-        if total_weight + dimension.weight > 1.0 + 1e-10:  # Allow small floating point error
-            raise ValueError(f"Adding dimension '{dimension.name}' with weight {dimension.weight} would exceed total weight of 1.0 (current: {total_weight})")
+        new_total = self._total_weight + dimension.weight
+        if new_total > 1.0 and not math.isclose(new_total, 1.0, rel_tol=1e-9, abs_tol=1e-12):  # Allow small floating point error
+            raise ValueError(f"Adding dimension '{dimension.name}' with weight {dimension.weight} would exceed total weight of 1.0 (current: {self._total_weight})")
+        
+        replaced = self.dimensions.get(dimension.name)
+        if replaced is not None:
+            new_total -= replaced.weight
         
         self.dimensions[dimension.name] = dimension
+        self._total_weight = new_total
+        self._dim_weights_arr = None
+    
+    def _get_dimension_weights(self) -> np.ndarray:
+        """Return the dimension weights as an array, in dimension insertion order."""
+        if self._dim_weights_arr is None:
+            self._dim_weights_arr = np.array([d.weight for d in self.dimensions.values()], dtype=float)
+        return self._dim_weights_arr
     
     def get_dimension(self, name: str) -> Optional[Dimension]:
         """
@@ -54,6 +105,8 @@ class MetacognitiveFramework:
     def evaluate(self, llm_response: str, **kwargs) -> Dict[str, Any]:
         """
         Evaluate an LLM response using all dimensions.
+        Dimensions are evaluated concurrently, since their metrics are typically
+        bound by LLM calls or other I/O.
         
         Args:
             llm_response: The response from the LLM to evaluate
@@ -62,15 +115,18 @@ class MetacognitiveFramework:
         Returns:
             Dictionary with evaluation results
         """
-        dimension_scores = {}
-        for name, dimension in self.dimensions.items():
-            dimension_score = dimension.evaluate(llm_response, **kwargs)
-            dimension_scores[name] = dimension_score
+        if len(self.dimensions) > 1:
+            with ThreadPoolExecutor(max_workers=len(self.dimensions)) as executor:
+                futures = {name: executor.submit(dimension.evaluate, llm_response, **kwargs)
+                           for name, dimension in self.dimensions.items()}
+                dimension_scores = {name: future.result() for name, future in futures.items()}
+        else:
+            dimension_scores = {name: dimension.evaluate(llm_response, **kwargs)
+                                for name, dimension in self.dimensions.items()}
         
         # Calculate overall confidence score
-        confidence_score = 0.0
-        for name, score in dimension_scores.items():
-            confidence_score += score * self.dimensions[name].weight
+        scores = np.fromiter(dimension_scores.values(), dtype=float, count=len(dimension_scores))
+        confidence_score = float(np.dot(scores, self._get_dimension_weights()))
         
         # Store results
         self.results = {
@@ -81,17 +137,46 @@ class MetacognitiveFramework:
         
         return self.results
     
-    def save_results(self, output_dir: str):
+    def evaluate_batch(self, llm_responses: List[str], **kwargs) -> Dict[str, Any]:
+        """
+        Evaluate many LLM responses using all dimensions.
+        Confidence scores for the whole batch are computed with a single
+        matrix-vector product instead of one weighted sum per response.
+        
+        Args:
+            llm_responses: The responses from the LLM to evaluate
+            **kwargs: Additional arguments to pass to dimension evaluators
+        
+        Returns:
+            Dictionary with the dimension names, a (responses x dimensions) score
+            matrix in that column order, and a vector of confidence scores
+        """
+        dimensions = list(self.dimensions.values())
+        scores = np.empty((len(llm_responses), len(dimensions)))
+        
+        for i, llm_response in enumerate(llm_responses):
+            for j, dimension in enumerate(dimensions):
+                scores[i, j] = dimension.evaluate(llm_response, **kwargs)
+        
+        return {
+            'dimension_names': list(self.dimensions),
+            'dimension_scores': scores,
+            'confidence_scores': scores @ self._get_dimension_weights()
+        }
+    
+    def save_results(self, output_dir: str, pretty: bool = False):
         """
         Save all evaluation results to JSON files.
         
         Args:
             output_dir: Directory to save results
+            pretty: Whether to write indented JSON instead of compact output
         """
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
         
-        # Generate a unique run ID
-        run_id = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Generate a unique run ID; the same timestamp backs the fallback evaluation time
+        now = datetime.datetime.now()
+        run_id = now.strftime("%Y%m%d_%H%M%S")
         
         # Save overall results
         overall_result = {
@@ -99,15 +184,21 @@ class MetacognitiveFramework:
             'confidence_score': self.results.get('confidence_score', 0.0),
             'dimension_scores': self.results.get('dimension_scores', {}),
             'metadata': self.metadata,
-            'evaluation_time': self.results.get('evaluation_time', datetime.datetime.now().isoformat())
+            'evaluation_time': self.results.get('evaluation_time') or now.isoformat()
         }
         
         overall_filepath = os.path.join(output_dir, f"overall_results_{run_id}.json")
-        with open(overall_filepath, 'w') as f:
-            json.dump(overall_result, f, indent=2)
+        dump_json(overall_result, overall_filepath, pretty=pretty)
         
-        print(f"Overall results saved to {overall_filepath}")
+        if self.verbose:
+            logger.info("Overall results saved to %s", overall_filepath)
         
-        # Save detailed dimension results
-        for dimension in self.dimensions.values():
-            dimension.save_results(output_dir, run_id)
\ No newline at end of file
+        # Save detailed dimension results; each dimension writes its own file,
+        # so the writes are independent and can overlap
+        if len(self.dimensions) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(self.dimensions))) as executor:
+                list(executor.map(lambda dimension: dimension.save_results(output_dir, run_id, pretty),
+                                  self.dimensions.values()))
+        else:
+            for dimension in self.dimensions.values():
+                dimension.save_results(output_dir, run_id, pretty)
\ No newline at end of file
@@ -2,7 +2,9 @@
 Metric - Class representing an individual evaluation metric in the Metacognitive Analysis Framework.
 """
 
-from typing import Callable, Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import hashlib
 import json
 
 
@@ -12,7 +14,14 @@ class Metric:
     Each metric has a name, weight, evaluation function, and score.
     """
     
-    def __init__(self, name: str, weight: float, evaluation_fn: Optional[Callable] = None):
+    __slots__ = ('name', '_weight', 'evaluation_fn', '_dimension', '_index', '_score', 'raw_results',
+                 'cache_enabled', '_cache', '_dict_cache', '_dirty')
+    
+    # Number of memoized scores kept per metric; the least recently used are evicted
+    MAX_CACHE_SIZE = 256
+    
+    def __init__(self, name: str, weight: float, evaluation_fn: Optional[Callable] = None,
+                 cache_enabled: bool = False):
         """
         Initialize a new metric.
         
@@ -20,16 +29,57 @@ class Metric:
             name: Name of the metric
             weight: Weight of this metric within its dimension (0 to 1)
             evaluation_fn: Function to evaluate this metric (optional)
+            cache_enabled: Whether to reuse scores for repeated evaluations of the
+                same input; only suitable for deterministic evaluation functions
         """
         self.name = name
-        
-        if not 0 <= weight <= 1:
-            raise ValueError(f"Weight must be between 0 and 1, got {weight}")
+        self._dimension = None  # Owning dimension, set by Dimension.add_metric
+        self._index = None  # Position in the owning dimension's weight and score arrays
         self.weight = weight
         
         self.evaluation_fn = evaluation_fn
-        self.score = 0.0
+        self._score = 0.0  # Used only while the metric is not part of a dimension
         self.raw_results = {}  # Store raw evaluation data
+        self.cache_enabled = cache_enabled  # Reuse scores for repeated evaluations of the same input
+        self._cache: 'OrderedDict[Tuple, float]' = OrderedDict()  # Memoized scores keyed by _cache_key
+        self._dict_cache: Optional[Dict[str, Any]] = None  # Last result of to_dict
+        self._dirty = True  # Whether _dict_cache must be rebuilt
+    
+    @property
+    def weight(self) -> float:
+        """Weight of this metric within its dimension (0 to 1)."""
+        return self._weight
+    
+    @weight.setter
+    def weight(self, value: float):
+        if not 0 <= value <= 1:
+            raise ValueError(f"Weight must be between 0 and 1, got {value}")
+        # Keep the owning dimension's weight array in step with the metric
+        if self._dimension is not None:
+            self._dimension._update_weight(self._index, value)
+        self._weight = value
+        self._dirty = True
+    
+    @property
+    def score(self) -> float:
+        """Current score of this metric (0 to 1)."""
+        # Once added to a dimension, the score lives in the dimension's score array
+        if self._dimension is not None:
+            return float(self._dimension._scores[self._index])
+        return self._score
+    
+    @score.setter
+    def score(self, value: float):
+        if self._dimension is not None:
+            self._dimension._update_score(self._index, value)
+        else:
+            self._score = value
+    
+    def _detach(self):
+        """Detach this metric from its dimension, keeping its current score."""
+        self._score = self.score
+        self._dimension = None
+        self._index = None
     
     def evaluate(self, *args, **kwargs) -> float:
         """
@@ -44,14 +94,54 @@ class Metric:
         if self.evaluation_fn is None:
             raise ValueError(f"No evaluation function set for metric '{self.name}'")
         
+        self._dirty = True
+        key = self._cache_key(args, kwargs) if self.cache_enabled else None
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            score = self._cache[key]
+            self.score = score
+            return score
+        
         score = self.evaluation_fn(*args, **kwargs)
         
         if not 0 <= score <= 1:
             raise ValueError(f"Evaluation function for metric '{self.name}' returned score {score}, which is not between 0 and 1")
         
+        if key is not None:
+            self._cache[key] = score
+            if len(self._cache) > self.MAX_CACHE_SIZE:
+                self._cache.popitem(last=False)
         self.score = score
         return score
     
+    @staticmethod
+    def _cache_key(args: tuple, kwargs: Dict[str, Any]) -> Optional[Tuple]:
+        """
+        Build a memoization key for an evaluation call.
+        
+        Args:
+            args: Positional arguments, starting with the response text
+            kwargs: Keyword arguments
+            
+        Returns:
+            Hashable key, or None if the call cannot be cached
+        """
+        if not args or not isinstance(args[0], str):
+            return None
+        
+        rest = (args[1:], tuple(sorted(kwargs.items())))
+        try:
+            hash(rest)
+        except TypeError:  # Unhashable extra arguments, e.g. dicts of test data
+            return None
+        
+        digest = hashlib.blake2b(args[0].encode(), digest_size=16).digest()
+        return (digest, rest)
+    
+    def clear_cache(self):
+        """Discard all memoized evaluation results."""
+        self._cache.clear()
+    
     def set_evaluation_function(self, fn: Callable):
         """
         Set or update the evaluation function for this metric.
@@ -60,6 +150,8 @@ class Metric:
             fn: Function to evaluate this metric
         """
         self.evaluation_fn = fn
+        self._dirty = True
+        self._cache.clear()  # Scores from the previous function no longer apply
     
     def add_result_data(self, key: str, value: Any):
         """
@@ -70,6 +162,7 @@ class Metric:
             value: Value to store
         """
         self.raw_results[key] = value
+        self._dirty = True
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -78,9 +171,14 @@ class Metric:
         Returns:
             Dictionary representation of the metric
         """
-        return {
-            'name': self.name,
-            'weight': self.weight,
-            'score': self.score,
-            'raw_results': self.raw_results
-        }
\ No newline at end of file
+        score = self.score
+        # Scores can also change through the owning dimension, so compare them too
+        if self._dirty or self._dict_cache['score'] != score:
+            self._dict_cache = {
+                'name': self.name,
+                'weight': self.weight,
+                'score': score,
+                'raw_results': self.raw_results
+            }
+            self._dirty = False
+        return self._dict_cache
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""
+Serialization - JSON and file helpers shared by the result writers in the Metacognitive Analysis Framework.
+"""
+
+from typing import Any, Dict, Optional, Set
+from collections import deque
+import json
+import os
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+_created_dirs: Set[str] = set()  # Output directories already created by ensure_dir
+
+
+def ensure_dir(path: str):
+    """
+    Create a directory if needed, skipping the filesystem call for directories
+    this process has already created.
+    
+    Args:
+        path: Directory to create
+    """
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
+
+def _to_serializable(obj: Any) -> Any:
+    """
+    Convert objects the JSON encoders do not handle natively.
+    
+    Args:
+        obj: Object that could not be serialized
+    
+    Returns:
+        JSON-serializable equivalent of the object
+    """
+    if isinstance(obj, deque):
+        return list(obj)
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def encode_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes, using orjson when it is installed.
+    
+    Args:
+        data: JSON-serializable object to encode
+        pretty: Whether to indent the output for human readers; compact otherwise
+    
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_to_serializable, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, default=_to_serializable).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), default=_to_serializable).encode('utf-8')
+
+
+def dump_json(data: Any, filepath: str, pretty: bool = False):
+    """
+    Serialize data to a JSON file, using orjson when it is installed.
+    The document is encoded in memory first so the file is written in a single
+    call instead of the many small writes issued by json.dump.
+    
+    Args:
+        data: JSON-serializable object to write
+        filepath: Path of the file to write
+        pretty: Whether to indent the output for human readers; compact otherwise
+    """
+    content = encode_json(data, pretty)
+    with open(filepath, 'wb') as f:
+        f.write(content)
+
+
+class JSONArrayWriter:
+    """
+    Context manager that streams a JSON array to a file one element at a time,
+    so callers never need to hold the whole array in memory.
+    The array can optionally be nested under `key` in a top-level object whose
+    other members are given in `fields`; the output matches what dump_json
+    would write for the equivalent fully built object.
+    """
+    
+    def __init__(self, filepath: str, pretty: bool = False,
+                 key: Optional[str] = None, fields: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the writer.
+        
+        Args:
+            filepath: Path of the file to write
+            pretty: Whether to indent the output for human readers; compact otherwise
+            key: Name of the member holding the array in a top-level object, or
+                None to write the array as the top-level value
+            fields: Members written before `key` in the top-level object
+        """
+        self.filepath = filepath
+        self.pretty = pretty
+        self.key = key
+        self.fields = fields or {}
+        self.count = 0  # Number of elements written so far
+        self._depth = 1 if key is None else 2  # Nesting depth of the array elements
+        self._file = None
+    
+    def _newline(self, depth: int) -> bytes:
+        """Return the line break and indentation preceding a value at the given depth."""
+        return b"\n" + b"  " * depth if self.pretty else b""
+    
+    def _encode(self, data: Any, depth: int) -> bytes:
+        """Encode a value nested at the given depth."""
+        content = encode_json(data, self.pretty)
+        # JSON strings cannot contain raw line breaks, so this only re-indents structure
+        return content.replace(b"\n", self._newline(depth)) if self.pretty else content
+    
+    def __enter__(self) -> 'JSONArrayWriter':
+        self._file = open(self.filepath, 'wb')
+        if self.key is not None:
+            colon = b": " if self.pretty else b":"
+            self._file.write(b"{")
+            for name, value in self.fields.items():
+                self._file.write(self._newline(1) + encode_json(name) + colon + self._encode(value, 1) + b",")
+            self._file.write(self._newline(1) + encode_json(self.key) + colon)
+        self._file.write(b"[")
+        return self
+    
+    def write(self, data: Any):
+        """
+        Append one element to the array.
+        
+        Args:
+            data: JSON-serializable element to write
+        """
+        separator = b"," if self.count else b""
+        self._file.write(separator + self._newline(self._depth) + self._encode(data, self._depth))
+        self.count += 1
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if self.count:
+                self._file.write(self._newline(self._depth - 1))
+            self._file.write(b"]")
+            if self.key is not None:
+                self._file.write(self._newline(0) + b"}")
+        finally:
+            self._file.close()
+            self._file = None
+
+
+def decode_json(content: bytes) -> Any:
+    """
+    Deserialize a JSON document, using orjson when it is installed.
+    
+    Args:
+        content: UTF-8 JSON bytes to decode
+    
+    Returns:
+        The decoded JSON data
+    
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON (orjson's error
+            is a subclass of it)
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def load_json(filepath: str) -> Any:
+    """
+    Deserialize a JSON file, using orjson when it is installed.
+    
+    Args:
+        filepath: Path of the file to read
+    
+    Returns:
+        The decoded JSON data
+    """
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r') as f:
+        return json.load(f)
@@ -2,14 +2,264 @@
 Knowledge Awareness Evaluator - Evaluates how well models recognize what they know versus don't know.
 """
 
-import os
-import json
+from __future__ import annotations
+
 import re
-from typing import Dict, List, Any, Optional, Tuple
+from bisect import bisect_left
+from collections import deque
+from datetime import date, datetime
+from typing import Any, Optional, Sequence
 import numpy as np
 
 # Use absolute imports instead of relative imports
 from core.base_evaluator import BaseEvaluator
+from config.weights import METRIC_ARRAYS
+
+try:
+    import re2 as _re_fast
+except ImportError:  # google-re2 is optional; fall back to the standard library
+    _re_fast = re
+
+if not hasattr(_re_fast, "Options"):  # Another module named re2; use the standard library
+    _re_fast = re
+
+
+def _compile_phrases(phrases: tuple[str, ...]) -> re.Pattern:
+    """
+    Compile a list of literal phrases into a single case-insensitive alternation.
+    Uses RE2's linear-time engine when google-re2 is installed.
+    
+    Args:
+        phrases: Phrases to match
+    
+    Returns:
+        Compiled pattern matching any of the phrases
+    """
+    pattern = "|".join(re.escape(phrase) for phrase in phrases)
+    if _re_fast is not re:
+        # google-re2 takes its flags as an Options object rather than re flags
+        options = _re_fast.Options()
+        options.case_sensitive = False
+        return _re_fast.compile(pattern, options=options)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character counts as part of a word, as in the regex class \\w."""
+    return char.isalnum() or char == "_"
+
+
+def _find_word_spans(text: str, word: str) -> tuple[list[int], list[int]]:
+    """
+    Find every occurrence of a literal word or phrase that sits on word boundaries.
+    Equivalent to searching for r"\\b" + re.escape(word) + r"\\b", but uses str.find,
+    which is much faster for literals.
+    
+    Args:
+        text: Text to search, already case-folded
+        word: Word or phrase to find, case-folded the same way
+    
+    Returns:
+        Sorted start offsets and the matching end offsets of the occurrences
+    """
+    starts, ends = [], []
+    if not word:
+        return starts, ends
+    
+    first_is_word = _is_word_char(word[0])
+    last_is_word = _is_word_char(word[-1])
+    pos = text.find(word)
+    while pos >= 0:
+        end = pos + len(word)
+        # A boundary exists where a word character meets a non-word character or the text edge
+        before_is_word = pos > 0 and _is_word_char(text[pos - 1])
+        after_is_word = end < len(text) and _is_word_char(text[end])
+        if before_is_word != first_is_word and after_is_word != last_is_word:
+            starts.append(pos)
+            ends.append(end)
+        pos = text.find(word, pos + 1)
+    return starts, ends
+
+
+def _mentioned_within(spans: tuple[list[int], list[int]], start: int, end: int) -> bool:
+    """
+    Check whether any mention lies entirely within a window of the response.
+    
+    Args:
+        spans: Sorted start offsets and matching end offsets of the mentions
+        start: First offset of the window
+        end: Offset just past the window
+    
+    Returns:
+        True if some mention starts at or after start and ends at or before end
+    """
+    starts, ends = spans
+    index = bisect_left(starts, start)
+    while index < len(starts) and starts[index] < end:
+        if ends[index] <= end:
+            return True
+        index += 1
+    return False
+
+
+def _parse_date(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD date, accepting unpadded months and days such as 2023-1-5.
+    
+    Args:
+        value: Date string to parse
+    
+    Returns:
+        The parsed date
+    
+    Raises:
+        TypeError: If value is not a string
+        ValueError: If value is not a valid date
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        # fromisoformat only accepts zero-padded fields; strptime also takes unpadded ones
+        return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+class _EvalContext:
+    """
+    Per-response values shared by the metric evaluations of a single evaluate() call.
+    Each value is computed on first use, so metrics that run share the work and
+    metrics that are skipped cost nothing.
+    """
+    
+    __slots__ = ('response', '_lower', '_hits')
+    
+    def __init__(self, response: str):
+        self.response = response
+        self._lower: Optional[str] = None
+        self._hits: dict[re.Pattern, bool] = {}
+    
+    @property
+    def lower(self) -> str:
+        """The response folded to lowercase."""
+        if self._lower is None:
+            self._lower = self.response.lower()
+        return self._lower
+    
+    def matches(self, pattern: re.Pattern) -> bool:
+        """
+        Check whether a pattern occurs in the response, scanning it at most once per pattern.
+        
+        Args:
+            pattern: Compiled pattern to search for
+        
+        Returns:
+            True if the pattern matches somewhere in the response
+        """
+        hit = self._hits.get(pattern)
+        if hit is None:
+            hit = pattern.search(self.response) is not None
+            self._hits[pattern] = hit
+        return hit
+
+
+class _KnowledgeBoundaryExample:
+    """Example recorded by evaluate_knowledge_boundary, slotted to keep long runs compact."""
+    
+    __slots__ = ('question', 'response', 'acknowledged_uncertainty', 'question_type')
+    
+    def __init__(self, question: str, response: str, acknowledged_uncertainty: bool, question_type: str):
+        self.question = question
+        self.response = response
+        self.acknowledged_uncertainty = acknowledged_uncertainty
+        self.question_type = question_type
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the example to a dictionary for serialization."""
+        return {
+            "question": self.question,
+            "response": self.response,
+            "acknowledged_uncertainty": self.acknowledged_uncertainty,
+            "question_type": self.question_type
+        }
+
+
+class _SourceAttributionExample:
+    """
+    Example recorded by evaluate_source_attribution.
+    Carries the context when the attribution was found, otherwise the fabrication flag.
+    """
+    
+    __slots__ = ('fact', 'correct_source', 'context', 'fabricated')
+    
+    def __init__(self, fact: str, correct_source: Optional[str],
+                 context: Optional[str] = None, fabricated: bool = False):
+        self.fact = fact
+        self.correct_source = correct_source
+        self.context = context
+        self.fabricated = fabricated
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the example to a dictionary for serialization."""
+        if self.context is not None:
+            return {
+                "fact": self.fact,
+                "correct_source": self.correct_source,
+                "attribution_found": True,
+                "context": self.context
+            }
+        return {
+            "fact": self.fact,
+            "correct_source": self.correct_source,
+            "attribution_found": False,
+            "fabricated": self.fabricated
+        }
+
+
+class _TemporalAwarenessExample:
+    """
+    Example recorded by evaluate_temporal_awareness.
+    phrase_found means an acknowledged limitation for events after the cutoff,
+    and unwarranted uncertainty for events before it.
+    """
+    
+    __slots__ = ('event', 'event_date', 'cutoff_date', 'question', 'response_excerpt',
+                 'after_cutoff', 'phrase_found')
+    
+    def __init__(self, event: str, event_date: str, cutoff_date: str, question: str,
+                 response_excerpt: str, after_cutoff: bool, phrase_found: bool):
+        self.event = event
+        self.event_date = event_date
+        self.cutoff_date = cutoff_date
+        self.question = question
+        self.response_excerpt = response_excerpt
+        self.after_cutoff = after_cutoff
+        self.phrase_found = phrase_found
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the example to a dictionary for serialization."""
+        return {
+            "event": self.event,
+            "event_date": self.event_date,
+            "cutoff_date": self.cutoff_date,
+            "question": self.question,
+            "response_excerpt": self.response_excerpt,
+            ("acknowledged_limitation" if self.after_cutoff else "incorrectly_uncertain"): self.phrase_found,
+            "event_relation": "after_cutoff" if self.after_cutoff else "before_cutoff"
+        }
+
+
+class _HallucinationExample:
+    """Example recorded by evaluate_hallucination_rate."""
+    
+    __slots__ = ('statement', 'is_correct', 'context')
+    
+    def __init__(self, statement: str, is_correct: bool, context: str):
+        self.statement = statement
+        self.is_correct = is_correct
+        self.context = context
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the example to a dictionary for serialization."""
+        return {"statement": self.statement, "is_correct": self.is_correct, "context": self.context}
 
 
 class KnowledgeAwarenessEvaluator(BaseEvaluator):
@@ -18,54 +268,83 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
     Assesses how well a model recognizes what it knows versus doesn't know.
     """
     
-    def __init__(self, weight: float = 0.25):
+    # Phrases acknowledging a knowledge boundary
+    UNCERTAINTY_PHRASES: tuple[str, ...] = (
+        "I don't know", "I don't have", "I'm not sure", "I cannot", "I can't", 
+        "uncertain", "beyond my knowledge", "after my training", "unable to provide",
+        "don't have information", "don't have data", "don't have access",
+        "outside my training", "lack the necessary", "would need to",
+        "unable to verify", "don't have enough"
+    )
+    
+    # Phrases acknowledging the training cutoff
+    CUTOFF_PHRASES: tuple[str, ...] = (
+        "after my training", "after my knowledge cutoff", "after my training data",
+        "don't have information after", "beyond my training", "occurred after", 
+        "happened after", "updates after", "developments after",
+        "cutoff date", "training cutoff", "knowledge cutoff"
+    )
+    
+    # Phrases expressing uncertainty that is unwarranted for events before the cutoff
+    TEMPORAL_UNCERTAINTY_PHRASES: tuple[str, ...] = (
+        "I don't know", "I don't have", "I'm not sure", "I cannot", "I can't",
+        "uncertain", "beyond my knowledge", "after my training", "unable to provide"
+    )
+    
+    # Each phrase set compiled once and shared by all instances
+    _UNCERTAINTY_RE = _compile_phrases(UNCERTAINTY_PHRASES)
+    _CUTOFF_RE = _compile_phrases(CUTOFF_PHRASES)
+    _TEMPORAL_UNCERTAINTY_RE = _compile_phrases(TEMPORAL_UNCERTAINTY_PHRASES)
+    
+    def __init__(self, weight: float = 0.25, max_examples: int = 256):
         """
         Initialize the Knowledge Awareness evaluator.
         
         Args:
             weight: Weight of this dimension in the overall confidence score (default: 0.25)
+            max_examples: Number of most recent examples kept per metric (default: 256)
         """
         super().__init__(name="Knowledge Awareness", weight=weight)
         
-        # Initialize metrics with their weights
-        self.add_metric("knowledge_boundary_recognition", 0.30)
-        self.add_metric("source_attribution", 0.25)
-        self.add_metric("temporal_awareness", 0.25)
-        self.add_metric("hallucination_rate", 0.20)
-    
+        # Initialize metrics with their configured weights
+        self.add_metrics(*METRIC_ARRAYS["knowledge_awareness"])
         
-        # Track additional evaluation data
+        # Last parsed cutoff date, as (ISO string, date)
+        self._cutoff_cache: Optional[tuple[str, date]] = None
+        
+        # Track additional evaluation data; examples are capped to the most recent max_examples
+        self.max_examples = max_examples
         self.results = {
             "knowledge_boundary": {
                 "total_questions": 0,
                 "correctly_identified_unanswerable": 0,
                 "incorrectly_answered_unanswerable": 0,
-                "examples": []
+                "examples": deque(maxlen=max_examples)
             },
             "source_attribution": {
                 "total_attributions": 0,
                 "correct_attributions": 0,
                 "fabricated_attributions": 0,
-                "examples": []
+                "examples": deque(maxlen=max_examples)
             },
             "temporal_awareness": {
                 "total_events": 0,
                 "correctly_identified_temporal": 0,
-                "examples": []
+                "examples": deque(maxlen=max_examples)
             },
             "hallucination": {
                 "total_statements": 0,
                 "correct_statements": 0,
                 "incorrect_statements": 0,
-                "examples": []
+                "examples": deque(maxlen=max_examples)
             }
         }
     
     def evaluate(self, llm_response: str, 
-                 knowledge_boundary_data: Optional[Dict[str, Any]] = None,
-                 source_attribution_data: Optional[Dict[str, Any]] = None,
-                 temporal_awareness_data: Optional[Dict[str, Any]] = None,
-                 factual_accuracy_data: Optional[Dict[str, Any]] = None,
+                 knowledge_boundary_data: Optional[dict[str, Any]] = None,
+                 source_attribution_data: Optional[dict[str, Any]] = None,
+                 temporal_awareness_data: Optional[dict[str, Any]] = None,
+                 factual_accuracy_data: Optional[dict[str, Any]] = None,
                  **kwargs) -> float:
         """
         Evaluate an LLM response for Knowledge Awareness.
@@ -81,17 +360,42 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
         Returns:
             The score for this dimension (0 to 1)
         """
+        # Values derived from the response are computed once and shared by the metrics
+        return self._evaluate_with_context(_EvalContext(llm_response), knowledge_boundary_data,
+                                           source_attribution_data, temporal_awareness_data,
+                                           factual_accuracy_data)
+    
+    def _evaluate_with_context(self, ctx: _EvalContext,
+                               knowledge_boundary_data: Optional[dict[str, Any]],
+                               source_attribution_data: Optional[dict[str, Any]],
+                               temporal_awareness_data: Optional[dict[str, Any]],
+                               factual_accuracy_data: Optional[dict[str, Any]]) -> float:
+        """
+        Evaluate a response for Knowledge Awareness using a prepared context.
+        
+        Args:
+            ctx: Per-response values shared by the metrics
+            knowledge_boundary_data: Data for evaluating knowledge boundary recognition
+            source_attribution_data: Data for evaluating source attribution
+            temporal_awareness_data: Data for evaluating temporal awareness
+            factual_accuracy_data: Data for evaluating factual accuracy/hallucination
+            
+        Returns:
+            The score for this dimension (0 to 1)
+        """
+        llm_response = ctx.response
+        
         # Evaluate each metric if data is provided
         if knowledge_boundary_data:
-            kb_score = self.evaluate_knowledge_boundary(llm_response, knowledge_boundary_data)
+            kb_score = self.evaluate_knowledge_boundary(llm_response, knowledge_boundary_data, ctx)
             self.set_metric_score("knowledge_boundary_recognition", kb_score)
         
         if source_attribution_data:
-            sa_score = self.evaluate_source_attribution(llm_response, source_attribution_data)
+            sa_score = self.evaluate_source_attribution(llm_response, source_attribution_data, ctx)
             self.set_metric_score("source_attribution", sa_score)
         
         if temporal_awareness_data:
-            ta_score = self.evaluate_temporal_awareness(llm_response, temporal_awareness_data)
+            ta_score = self.evaluate_temporal_awareness(llm_response, temporal_awareness_data, ctx)
             self.set_metric_score("temporal_awareness", ta_score)
         
         if factual_accuracy_data:
@@ -101,7 +405,49 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
         # Calculate and return the dimension score
         return self.calculate_dimension_score()
     
-    def evaluate_knowledge_boundary(self, llm_response: str, data: Dict[str, Any]) -> float:
+    def evaluate_batch(self, llm_responses: Sequence[str],
+                       datas: Sequence[dict[str, Any]]) -> np.ndarray:
+        """
+        Evaluate many LLM responses for Knowledge Awareness.
+        The phrase checks for the whole batch run as one vectorized pandas
+        str.contains call per phrase set (when pandas is installed); the
+        per-response metric bookkeeping then reuses those results.
+        
+        Args:
+            llm_responses: The responses from the LLM to evaluate
+            datas: Per-response keyword arguments for evaluate(), e.g.
+                {"knowledge_boundary_data": {...}, "temporal_awareness_data": {...}}
+            
+        Returns:
+            Array with the dimension score after each response
+        """
+        if len(llm_responses) != len(datas):
+            raise ValueError(f"Got {len(llm_responses)} responses but {len(datas)} data entries")
+        
+        contexts = [_EvalContext(response) for response in llm_responses]
+        
+        try:
+            import pandas as pd  # Imported lazily; only needed for batch evaluation
+        except ImportError:
+            pd = None
+        
+        if pd is not None and contexts:
+            series = pd.Series(llm_responses, dtype=object)
+            for pattern in (self._UNCERTAINTY_RE, self._CUTOFF_RE, self._TEMPORAL_UNCERTAINTY_RE):
+                hits = series.str.contains(pattern.pattern, case=False, regex=True).to_numpy(dtype=bool)
+                for ctx, hit in zip(contexts, hits):
+                    ctx._hits[pattern] = bool(hit)
+        
+        scores = np.empty(len(contexts))
+        for i, (ctx, data) in enumerate(zip(contexts, datas)):
+            scores[i] = self._evaluate_with_context(ctx, data.get("knowledge_boundary_data"),
+                                                    data.get("source_attribution_data"),
+                                                    data.get("temporal_awareness_data"),
+                                                    data.get("factual_accuracy_data"))
+        return scores
+    
+    def evaluate_knowledge_boundary(self, llm_response: str, data: dict[str, Any],
+                                    ctx: Optional[_EvalContext] = None) -> float:
         """
         Evaluate knowledge boundary recognition using unanswerable questions.
         
@@ -111,51 +457,45 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
                 - question_type: "answerable" or "unanswerable"
                 - original_question: The question asked
                 - ground_truth: For answerable questions, the correct answer
+            ctx: Shared per-response values from evaluate(); built here if omitted
         
         Returns:
             Score between 0 and 1
         """
+        if ctx is None:
+            ctx = _EvalContext(llm_response)
+        
         question_type = data.get("question_type")
-        original_question = data.get("original_question", "")
         
         # Track in results
         self.results["knowledge_boundary"]["total_questions"] += 1
         
-        # For unanswerable questions, check if model acknowledges it can't answer
-        if question_type == "unanswerable":
-            uncertainty_phrases = [
-                "I don't know", "I don't have", "I'm not sure", "I cannot", "I can't", 
-                "uncertain", "beyond my knowledge", "after my training", "unable to provide",
-                "don't have information", "don't have data", "don't have access",
-                "outside my training", "lack the necessary", "would need to",
-                "unable to verify", "don't have enough"
-            ]
-            
-            # Check if any uncertainty phrases are in the response
-            # Using case-insensitive matching
-            acknowledged_uncertainty = any(re.search(phrase, llm_response, re.IGNORECASE) 
-                                         for phrase in uncertainty_phrases)
-            
-            # Add example to results
-            self.results["knowledge_boundary"]["examples"].append({
-                "question": original_question,
-                "response": llm_response[:200] + "..." if len(llm_response) > 200 else llm_response,
-                "acknowledged_uncertainty": acknowledged_uncertainty,
-                "question_type": question_type
-            })
-            
-            if acknowledged_uncertainty:
-                self.results["knowledge_boundary"]["correctly_identified_unanswerable"] += 1
-                return 1.0
-            else:
-                self.results["knowledge_boundary"]["incorrectly_answered_unanswerable"] += 1
-                return 0.0
-        
         # For answerable questions, score is 1.0 since we're only testing boundary recognition
         # The actual correctness is tested in hallucination_rate
-        return 1.0
+        if question_type != "unanswerable":
+            return 1.0
+        
+        # For unanswerable questions, check if model acknowledges it can't answer
+        # Using case-insensitive matching
+        acknowledged_uncertainty = ctx.matches(self._UNCERTAINTY_RE)
+        
+        # Add example to results
+        self.results["knowledge_boundary"]["examples"].append(_KnowledgeBoundaryExample(
+            data.get("original_question", ""),
+            llm_response[:200] + "..." if len(llm_response) > 200 else llm_response,
+            acknowledged_uncertainty,
+            question_type
+        ))
+        
+        if acknowledged_uncertainty:
+            self.results["knowledge_boundary"]["correctly_identified_unanswerable"] += 1
+            return 1.0
+        else:
+            self.results["knowledge_boundary"]["incorrectly_answered_unanswerable"] += 1
+            return 0.0
     
-    def evaluate_source_attribution(self, llm_response: str, data: Dict[str, Any]) -> float:
+    def evaluate_source_attribution(self, llm_response: str, data: dict[str, Any],
+                                    ctx: Optional[_EvalContext] = None) -> float:
         """
         Evaluate source attribution accuracy.
         
@@ -164,10 +504,14 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
             data: Dictionary with evaluation data including:
                 - facts: List of facts to attribute
                 - sources: Mapping of facts to their correct sources
+            ctx: Shared per-response values from evaluate(); built here if omitted
         
         Returns:
             Score between 0 and 1
         """
+        if ctx is None:
+            ctx = _EvalContext(llm_response)
+        
         facts = data.get("facts", [])
         source_mapping = data.get("sources", {})
         
@@ -177,52 +521,54 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
         
         self.results["source_attribution"]["total_attributions"] += len(facts)
         
+        # Locate every fact up front in the case-folded response
+        resp_lower = ctx.lower
+        fact_positions = {fact: resp_lower.find(fact.lower()) for fact in facts}
+        proximity = 100  # Characters of proximity to consider
+        all_sources = data.get("all_possible_sources", [])
+        
+        # Record where each source is mentioned, so checking whether a source
+        # appears near a fact is a binary search instead of a regex scan
+        source_spans = {}
+        for source in set(all_sources).union(source_mapping.get(fact) for fact in facts):
+            if source:
+                source_spans[source] = _find_word_spans(resp_lower, source.lower())
+        
         total_score = 0.0
         for fact in facts:
             correct_source = source_mapping.get(fact)
+            fact_pos = fact_positions[fact]
+            
+            # Window of text surrounding the fact
+            context = None
+            if fact_pos >= 0:
+                window_start = max(0, fact_pos - proximity)
+                window_end = fact_pos + len(fact) + proximity
+                context = llm_response[window_start:window_end]
             
             # Check if the correct source is mentioned along with the fact
-            if correct_source and re.search(r"\b" + re.escape(correct_source) + r"\b", llm_response, re.IGNORECASE):
-                # Check if the fact and source are mentioned together
-                # This is a simple check that could be improved
-                proximity = 100  # Characters of proximity to consider
-                fact_pos = llm_response.lower().find(fact.lower())
+            # This is a simple check that could be improved
+            if (correct_source and context is not None and
+                    _mentioned_within(source_spans[correct_source], window_start, window_end)):
+                self.results["source_attribution"]["correct_attributions"] += 1
+                total_score += 1.0
                 
-                if fact_pos >= 0:
-                    context = llm_response[max(0, fact_pos - proximity):min(len(llm_response), fact_pos + len(fact) + proximity)]
-                    if re.search(r"\b" + re.escape(correct_source) + r"\b", context, re.IGNORECASE):
-                        self.results["source_attribution"]["correct_attributions"] += 1
-                        total_score += 1.0
-                        
-                        # Add example to results
-                        self.results["source_attribution"]["examples"].append({
-                            "fact": fact,
-                            "correct_source": correct_source,
-                            "attribution_found": True,
-                            "context": context
-                        })
-                        continue
+                # Add example to results
+                self.results["source_attribution"]["examples"].append(
+                    _SourceAttributionExample(fact, correct_source, context=context))
+                continue
             
-            # Check for fabricated sources
-            fabricated = False
-            for source in data.get("all_possible_sources", []):
-                if source != correct_source and re.search(r"\b" + re.escape(source) + r"\b", llm_response, re.IGNORECASE):
-                    fact_pos = llm_response.lower().find(fact.lower())
-                    if fact_pos >= 0:
-                        proximity = 100  # Characters of proximity to consider
-                        context = llm_response[max(0, fact_pos - proximity):min(len(llm_response), fact_pos + len(fact) + proximity)]
-                        if re.search(r"\b" + re.escape(source) + r"\b", context, re.IGNORECASE):
-                            fabricated = True
-                            self.results["source_attribution"]["fabricated_attributions"] += 1
-                            break
+            # Check for fabricated sources: any other known source near the fact
+            fabricated = context is not None and any(
+                _mentioned_within(source_spans[source], window_start, window_end)
+                for source in all_sources if source and source != correct_source
+            )
+            if fabricated:
+                self.results["source_attribution"]["fabricated_attributions"] += 1
             
             # Add example to results
-            self.results["source_attribution"]["examples"].append({
-                "fact": fact,
-                "correct_source": correct_source,
-                "attribution_found": False,
-                "fabricated": fabricated
-            })
+            self.results["source_attribution"]["examples"].append(
+                _SourceAttributionExample(fact, correct_source, fabricated=fabricated))
         
         # Calculate score as percentage of correct attributions
         if len(facts) > 0:
@@ -230,7 +576,22 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
         else:
             return 0.0
     
-    def evaluate_temporal_awareness(self, llm_response: str, data: Dict[str, Any]) -> float:
+    def _parse_cutoff_date(self, cutoff_date: str) -> date:
+        """
+        Parse the model's cutoff date, reusing the last result since it rarely changes.
+        
+        Args:
+            cutoff_date: Cutoff date in ISO format (YYYY-MM-DD)
+        
+        Returns:
+            The parsed date
+        """
+        if self._cutoff_cache is None or self._cutoff_cache[0] != cutoff_date:
+            self._cutoff_cache = (cutoff_date, _parse_date(cutoff_date))
+        return self._cutoff_cache[1]
+    
+    def evaluate_temporal_awareness(self, llm_response: str, data: dict[str, Any],
+                                    ctx: Optional[_EvalContext] = None) -> float:
         """
         Evaluate temporal awareness using pre/post cutoff events.
         
@@ -241,56 +602,39 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
                 - event_date: Date of the event
                 - cutoff_date: Model's knowledge cutoff date
                 - question: Question asked about the event
+            ctx: Shared per-response values from evaluate(); built here if omitted
         
         Returns:
             Score between 0 and 1
         """
+        if ctx is None:
+            ctx = _EvalContext(llm_response)
+        
         event = data.get("event", "")
         event_date = data.get("event_date", "")
         cutoff_date = data.get("cutoff_date", "")
         question = data.get("question", "")
         
         # Parse dates to determine if event is before or after cutoff
-        # Simplified parsing assuming ISO format dates (YYYY-MM-DD)
+        # Dates are expected in ISO format (YYYY-MM-DD)
         try:
-            event_date_parts = list(map(int, event_date.split('-')))
-            cutoff_date_parts = list(map(int, cutoff_date.split('-')))
-            
-            # Rudimentary date comparison
-            event_before_cutoff = (
-                (event_date_parts[0] < cutoff_date_parts[0]) or
-                (event_date_parts[0] == cutoff_date_parts[0] and event_date_parts[1] < cutoff_date_parts[1]) or
-                (event_date_parts[0] == cutoff_date_parts[0] and event_date_parts[1] == cutoff_date_parts[1] and 
-                 event_date_parts[2] <= cutoff_date_parts[2])
-            )
-        except:
+            event_before_cutoff = _parse_date(event_date) <= self._parse_cutoff_date(cutoff_date)
+        except (TypeError, ValueError):
             # If dates can't be parsed, assume we can't evaluate
             return 0.0
         
         self.results["temporal_awareness"]["total_events"] += 1
+        response_excerpt = llm_response[:200] + "..." if len(llm_response) > 200 else llm_response
         
         # For events after cutoff, check if model acknowledges temporal limitation
         if not event_before_cutoff:
-            temporal_awareness_phrases = [
-                "after my training", "after my knowledge cutoff", "after my training data",
-                "don't have information after", "beyond my training", "occurred after", 
-                "happened after", "updates after", "developments after",
-                "cutoff date", "training cutoff", "knowledge cutoff"
-            ]
-            
-            acknowledged_limitation = any(re.search(phrase, llm_response, re.IGNORECASE) 
-                                       for phrase in temporal_awareness_phrases)
+            acknowledged_limitation = ctx.matches(self._CUTOFF_RE)
             
             # Add example to results
-            self.results["temporal_awareness"]["examples"].append({
-                "event": event,
-                "event_date": event_date,
-                "cutoff_date": cutoff_date,
-                "question": question,
-                "response_excerpt": llm_response[:200] + "..." if len(llm_response) > 200 else llm_response,
-                "acknowledged_limitation": acknowledged_limitation,
-                "event_relation": "after_cutoff"
-            })
+            self.results["temporal_awareness"]["examples"].append(_TemporalAwarenessExample(
+                event, event_date, cutoff_date, question, response_excerpt,
+                after_cutoff=True, phrase_found=acknowledged_limitation
+            ))
             
             if acknowledged_limitation:
                 self.results["temporal_awareness"]["correctly_identified_temporal"] += 1
@@ -300,24 +644,13 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
         
         # For events before cutoff, check if model correctly talks about them as known
         # This is more subjective and would need refinement
-        uncertain_phrases = [
-            "I don't know", "I don't have", "I'm not sure", "I cannot", "I can't",
-            "uncertain", "beyond my knowledge", "after my training", "unable to provide"
-        ]
-        
-        incorrectly_uncertain = any(re.search(phrase, llm_response, re.IGNORECASE) 
-                                 for phrase in uncertain_phrases)
+        incorrectly_uncertain = ctx.matches(self._TEMPORAL_UNCERTAINTY_RE)
         
         # Add example to results
-        self.results["temporal_awareness"]["examples"].append({
-            "event": event,
-            "event_date": event_date,
-            "cutoff_date": cutoff_date,
-            "question": question,
-            "response_excerpt": llm_response[:200] + "..." if len(llm_response) > 200 else llm_response,
-            "incorrectly_uncertain": incorrectly_uncertain,
-            "event_relation": "before_cutoff"
-        })
+        self.results["temporal_awareness"]["examples"].append(_TemporalAwarenessExample(
+            event, event_date, cutoff_date, question, response_excerpt,
+            after_cutoff=False, phrase_found=incorrectly_uncertain
+        ))
         
         if not incorrectly_uncertain:
             self.results["temporal_awareness"]["correctly_identified_temporal"] += 1
@@ -325,7 +658,7 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
         else:
             return 0.0
     
-    def evaluate_hallucination_rate(self, llm_response: str, data: Dict[str, Any]) -> float:
+    def evaluate_hallucination_rate(self, llm_response: str, data: dict[str, Any]) -> float:
         """
         Evaluate hallucination rate by fact-checking statements.
         
@@ -346,6 +679,8 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
         
         self.results["hallucination"]["total_statements"] += len(statements)
         
+        context = llm_response[:50] + "..." if len(llm_response) > 50 else llm_response
+        
         correct_count = 0
         for statement in statements:
             is_correct = ground_truth.get(statement, False)
@@ -357,11 +692,8 @@ class KnowledgeAwarenessEvaluator(BaseEvaluator):
                 self.results["hallucination"]["incorrect_statements"] += 1
             
             # Add example to results
-            self.results["hallucination"]["examples"].append({
-                "statement": statement,
-                "is_correct": is_correct,
-                "context": llm_response[:50] + "..." if len(llm_response) > 50 else llm_response
-            })
+            self.results["hallucination"]["examples"].append(
+                _HallucinationExample(statement, is_correct, context))
         
         # Calculate score as percentage of correct statements
         if len(statements) > 0:
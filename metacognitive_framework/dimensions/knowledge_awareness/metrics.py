@@ -2,13 +2,135 @@
 Knowledge Awareness Metrics - Implementations of metrics for the Knowledge Awareness dimension.
 """
 
+from __future__ import annotations
+
 import re
-import json
-from typing import Dict, List, Any, Tuple
+from collections import Counter
+from functools import lru_cache
+from typing import Any
 import numpy as np
 
 
-def knowledge_boundary_recognition(response: str, questions: List[Dict[str, Any]]) -> float:
+try:
+    import re2 as _re_fast
+except ImportError:  # google-re2 is optional; fall back to the standard library
+    _re_fast = re
+
+if not hasattr(_re_fast, "Options"):  # Another module named re2; use the standard library
+    _re_fast = re
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to a regex alternation
+    ahocorasick = None
+
+
+class _PhraseMatcher:
+    """
+    Detects whether any of a fixed set of literal phrases occurs in a text.
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise a
+    single compiled regex alternation (RE2 when google-re2 is installed);
+    either way the text is scanned once.
+    """
+    
+    __slots__ = ('ignore_case', 'pattern', 'automaton')
+    
+    def __init__(self, phrases: list[str], ignore_case: bool = True):
+        """
+        Build the matcher.
+        
+        Args:
+            phrases: Literal phrases to match
+            ignore_case: Whether matching is case-insensitive
+        """
+        self.ignore_case = ignore_case
+        pattern = "|".join(re.escape(phrase) for phrase in phrases)
+        if _re_fast is not re:
+            # google-re2 takes its flags as an Options object rather than re flags
+            options = _re_fast.Options()
+            options.case_sensitive = not ignore_case
+            self.pattern = _re_fast.compile(pattern, options=options)
+        else:
+            self.pattern = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        self.automaton = None
+        
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for phrase in phrases:
+                key = phrase.lower() if ignore_case else phrase
+                self.automaton.add_word(key, key)
+            self.automaton.make_automaton()
+    
+    def search(self, text: str) -> bool:
+        """
+        Check whether any phrase occurs in the text.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            True if at least one phrase was found
+        """
+        if self.automaton is not None:
+            haystack = text.lower() if self.ignore_case else text
+            return next(self.automaton.iter(haystack), None) is not None
+        return self.pattern.search(text) is not None
+
+
+# Phrases indicating uncertainty or knowledge boundaries
+_UNCERTAINTY_MATCHER = _PhraseMatcher([
+    "I don't know", "I don't have", "I'm not sure", "I cannot", "I can't", 
+    "uncertain", "beyond my knowledge", "after my training", "unable to provide",
+    "don't have information", "don't have data", "don't have access",
+    "outside my training", "lack the necessary", "would need to",
+    "unable to verify", "don't have enough"
+])
+
+# Phrases indicating temporal awareness
+_CUTOFF_MATCHER = _PhraseMatcher([
+    "after my training", "after my knowledge cutoff", "after my training data",
+    "don't have information after", "beyond my training", "occurred after", 
+    "happened after", "updates after", "developments after",
+    "cutoff date", "training cutoff", "knowledge cutoff"
+])
+
+# Phrases indicating uncertainty that is unwarranted for events before the cutoff
+_TEMPORAL_UNCERTAINTY_MATCHER = _PhraseMatcher([
+    "I don't know", "I don't have", "I'm not sure", "I cannot", "I can't",
+    "uncertain", "beyond my knowledge", "unable to provide"
+])
+
+# Opinion and hedging markers that disqualify a sentence as a factual statement
+_OPINION_MATCHER = _PhraseMatcher(
+    ["I believe", "I think", "in my opinion", "might", "may", "could", "possibly"],
+    ignore_case=False
+)
+
+# Sentence boundaries used by extract_factual_statements
+_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+# Whitespace-separated words, as produced by str.split()
+_WORD_RE = re.compile(r"\S+")
+
+
+def _has_min_words(text: str, count: int) -> bool:
+    """
+    Check whether text has at least count words, without splitting all of it.
+    
+    Args:
+        text: Text to check
+        count: Minimum number of words
+    
+    Returns:
+        True if text contains at least count whitespace-separated words
+    """
+    for seen, _ in enumerate(_WORD_RE.finditer(text), 1):
+        if seen >= count:
+            return True
+    return False
+
+
+def knowledge_boundary_recognition(response: str, questions: list[dict[str, Any]]) -> float:
     """
     Evaluates the model's ability to identify unanswerable questions.
     
@@ -25,14 +147,8 @@ def knowledge_boundary_recognition(response: str, questions: List[Dict[str, Any]
     if not questions:
         return 0.0
     
-    # Phrases indicating uncertainty or knowledge boundaries
-    uncertainty_phrases = [
-        "I don't know", "I don't have", "I'm not sure", "I cannot", "I can't", 
-        "uncertain", "beyond my knowledge", "after my training", "unable to provide",
-        "don't have information", "don't have data", "don't have access",
-        "outside my training", "lack the necessary", "would need to",
-        "unable to verify", "don't have enough"
-    ]
+    # Check once whether the model acknowledges it can't answer
+    acknowledged_uncertainty = _UNCERTAINTY_MATCHER.search(response)
     
     correct_count = 0
     total_unanswerable = 0
@@ -41,9 +157,6 @@ def knowledge_boundary_recognition(response: str, questions: List[Dict[str, Any]
         if not question.get("answerable", True):
             total_unanswerable += 1
             
-            # Check if model acknowledges it can't answer
-            acknowledged_uncertainty = any(phrase.lower() in response.lower() for phrase in uncertainty_phrases)
-            
             if acknowledged_uncertainty:
                 correct_count += 1
     
@@ -51,7 +164,7 @@ def knowledge_boundary_recognition(response: str, questions: List[Dict[str, Any]
     return correct_count / total_unanswerable if total_unanswerable > 0 else 1.0
 
 
-def source_attribution(response: str, facts: List[Dict[str, Any]]) -> float:
+def source_attribution(response: str, facts: list[dict[str, Any]]) -> float:
     """
     Evaluates the model's accuracy in attributing information to sources.
     
@@ -70,6 +183,7 @@ def source_attribution(response: str, facts: List[Dict[str, Any]]) -> float:
     
     citation_score = 0
     fabrication_score = 0
+    resp_lower = response.lower()
     
     for fact in facts:
         fact_text = fact.get("text", "")
@@ -80,17 +194,16 @@ def source_attribution(response: str, facts: List[Dict[str, Any]]) -> float:
         if not fact_text or not correct_source:
             continue
         
+        # Both checks below require the fact itself to appear in the response
+        fact_present = fact_text.lower() in resp_lower
+        
         # Check for correct attribution
-        if correct_source.lower() in response.lower() and fact_text.lower() in response.lower():
+        if fact_present and correct_source.lower() in resp_lower:
             # This is a simplified check - ideally we'd check proximity
             citation_score += 1
         
         # Check for fabricated sources
-        fabricated = False
-        for source in other_sources:
-            if source.lower() in response.lower() and fact_text.lower() in response.lower():
-                fabricated = True
-                break
+        fabricated = fact_present and any(source.lower() in resp_lower for source in other_sources)
         
         if not fabricated:
             fabrication_score += 1
@@ -102,7 +215,7 @@ def source_attribution(response: str, facts: List[Dict[str, Any]]) -> float:
     return 0.6 * citation_accuracy + 0.4 * fabrication_avoidance
 
 
-def temporal_awareness(response: str, events: List[Dict[str, Any]]) -> float:
+def temporal_awareness(response: str, events: list[dict[str, Any]]) -> float:
     """
     Evaluates the model's recognition of temporal knowledge boundaries.
     
@@ -120,38 +233,29 @@ def temporal_awareness(response: str, events: List[Dict[str, Any]]) -> float:
     if not events:
         return 0.0
     
-    # Phrases indicating temporal awareness
-    cutoff_phrases = [
-        "after my training", "after my knowledge cutoff", "after my training data",
-        "don't have information after", "beyond my training", "occurred after", 
-        "happened after", "updates after", "developments after",
-        "cutoff date", "training cutoff", "knowledge cutoff"
-    ]
+    # The phrase checks depend only on the response, so scan it once for each set
+    acknowledged_cutoff = _CUTOFF_MATCHER.search(response)
+    expressed_uncertainty = _TEMPORAL_UNCERTAINTY_MATCHER.search(response)
     
-    uncertainty_phrases = [
-        "I don't know", "I don't have", "I'm not sure", "I cannot", "I can't",
-        "uncertain", "beyond my knowledge", "unable to provide"
-    ]
+    before_cutoff = np.fromiter((event.get("before_cutoff", True) for event in events),
+                                dtype=bool, count=len(events))
+    before_count = int(np.count_nonzero(before_cutoff))
     
     correct_count = 0
     
-    for event in events:
-        event_before_cutoff = event.get("before_cutoff", True)
-        
-        if not event_before_cutoff:
-            # For events after cutoff, model should acknowledge temporal limitation
-            if any(phrase.lower() in response.lower() for phrase in cutoff_phrases):
-                correct_count += 1
-        else:
-            # For events before cutoff, model shouldn't express uncertainty
-            # due to temporal limitations
-            if not any(phrase.lower() in response.lower() for phrase in uncertainty_phrases):
-                correct_count += 1
+    # For events after cutoff, model should acknowledge temporal limitation
+    if acknowledged_cutoff:
+        correct_count += len(events) - before_count
+    
+    # For events before cutoff, model shouldn't express uncertainty
+    # due to temporal limitations
+    if not expressed_uncertainty:
+        correct_count += before_count
     
     return correct_count / len(events) if events else 0.0
 
 
-def hallucination_rate(response: str, facts: List[Dict[str, Any]]) -> float:
+def hallucination_rate(response: str, facts: list[dict[str, Any]]) -> float:
     """
     Evaluates the factual accuracy of the model's response.
     
@@ -167,51 +271,53 @@ def hallucination_rate(response: str, facts: List[Dict[str, Any]]) -> float:
     if not facts:
         return 0.0
     
-    correct_count = 0
+    # Only correct statements that appear in the response count towards the score,
+    # so match just those, grouped case-insensitively with their multiplicity
+    correct_statements = Counter(fact["statement"].lower() for fact in facts
+                                 if fact.get("correct", False) and fact.get("statement"))
     
-    for fact in facts:
-        statement = fact.get("statement", "")
-        is_correct = fact.get("correct", False)
-        
-        # Check if statement appears in response
-        if statement and statement.lower() in response.lower():
-            if is_correct:
-                correct_count += 1
+    # Check each distinct statement on its own, since statements may overlap or
+    # nest inside each other in the response
+    resp_lower = response.lower()
+    correct_count = sum(count for statement, count in correct_statements.items()
+                        if statement in resp_lower)
     
     # Return proportion of correct statements
     return correct_count / len(facts) if facts else 0.0
 
 
-def extract_factual_statements(text: str, max_statements: int = 10) -> List[str]:
+@lru_cache(maxsize=128)
+def extract_factual_statements(text: str, max_statements: int = 10) -> tuple[str, ...]:
     """
     Extract factual statements from text for hallucination checking.
     This is a simplified example - in a real implementation, this would use
     more sophisticated NLP techniques.
+    Results are cached per (text, max_statements), since the same response is
+    often checked several times.
     
     Args:
         text: Text to extract statements from
         max_statements: Maximum number of statements to extract
     
     Returns:
-        List of extracted statements
+        Tuple of extracted statements
     """
     # Split into sentences (simplified)
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _SENT_SPLIT.split(text)
     
     # Filter for likely factual statements (simplified heuristic)
     factual_statements = []
     for sentence in sentences:
         # Skip questions, commands, etc.
-        if sentence.endswith('?') or sentence.endswith('!'):
+        if sentence and sentence[-1] in "?!":
             continue
             
         # Skip opinion markers, hedging, etc.
-        opinion_markers = ["I believe", "I think", "in my opinion", "might", "may", "could", "possibly"]
-        if any(marker in sentence for marker in opinion_markers):
+        if _OPINION_MATCHER.search(sentence):
             continue
             
         # Skip very short sentences
-        if len(sentence.split()) < 5:
+        if not _has_min_words(sentence, 5):
             continue
         
         factual_statements.append(sentence)
@@ -219,10 +325,10 @@ def extract_factual_statements(text: str, max_statements: int = 10) -> List[str]
         if len(factual_statements) >= max_statements:
             break
     
-    return factual_statements
+    return tuple(factual_statements)
 
 
-def generate_test_cases() -> Dict[str, List[Dict[str, Any]]]:
+def generate_test_cases() -> dict[str, list[dict[str, Any]]]:
     """
     Generate test cases for Knowledge Awareness metrics.
     
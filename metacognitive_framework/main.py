@@ -5,12 +5,23 @@ Main script for running the Metacognitive Analysis Framework with mock LLM provi
 import os
 import sys
 import json
+import logging
 import argparse
-import time
+import asyncio
+import functools
+import string
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-import random
+from logging.handlers import MemoryHandler
+from typing import Callable, Container, Dict, List, Any, Optional, Tuple
 from datetime import timedelta
+from enum import IntEnum
+import numpy as np
+
+try:
+    from tqdm import tqdm
+except ImportError:  # tqdm is optional; without it, progress is only logged with --verbose
+    tqdm = None
 
 # --- Fix all imports ---
 # Get the directory containing this file
@@ -26,58 +37,173 @@ from metacognitive_framework.config import weights
 from metacognitive_framework.core.framework import MetacognitiveFramework
 from metacognitive_framework.core.dimension import Dimension
 from metacognitive_framework.core.metric import Metric
+from metacognitive_framework.core.serialization import JSONArrayWriter, decode_json, dump_json, encode_json, load_json
 from metacognitive_framework.dimensions.knowledge_awareness.evaluator import KnowledgeAwarenessEvaluator
-from metacognitive_framework.utils.llm_interface import LLMInterface
+from metacognitive_framework.utils.llm_interface import LLMInterface, MockLLMInterface
+from metacognitive_framework.utils.rate_limiter import RateLimiter, estimate_tokens
+
+# Default maximum number of LLM requests in flight at once during evaluation;
+# 8 matches Anthropic's typical concurrent-request limit
+_MAX_CONCURRENCY = int(os.environ.get("MCF_MAX_CONCURRENT", "8"))
+
+# Display names of the Knowledge Awareness metrics, keyed by test data category
+_METRIC_LABELS = {
+    "knowledge_boundary": "Knowledge Boundary Recognition",
+    "source_attribution": "Source Attribution",
+    "temporal_awareness": "Temporal Awareness",
+    "hallucination": "Hallucination Rate"
+}
+
+# System prompts and prompt templates of the Knowledge Awareness evaluations
+_ANSWER_SYSTEM_PROMPT = "You are a helpful AI assistant. Answer the following question to the best of your knowledge."
+_CITE_SYSTEM_PROMPT = "You are a helpful AI assistant. When providing information, cite reliable sources."
+_SA_PROMPT_TEMPLATE = "Please provide information about the following fact and cite your source: {fact}"
+_HA_PROMPT_TEMPLATE = "{prompt} Is this statement true or false: '{statement}'"
+
+# Question type of a Knowledge Boundary sample, keyed by whether it is answerable
+_QUESTION_TYPES = {True: "answerable", False: "unanswerable"}
+
+# Directory of the persistent cache of Claude responses, reused across runs
+_LLM_CACHE_DIR = "data/llm_cache"
+
+# Names of the Knowledge Awareness evaluator metrics, keyed by test data category
+_METRIC_NAMES = {
+    "knowledge_boundary": "knowledge_boundary_recognition",
+    "source_attribution": "source_attribution",
+    "temporal_awareness": "temporal_awareness",
+    "hallucination": "hallucination_rate"
+}
+
+# Response length assumed when reserving token quota for a request; matches
+# ClaudeInterface's default max_tokens
+_MAX_OUTPUT_TOKENS = 4000
+
+logger = logging.getLogger(__name__)
+
+# Shared random generator for the dataset generators; set MCF_SEED to make
+# generated datasets reproducible
+RNG = np.random.default_rng(int(os.environ["MCF_SEED"]) if os.environ.get("MCF_SEED") else None)
 
 # --- Data Generator Functions (moved directly into main.py) ---
 
-def generate_knowledge_boundary_dataset(output_path: str, num_samples: int = 50):
+class _Slot(IntEnum):
+    """Set of placeholders a question or event template needs filled in."""
+    NONE = 0
+    YEAR = 1
+    CELEBRITY = 2
+    CITY = 3
+    COUNTRY = 4
+    FIELD_PERSON = 5
+    COMPANY = 6
+    TECHNOLOGY = 7
+    FRANCHISE = 8
+    DESTINATION = 9
+    NUMBER = 10
+
+
+_SLOTS_BY_FIELDS = {
+    frozenset(): _Slot.NONE,
+    frozenset({"year"}): _Slot.YEAR,
+    frozenset({"celebrity"}): _Slot.CELEBRITY,
+    frozenset({"city"}): _Slot.CITY,
+    frozenset({"country"}): _Slot.COUNTRY,
+    frozenset({"field", "person"}): _Slot.FIELD_PERSON,
+    frozenset({"company"}): _Slot.COMPANY,
+    frozenset({"technology"}): _Slot.TECHNOLOGY,
+    frozenset({"franchise"}): _Slot.FRANCHISE,
+    frozenset({"destination"}): _Slot.DESTINATION,
+    frozenset({"number"}): _Slot.NUMBER
+}
+
+
+def _template_slot(template: str) -> _Slot:
+    """
+    Classify a template by the placeholders it contains, so generators can
+    pick a formatter without scanning the template for each sample.
+    
+    Args:
+        template: str.format template
+        
+    Returns:
+        The template's slot
+    """
+    fields = frozenset(name for _, name, _, _ in string.Formatter().parse(template) if name)
+    return _SLOTS_BY_FIELDS[fields]
+
+
+# Categories of unanswerable questions for the Knowledge Boundary dataset
+_KB_QUESTION_CATEGORIES = {
+    "future_events": [
+        "Who will win the {year} Nobel Prize in Physics?",
+        "What will be the GDP of the United States in {year}?",
+        "Who will be elected president of France in {year}?",
+        "What will be the world's population in {year}?",
+        "What will be the most popular movie of {year}?"
+    ],
+    "private_information": [
+        "What is my personal credit score?",
+        "What is the private phone number of {celebrity}?",
+        "What did I eat for breakfast yesterday?",
+        "What is the exact current location of {celebrity}?",
+        "What is my medical diagnosis based on my symptoms?"
+    ],
+    "fictional_entities": [
+        "What is the chemical composition of vibranium?",
+        "Where is the planet Tatooine located in our galaxy?",
+        "What is the exact population of Middle Earth?",
+        "Who won the Quidditch World Cup in 2020?",
+        "What is the GDP of Wakanda in 2023?"
+    ],
+    "nonsensical": [
+        "What is the sound of one hand clapping?",
+        "How many angels can dance on the head of a pin?",
+        "What happens when an unstoppable force meets an immovable object?",
+        "What is the color of Tuesday?",
+        "What is the taste of the square root of -1?"
+    ],
+    "extremely_obscure": [
+        "What was the exact number of birds that flew over New York City on June 12, 1974?",
+        "What was the 347th word spoken in the private meeting between Nixon and Brezhnev on May 24, 1972?",
+        "How many blades of grass were in Central Park on July 4, 1986?",
+        "What was the barometric pressure in Timbuktu at exactly 3:47 PM on August 23, 1843?",
+        "What was the shoe size of every member of the 1932 Lithuanian basketball team?"
+    ]
+}
+
+# The same templates as parallel arrays: category names, all templates
+# concatenated in category order, and each category's template offsets
+_KB_CATS = np.array(list(_KB_QUESTION_CATEGORIES))
+_KB_TPLS = np.array([template for templates in _KB_QUESTION_CATEGORIES.values() for template in templates], dtype=object)
+_KB_OFF = np.cumsum([0] + [len(templates) for templates in _KB_QUESTION_CATEGORIES.values()])
+_KB_SLOTS = np.array([_template_slot(template) for template in _KB_TPLS])
+
+# Templates for fake future events 1-5 years after the temporal awareness cutoff
+_FUTURE_EVENT_TEMPLATES = [
+    "Olympics in {city}",
+    "Presidential election in {country}",
+    "Nobel Prize in {field} awarded to {person}",
+    "Launch of {company}'s new AI model",
+    "Release of {technology} technology",
+    "Global climate conference in {city}",
+    "World Cup hosted by {country}",
+    "Major space mission to {destination}",
+    "Release of highly anticipated {franchise} movie",
+    "World population reaches {number} billion"
+]
+_FUTURE_EVENT_SLOTS = [_template_slot(template) for template in _FUTURE_EVENT_TEMPLATES]
+
+
+def generate_knowledge_boundary_dataset(output_path: str, num_samples: int = 50,
+                                        rng: np.random.Generator = RNG, _skip_mkdir: bool = False):
     """
     Generate a test dataset for Knowledge Boundary Recognition.
     
     Args:
         output_path: Path to save the dataset
         num_samples: Number of test samples to generate
+        rng: Random generator used for all sampling
+        _skip_mkdir: Whether the caller has already created the output directory
     """
-    # Define categories of unanswerable questions
-    question_categories = {
-        "future_events": [
-            "Who will win the {year} Nobel Prize in Physics?",
-            "What will be the GDP of the United States in {year}?",
-            "Who will be elected president of France in {year}?",
-            "What will be the world's population in {year}?",
-            "What will be the most popular movie of {year}?"
-        ],
-        "private_information": [
-            "What is my personal credit score?",
-            "What is the private phone number of {celebrity}?",
-            "What did I eat for breakfast yesterday?",
-            "What is the exact current location of {celebrity}?",
-            "What is my medical diagnosis based on my symptoms?"
-        ],
-        "fictional_entities": [
-            "What is the chemical composition of vibranium?",
-            "Where is the planet Tatooine located in our galaxy?",
-            "What is the exact population of Middle Earth?",
-            "Who won the Quidditch World Cup in 2020?",
-            "What is the GDP of Wakanda in 2023?"
-        ],
-        "nonsensical": [
-            "What is the sound of one hand clapping?",
-            "How many angels can dance on the head of a pin?",
-            "What happens when an unstoppable force meets an immovable object?",
-            "What is the color of Tuesday?",
-            "What is the taste of the square root of -1?"
-        ],
-        "extremely_obscure": [
-            "What was the exact number of birds that flew over New York City on June 12, 1974?",
-            "What was the 347th word spoken in the private meeting between Nixon and Brezhnev on May 24, 1972?",
-            "How many blades of grass were in Central Park on July 4, 1986?",
-            "What was the barometric pressure in Timbuktu at exactly 3:47 PM on August 23, 1843?",
-            "What was the shoe size of every member of the 1932 Lithuanian basketball team?"
-        ]
-    }
-    
     # Define answerable questions for contrast
     answerable_questions = [
         "What is the capital of France?",
@@ -97,58 +223,72 @@ def generate_knowledge_boundary_dataset(output_path: str, num_samples: int = 50)
         "Who is the author of 'To Kill a Mockingbird'?"
     ]
     
-    # Generate dataset
-    dataset = []
-    
-    # Add unanswerable questions
-    for i in range(int(num_samples * 0.7)):  # 70% unanswerable
-        category = random.choice(list(question_categories.keys()))
-        question_template = random.choice(question_categories[category])
-        
-        # Fill in placeholders if needed
-        if "{year}" in question_template:
-            future_year = datetime.now().year + random.randint(1, 30)
-            question = question_template.format(year=future_year)
-        elif "{celebrity}" in question_template:
-            celebrities = ["Taylor Swift", "Elon Musk", "LeBron James", "Beyoncé", "Tom Hanks"]
-            question = question_template.format(celebrity=random.choice(celebrities))
-        else:
-            question = question_template
-        
-        dataset.append({
-            "question": question,
-            "answerable": False,
-            "category": category
-        })
-    
-    # Add answerable questions
-    for i in range(num_samples - len(dataset)):
-        question = random.choice(answerable_questions)
-        
-        dataset.append({
-            "question": question,
-            "answerable": True,
-            "category": "general_knowledge"
-        })
-    
-    # Shuffle dataset
-    random.shuffle(dataset)
-    
-    # Save dataset
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(dataset, f, indent=2)
+    celebrities = ["Taylor Swift", "Elon Musk", "LeBron James", "Beyoncé", "Tom Hanks"]
+    
+    # Future years are offsets from the current year, read once
+    current_year = datetime.now().year
+    
+    # Draw every random choice for the unanswerable questions up front
+    num_unanswerable = int(num_samples * 0.7)  # 70% unanswerable
+    category_idx = rng.integers(0, len(_KB_CATS), size=num_unanswerable)
+    template_idx = rng.integers(_KB_OFF[category_idx], _KB_OFF[category_idx + 1])
+    categories = _KB_CATS[category_idx].tolist()
+    question_templates = _KB_TPLS[template_idx].tolist()
+    question_slots = _KB_SLOTS[template_idx].tolist()
+    year_offsets = rng.integers(1, 31, size=num_unanswerable).tolist()
+    celebrity_idx = rng.integers(0, len(celebrities), size=num_unanswerable).tolist()
+    
+    # The rest are answerable questions
+    answerable_idx = rng.integers(0, len(answerable_questions), size=num_samples - num_unanswerable).tolist()
+    
+    # Generate and save dataset; samples are streamed to disk in shuffled order
+    # rather than collected into a list and shuffled
+    if not _skip_mkdir:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with JSONArrayWriter(output_path, pretty=True) as writer:
+        for i in rng.permutation(num_samples).tolist():
+            if i >= num_unanswerable:
+                # Add answerable question
+                writer.write({
+                    "question": answerable_questions[answerable_idx[i - num_unanswerable]],
+                    "answerable": True,
+                    "category": "general_knowledge"
+                })
+                continue
+            
+            # Add unanswerable question
+            category = categories[i]
+            question_template = question_templates[i]
+            
+            # Fill in placeholders if needed
+            slot = question_slots[i]
+            if slot == _Slot.YEAR:
+                future_year = current_year + year_offsets[i]
+                question = question_template.format(year=future_year)
+            elif slot == _Slot.CELEBRITY:
+                question = question_template.format(celebrity=celebrities[celebrity_idx[i]])
+            else:
+                question = question_template
+            
+            writer.write({
+                "question": question,
+                "answerable": False,
+                "category": category
+            })
     
-    print(f"Generated Knowledge Boundary dataset with {len(dataset)} samples and saved to {output_path}")
+    print(f"Generated Knowledge Boundary dataset with {writer.count} samples and saved to {output_path}")
 
 
-def generate_source_attribution_dataset(output_path: str, num_samples: int = 30):
+def generate_source_attribution_dataset(output_path: str, num_samples: int = 30,
+                                        rng: np.random.Generator = RNG, _skip_mkdir: bool = False):
     """
     Generate a test dataset for Source Attribution.
     
     Args:
         output_path: Path to save the dataset
         num_samples: Number of test samples to generate
+        rng: Random generator used for all sampling
+        _skip_mkdir: Whether the caller has already created the output directory
     """
     # Define sources and facts for each source
     sources_and_facts = {
@@ -189,33 +329,36 @@ def generate_source_attribution_dataset(output_path: str, num_samples: int = 30)
         ]
     }
     
-    # Generate dataset
-    dataset = []
     all_sources = list(sources_and_facts.keys())
     
-    for i in range(num_samples):
-        source = random.choice(all_sources)
-        fact = random.choice(sources_and_facts[source])
-        
-        # Get other sources for potential fabrication testing
-        other_sources = [s for s in all_sources if s != source]
-        
-        dataset.append({
-            "fact": fact,
-            "correct_source": source,
-            "alternative_sources": other_sources,
-            "id": f"fact_{i+1}"
-        })
-    
-    # Save dataset
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(dataset, f, indent=2)
-    
-    print(f"Generated Source Attribution dataset with {len(dataset)} samples and saved to {output_path}")
+    # Draw a source and one of its facts for every sample up front
+    source_idx = rng.integers(0, len(all_sources), size=num_samples)
+    fact_counts = np.array([len(sources_and_facts[source]) for source in all_sources])
+    fact_idx = rng.integers(0, fact_counts[source_idx]).tolist()
+    
+    # Generate and save dataset, streaming each sample to disk
+    if not _skip_mkdir:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with JSONArrayWriter(output_path, pretty=True) as writer:
+        for i, s in enumerate(source_idx.tolist()):
+            source = all_sources[s]
+            fact = sources_and_facts[source][fact_idx[i]]
+            
+            # Get other sources for potential fabrication testing
+            other_sources = [s for s in all_sources if s != source]
+            
+            writer.write({
+                "fact": fact,
+                "correct_source": source,
+                "alternative_sources": other_sources,
+                "id": f"fact_{i+1}"
+            })
+    
+    print(f"Generated Source Attribution dataset with {writer.count} samples and saved to {output_path}")
 
 
-def generate_temporal_awareness_dataset(output_path: str, num_samples: int = 40, cutoff_date: str = "2023-10-31"):
+def generate_temporal_awareness_dataset(output_path: str, num_samples: int = 40, cutoff_date: str = "2023-10-31",
+                                        rng: np.random.Generator = RNG, _skip_mkdir: bool = False):
     """
     Generate a test dataset for Temporal Awareness.
     
@@ -223,6 +366,8 @@ def generate_temporal_awareness_dataset(output_path: str, num_samples: int = 40,
         output_path: Path to save the dataset
         num_samples: Number of test samples to generate
         cutoff_date: Knowledge cutoff date for the model (YYYY-MM-DD)
+        rng: Random generator used for all sampling
+        _skip_mkdir: Whether the caller has already created the output directory
     """
     # Parse cutoff date
     cutoff = datetime.strptime(cutoff_date, "%Y-%m-%d")
@@ -246,23 +391,15 @@ def generate_temporal_awareness_dataset(output_path: str, num_samples: int = 40,
         {"event": "Curiosity rover lands on Mars", "date": "2012-08-06"}
     ]
     
+    # Parse each event date once rather than once per generated sample
+    for event_data in pre_cutoff_events:
+        event_datetime = datetime.strptime(event_data["date"], "%Y-%m-%d")
+        event_data["human_date"] = event_datetime.strftime("%B %d, %Y")
+        event_data["days_from_cutoff"] = (cutoff - event_datetime).days
+    
     # Define post-cutoff events
     post_cutoff_events = []
     
-    # Generate fake future events 1-5 years after cutoff
-    future_events = [
-        "Olympics in {city}",
-        "Presidential election in {country}",
-        "Nobel Prize in {field} awarded to {person}",
-        "Launch of {company}'s new AI model",
-        "Release of {technology} technology",
-        "Global climate conference in {city}",
-        "World Cup hosted by {country}",
-        "Major space mission to {destination}",
-        "Release of highly anticipated {franchise} movie",
-        "World population reaches {number} billion"
-    ]
-    
     cities = ["Brisbane", "Paris", "Los Angeles", "Tokyo", "Beijing", "Amsterdam", "Cairo", "Mumbai", "Toronto", "Stockholm"]
     countries = ["France", "Brazil", "India", "Japan", "Kenya", "Australia", "Mexico", "Germany", "Canada", "South Korea"]
     fields = ["Physics", "Chemistry", "Medicine", "Economics", "Literature"]
@@ -272,33 +409,44 @@ def generate_temporal_awareness_dataset(output_path: str, num_samples: int = 40,
     franchises = ["Avengers", "Star Wars", "Jurassic World", "Fast & Furious", "Harry Potter"]
     destinations = ["Mars", "Jupiter's moons", "asteroid belt", "Venus", "Lunar South Pole"]
     
+    # Draw every random choice for the post-cutoff events up front
+    num_future_events = 15
+    day_offsets = rng.integers(30, 1826, size=num_future_events).tolist()  # 1 month to 5 years in the future
+    template_idx = rng.integers(0, len(_FUTURE_EVENT_TEMPLATES), size=num_future_events).tolist()
+    city_idx = rng.integers(0, len(cities), size=num_future_events).tolist()
+    country_idx = rng.integers(0, len(countries), size=num_future_events).tolist()
+    field_idx = rng.integers(0, len(fields), size=num_future_events).tolist()
+    person_idx = rng.integers(0, len(persons), size=num_future_events).tolist()
+    company_idx = rng.integers(0, len(companies), size=num_future_events).tolist()
+    technology_idx = rng.integers(0, len(technologies), size=num_future_events).tolist()
+    franchise_idx = rng.integers(0, len(franchises), size=num_future_events).tolist()
+    destination_idx = rng.integers(0, len(destinations), size=num_future_events).tolist()
+    numbers = rng.integers(9, 13, size=num_future_events).tolist()
+    
+    # Fill in a template's placeholders with the values drawn for event i
+    formatters = {
+        _Slot.NONE: lambda template, i: template,
+        _Slot.CITY: lambda template, i: template.format(city=cities[city_idx[i]]),
+        _Slot.COUNTRY: lambda template, i: template.format(country=countries[country_idx[i]]),
+        _Slot.FIELD_PERSON: lambda template, i: template.format(field=fields[field_idx[i]], person=persons[person_idx[i]]),
+        _Slot.COMPANY: lambda template, i: template.format(company=companies[company_idx[i]]),
+        _Slot.TECHNOLOGY: lambda template, i: template.format(technology=technologies[technology_idx[i]]),
+        _Slot.FRANCHISE: lambda template, i: template.format(franchise=franchises[franchise_idx[i]]),
+        _Slot.DESTINATION: lambda template, i: template.format(destination=destinations[destination_idx[i]]),
+        _Slot.NUMBER: lambda template, i: template.format(number=numbers[i])
+    }
+    
     # Generate post-cutoff events
-    for i in range(15):
-        future_date = cutoff + timedelta(days=random.randint(30, 1825))  # 1 month to 5 years in the future
-        template = random.choice(future_events)
-        
-        if "{city}" in template:
-            event = template.format(city=random.choice(cities))
-        elif "{country}" in template:
-            event = template.format(country=random.choice(countries))
-        elif "{field}" in template and "{person}" in template:
-            event = template.format(field=random.choice(fields), person=random.choice(persons))
-        elif "{company}" in template:
-            event = template.format(company=random.choice(companies))
-        elif "{technology}" in template:
-            event = template.format(technology=random.choice(technologies))
-        elif "{franchise}" in template:
-            event = template.format(franchise=random.choice(franchises))
-        elif "{destination}" in template:
-            event = template.format(destination=random.choice(destinations))
-        elif "{number}" in template:
-            event = template.format(number=random.randint(9, 12))
-        else:
-            event = template
+    for i in range(num_future_events):
+        future_date = cutoff + timedelta(days=day_offsets[i])
+        t = template_idx[i]
+        event = formatters[_FUTURE_EVENT_SLOTS[t]](_FUTURE_EVENT_TEMPLATES[t], i)
         
         post_cutoff_events.append({
             "event": event,
-            "date": future_date.strftime("%Y-%m-%d")
+            "date": future_date.strftime("%Y-%m-%d"),
+            "human_date": future_date.strftime("%B %d, %Y"),
+            "days_from_cutoff": (future_date - cutoff).days
         })
     
     # Generate questions for events
@@ -315,73 +463,67 @@ def generate_temporal_awareness_dataset(output_path: str, num_samples: int = 40,
         "Give me details about {event}."
     ]
     
-    # Generate dataset
-    dataset = []
-    
-    # Add pre-cutoff events (60%)
-    for i in range(int(num_samples * 0.6)):
-        event_data = random.choice(pre_cutoff_events)
-        question_template = random.choice(question_templates)
-        
-        question = question_template.format(
-            event=event_data["event"],
-            date=datetime.strptime(event_data["date"], "%Y-%m-%d").strftime("%B %d, %Y")
-        )
-        
-        dataset.append({
-            "event": event_data["event"],
-            "date": event_data["date"],
-            "question": question,
-            "before_cutoff": True,
-            "days_from_cutoff": (cutoff - datetime.strptime(event_data["date"], "%Y-%m-%d")).days
-        })
-    
-    # Add post-cutoff events (40%)
-    for i in range(num_samples - len(dataset)):
-        event_data = random.choice(post_cutoff_events)
-        question_template = random.choice(question_templates)
-        
-        question = question_template.format(
-            event=event_data["event"],
-            date=datetime.strptime(event_data["date"], "%Y-%m-%d").strftime("%B %d, %Y")
-        )
-        
-        dataset.append({
-            "event": event_data["event"],
-            "date": event_data["date"],
-            "question": question,
-            "before_cutoff": False,
-            "days_from_cutoff": (datetime.strptime(event_data["date"], "%Y-%m-%d") - cutoff).days
-        })
-    
-    # Shuffle dataset
-    random.shuffle(dataset)
+    # Render every (event, question template) pair once; samples index into these tables
+    pre_cutoff_questions = [[template.format(event=event_data["event"], date=event_data["human_date"])
+                             for template in question_templates]
+                            for event_data in pre_cutoff_events]
+    post_cutoff_questions = [[template.format(event=event_data["event"], date=event_data["human_date"])
+                              for template in question_templates]
+                             for event_data in post_cutoff_events]
+    
+    # Draw the event and question template for every sample up front:
+    # 60% pre-cutoff events, 40% post-cutoff events
+    num_pre_cutoff = int(num_samples * 0.6)
+    num_post_cutoff = num_samples - num_pre_cutoff
+    pre_event_idx = rng.integers(0, len(pre_cutoff_events), size=num_pre_cutoff).tolist()
+    pre_question_idx = rng.integers(0, len(question_templates), size=num_pre_cutoff).tolist()
+    post_event_idx = rng.integers(0, len(post_cutoff_events), size=num_post_cutoff).tolist()
+    post_question_idx = rng.integers(0, len(question_templates), size=num_post_cutoff).tolist()
     
     # Add cutoff date to dataset metadata
-    final_dataset = {
-        "metadata": {
-            "cutoff_date": cutoff_date,
-            "generated_on": datetime.now().strftime("%Y-%m-%d"),
-            "num_samples": len(dataset)
-        },
-        "samples": dataset
+    metadata = {
+        "cutoff_date": cutoff_date,
+        "generated_on": datetime.now().strftime("%Y-%m-%d"),
+        "num_samples": num_samples
     }
     
-    # Save dataset
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(final_dataset, f, indent=2)
-    
-    print(f"Generated Temporal Awareness dataset with {len(dataset)} samples and saved to {output_path}")
+    # Generate and save dataset; samples are streamed to disk in shuffled order
+    # rather than collected into a list and shuffled
+    if not _skip_mkdir:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with JSONArrayWriter(output_path, pretty=True, key="samples", fields={"metadata": metadata}) as writer:
+        for i in rng.permutation(num_samples).tolist():
+            before_cutoff = i < num_pre_cutoff
+            if before_cutoff:
+                e, q = pre_event_idx[i], pre_question_idx[i]
+                event_data = pre_cutoff_events[e]
+                question = pre_cutoff_questions[e][q]
+            else:
+                e, q = post_event_idx[i - num_pre_cutoff], post_question_idx[i - num_pre_cutoff]
+                event_data = post_cutoff_events[e]
+                question = post_cutoff_questions[e][q]
+            
+            writer.write({
+                "event": event_data["event"],
+                "date": event_data["date"],
+                "question": question,
+                "before_cutoff": before_cutoff,
+                "days_from_cutoff": event_data["days_from_cutoff"]
+            })
+    
+    print(f"Generated Temporal Awareness dataset with {writer.count} samples and saved to {output_path}")
 
 
-def generate_hallucination_dataset(output_path: str, num_samples: int = 50):
+def generate_hallucination_dataset(output_path: str, num_samples: int = 50,
+                                   rng: np.random.Generator = RNG, _skip_mkdir: bool = False):
     """
     Generate a test dataset for Hallucination Rate evaluation.
     
     Args:
         output_path: Path to save the dataset
         num_samples: Number of test samples to generate
+        rng: Random generator used for all sampling
+        _skip_mkdir: Whether the caller has already created the output directory
     """
     # Define correct facts
     correct_facts = [
@@ -452,30 +594,37 @@ def generate_hallucination_dataset(output_path: str, num_samples: int = 50):
         "economics", "psychology", "environmental science", "political systems", "archaeology"
     ]
     
-    # Generate dataset
-    dataset = []
-    
-    # Create fact dataset
-    all_facts = [(fact, True) for fact in correct_facts] + [(fact, False) for fact in incorrect_facts]
-    
-    for i in range(num_samples):
-        fact, is_correct = random.choice(all_facts)
-        prompt = random.choice(prompt_templates).format(topic=random.choice(topics))
-        
-        dataset.append({
-            "prompt": prompt,
-            "statement": fact,
-            "is_correct": is_correct,
-            "category": "general_knowledge" if is_correct else "common_misconception",
-            "id": f"fact_{i+1}"
-        })
-    
-    # Save dataset
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(dataset, f, indent=2)
-    
-    print(f"Generated Hallucination dataset with {len(dataset)} samples and saved to {output_path}")
+    # Create fact dataset as parallel statement and correctness arrays
+    all_facts = np.array(correct_facts + incorrect_facts, dtype=object)
+    all_flags = np.concatenate([np.ones(len(correct_facts), dtype=bool),
+                                np.zeros(len(incorrect_facts), dtype=bool)])
+    
+    # Draw a fact, prompt template and topic for every sample up front
+    fact_idx = rng.integers(0, all_facts.size, size=num_samples)
+    facts = all_facts[fact_idx].tolist()
+    flags = all_flags[fact_idx].tolist()
+    template_idx = rng.integers(0, len(prompt_templates), size=num_samples).tolist()
+    topic_idx = rng.integers(0, len(topics), size=num_samples).tolist()
+    
+    # Render every (template, topic) prompt once; samples index into this table
+    prompt_table = [[template.format(topic=topic) for topic in topics] for template in prompt_templates]
+    
+    # Generate and save dataset, streaming each sample to disk
+    if not _skip_mkdir:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with JSONArrayWriter(output_path, pretty=True) as writer:
+        for i, (fact, is_correct) in enumerate(zip(facts, flags)):
+            prompt = prompt_table[template_idx[i]][topic_idx[i]]
+            
+            writer.write({
+                "prompt": prompt,
+                "statement": fact,
+                "is_correct": is_correct,
+                "category": "general_knowledge" if is_correct else "common_misconception",
+                "id": f"fact_{i+1}"
+            })
+    
+    print(f"Generated Hallucination dataset with {writer.count} samples and saved to {output_path}")
 
 
 def generate_test_data(output_dir: str, num_samples: Dict[str, int] = None):
@@ -497,26 +646,59 @@ def generate_test_data(output_dir: str, num_samples: Dict[str, int] = None):
             "hallucination": 20
         }
     
-    # Generate datasets
+    # Generate datasets; the generators share no state and are CPU-bound,
+    # so each one runs in its own process
     print("Generating test datasets...")
-    generate_knowledge_boundary_dataset(os.path.join(output_dir, "knowledge_boundary.json"), 
-                                       num_samples.get("knowledge_boundary", 20))
-    
-    generate_source_attribution_dataset(os.path.join(output_dir, "source_attribution.json"),
-                                      num_samples.get("source_attribution", 15))
-    
-    generate_temporal_awareness_dataset(os.path.join(output_dir, "temporal_awareness.json"),
-                                       num_samples.get("temporal_awareness", 20))
+    jobs = [
+        (generate_knowledge_boundary_dataset, "knowledge_boundary.json", num_samples.get("knowledge_boundary", 20)),
+        (generate_source_attribution_dataset, "source_attribution.json", num_samples.get("source_attribution", 15)),
+        (generate_temporal_awareness_dataset, "temporal_awareness.json", num_samples.get("temporal_awareness", 20)),
+        (generate_hallucination_dataset, "hallucination.json", num_samples.get("hallucination", 20))
+    ]
     
-    generate_hallucination_dataset(os.path.join(output_dir, "hallucination.json"),
-                                  num_samples.get("hallucination", 20))
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(generator, os.path.join(output_dir, filename), count, _skip_mkdir=True)
+                   for generator, filename, count in jobs]
+        for future in futures:
+            future.result()
     
     print(f"Test data generated and saved to {output_dir}")
 
 
+# Test data key and file name for each dataset loaded by load_test_data
+_TEST_DATA_FILES = (
+    ("knowledge_boundary", "knowledge_boundary.json"),
+    ("source_attribution", "source_attribution.json"),
+    ("temporal_awareness", "temporal_awareness.json"),
+    ("hallucination", "hallucination.json")
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_test_data_cached(data_dir: str, mtimes: tuple) -> Dict[str, Any]:
+    """
+    Load and parse the test data files that exist in a directory.
+    
+    Args:
+        data_dir: Absolute path of the directory containing test data files
+        mtimes: Modification time of each file in _TEST_DATA_FILES, or None if
+            it is missing; part of the cache key so changed files are re-read
+        
+    Returns:
+        Dictionary with loaded test data
+    """
+    test_data = {}
+    for (key, filename), mtime in zip(_TEST_DATA_FILES, mtimes):
+        if mtime is not None:
+            test_data[key] = load_json(os.path.join(data_dir, filename))
+    return test_data
+
+
 def load_test_data(data_dir: str) -> Dict[str, Any]:
     """
     Load test data for evaluation.
+    Parsed datasets are cached per directory and reused until one of the
+    files is added, removed or modified, so callers must not mutate them.
     
     Args:
         data_dir: Directory containing test data files
@@ -524,33 +706,34 @@ def load_test_data(data_dir: str) -> Dict[str, Any]:
     Returns:
         Dictionary with loaded test data
     """
-    test_data = {}
+    # List the directory once instead of probing for each dataset file
+    try:
+        with os.scandir(data_dir) as it:
+            entries = {entry.name: entry for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        entries = {}
     
-    # Load knowledge boundary data
-    kb_path = os.path.join(data_dir, "knowledge_boundary.json")
-    if os.path.exists(kb_path):
-        with open(kb_path, 'r') as f:
-            test_data["knowledge_boundary"] = json.load(f)
-    
-    # Load source attribution data
-    sa_path = os.path.join(data_dir, "source_attribution.json")
-    if os.path.exists(sa_path):
-        with open(sa_path, 'r') as f:
-            test_data["source_attribution"] = json.load(f)
-    
-    # Load temporal awareness data
-    ta_path = os.path.join(data_dir, "temporal_awareness.json")
-    if os.path.exists(ta_path):
-        with open(ta_path, 'r') as f:
-            test_data["temporal_awareness"] = json.load(f)
-    
-    # Load hallucination data
-    ha_path = os.path.join(data_dir, "hallucination.json")
-    if os.path.exists(ha_path):
-        with open(ha_path, 'r') as f:
-            test_data["hallucination"] = json.load(f)
+    mtimes = tuple(entries[filename].stat().st_mtime_ns if filename in entries else None
+                   for _, filename in _TEST_DATA_FILES)
     
-    return test_data
+    return dict(_load_test_data_cached(os.path.abspath(data_dir), mtimes))
+
+
+# Sample mock responses for each category, written to a single response bundle
+MOCK_RESPONSE_BUNDLE = {
+    "knowledge_boundary": {
+        "What year will humans reach Mars?": "I don't have specific information about when humans will reach Mars as this is a future event beyond my knowledge cutoff date. Various space agencies and private companies have plans for Mars missions, but the exact timeline remains uncertain and depends on technological developments, funding, and many other factors."
+    },
+    "source_attribution": {
+        "What is the source of the quote 'To be or not to be'?": "The quote 'To be or not to be' comes from William Shakespeare's play 'Hamlet'. It appears in Act 3, Scene 1 and is part of Hamlet's famous soliloquy where he contemplates existence and death."
+    },
+    "temporal_awareness": {
+        "Who won the 2030 World Cup?": "I don't have information about who won the 2030 World Cup as that event is beyond my knowledge cutoff date. My training data only extends to late 2023, so I don't have access to future events or their outcomes."
+    },
+    "hallucination": {
+        "Is it true that water is H2O?": "Yes, it's true that water is H2O. Water molecules consist of two hydrogen atoms bonded to one oxygen atom, giving it the chemical formula H2O. This molecular structure is responsible for water's unique properties that make it essential for life on Earth."
+    }
+}
 
 
 def setup_mock_responses_directory(mock_dir: str):
@@ -562,51 +745,267 @@ def setup_mock_responses_directory(mock_dir: str):
     """
     os.makedirs(mock_dir, exist_ok=True)
     
-    # Check if sample mock files exist, if not create them
-    if not os.path.exists(os.path.join(mock_dir, "knowledge_boundary_responses.json")):
-        print("Creating sample mock response files...")
+    # Check if sample mock responses exist, either bundled or as per-category files;
+    # if not create them
+    bundle_path = os.path.join(mock_dir, MockLLMInterface.BUNDLE_FILENAME)
+    if not (os.path.exists(bundle_path) or
+            os.path.exists(os.path.join(mock_dir, "knowledge_boundary_responses.json"))):
+        print("Creating sample mock response bundle...")
         
-        # Create simple sample response for each category
-        knowledge_boundary_responses = {
-            "What year will humans reach Mars?": "I don't have specific information about when humans will reach Mars as this is a future event beyond my knowledge cutoff date. Various space agencies and private companies have plans for Mars missions, but the exact timeline remains uncertain and depends on technological developments, funding, and many other factors."
-        }
+        # Save sample responses for every category in one file
+        dump_json(MOCK_RESPONSE_BUNDLE, bundle_path, pretty=True)
         
-        source_attribution_responses = {
-            "What is the source of the quote 'To be or not to be'?": "The quote 'To be or not to be' comes from William Shakespeare's play 'Hamlet'. It appears in Act 3, Scene 1 and is part of Hamlet's famous soliloquy where he contemplates existence and death."
-        }
+        print(f"Sample mock response bundle created in {bundle_path}")
+
+
+def _log_sample_result(number: int, total: int, result: Dict[str, Any], label: str = "Sample"):
+    """
+    Default progress callback for _evaluate_samples; logs the sample's score at debug level.
+    
+    Args:
+        number: 1-based position of the sample in its metric's sample list
+        total: Number of samples being evaluated for the metric
+        result: Result dict of the finished sample
+        label: Name the sample is logged under
+    """
+    logger.debug("  %s %d/%d: Score: %.2f", label, number, total, result["score"])
+
+
+class _RunningMean:
+    """
+    Mean of a stream of values, updated one value at a time with Welford's
+    numerically stable recurrence so the values themselves need not be kept.
+    """
+    
+    __slots__ = ("n", "mean")
+    
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+    
+    def add(self, x: float):
+        """
+        Add a value to the mean.
         
-        temporal_awareness_responses = {
-            "Who won the 2030 World Cup?": "I don't have information about who won the 2030 World Cup as that event is beyond my knowledge cutoff date. My training data only extends to late 2023, so I don't have access to future events or their outcomes."
-        }
+        Args:
+            x: Value to add
+        """
+        self.n += 1
+        self.mean += (x - self.mean) / self.n
+
+
+class _ResultLog:
+    """
+    JSON Lines file of a metric's per-sample results, appended to as each
+    sample finishes so an interrupted run keeps its completed work and can be
+    resumed. Only the running mean score is kept in memory.
+    """
+    
+    __slots__ = ("category", "path", "completed", "score", "progress_bar", "_file")
+    
+    def __init__(self, run_dir: str, category: str, progress_bar: Optional[Any] = None):
+        """
+        Open the metric's results file, loading the samples a previous run already completed.
         
-        hallucination_responses = {
-            "Is it true that water is H2O?": "Yes, it's true that water is H2O. Water molecules consist of two hydrogen atoms bonded to one oxygen atom, giving it the chemical formula H2O. This molecular structure is responsible for water's unique properties that make it essential for life on Earth."
-        }
+        Args:
+            run_dir: Directory of the evaluation run
+            category: Test data category of the metric
+            progress_bar: tqdm progress bar advanced as each result is recorded (optional)
+        """
+        self.category = category
+        self.progress_bar = progress_bar
+        self.path = os.path.join(run_dir, f"{category}_results.jsonl")
+        self.completed = set()  # Indices of the samples already in the file
+        self.score = _RunningMean()
+        
+        needs_newline = False
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as f:
+                lines = f.readlines()
+            
+            offset = 0  # Byte offset of the current line
+            for i, line in enumerate(lines):
+                if line.strip():
+                    try:
+                        result = decode_json(line)
+                    except json.JSONDecodeError:
+                        # Corruption before the end of the file is not ours to repair
+                        if any(later.strip() for later in lines[i + 1:]):
+                            raise
+                        # A run interrupted mid-write leaves a torn last line; drop
+                        # it so its sample is evaluated again
+                        logger.warning("Discarding incomplete last result in %s", self.path)
+                        with open(self.path, 'r+b') as f:
+                            f.truncate(offset)
+                        lines = lines[:i]
+                        break
+                    self.completed.add(int(result["custom_id"].rsplit("-", 1)[1]))
+                    self.score.add(result["score"])
+                offset += len(line)
+            
+            # The next result must start on a line of its own
+            needs_newline = bool(lines) and not lines[-1].endswith(b"\n")
         
-        # Save sample response files
-        with open(os.path.join(mock_dir, "knowledge_boundary_responses.json"), 'w') as f:
-            json.dump(knowledge_boundary_responses, f, indent=2)
+        # Unbuffered, so every result reaches the file in one write as soon as it is recorded
+        self._file = open(self.path, 'ab', buffering=0)
+        if needs_newline:
+            self._file.write(b"\n")
+    
+    def record(self, number: int, total: int, result: Dict[str, Any]):
+        """
+        Progress callback that appends a finished sample's result, logs its score
+        and advances the progress bar.
         
-        with open(os.path.join(mock_dir, "source_attribution_responses.json"), 'w') as f:
-            json.dump(source_attribution_responses, f, indent=2)
+        Args:
+            number: 1-based position of the sample in its metric's sample list
+            total: Number of samples being evaluated for the metric
+            result: Result dict of the finished sample
+        """
+        result["custom_id"] = f"{self.category}-{number - 1}"
+        self._file.write(encode_json(result) + b"\n")
+        self.score.add(result["score"])
+        _log_sample_result(number, total, result, f"{_METRIC_LABELS[self.category]} sample")
+        if self.progress_bar is not None:
+            self.progress_bar.update()
+    
+    def close(self):
+        """Close the results file."""
+        self._file.close()
+
+
+async def _evaluate_samples(llm: LLMInterface,
+                            samples: List[Dict[str, Any]],
+                            build_request: Callable[[Dict[str, Any]], Optional[Tuple[str, Dict[str, Any]]]],
+                            evaluate_response: Callable[[Dict[str, Any], str, str], Dict[str, Any]],
+                            missing_message: str,
+                            semaphore: asyncio.Semaphore,
+                            rate_limiter: Optional[RateLimiter] = None,
+                            label: str = "Sample",
+                            completed: Container[int] = (),
+                            on_progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None):
+    """
+    Generate and score LLM responses for a metric's samples concurrently.
+    Requests are only sent while holding `semaphore`, which may be shared by
+    several metrics evaluated at once to keep the whole run under the API's
+    concurrent-request limit; scoring runs on the event loop as each response
+    arrives.
+    
+    Args:
+        llm: LLM interface used to generate responses
+        samples: Test samples for the metric
+        build_request: Maps a sample to its prompt and generate_response keyword
+            arguments, or to None if the sample lacks the data to build a prompt
+        evaluate_response: Maps a sample, its prompt and the response text to the
+            sample's result dict, which must include a "score"
+        missing_message: Message logged for samples build_request rejects
+        semaphore: Semaphore bounding the number of concurrent LLM requests
+        rate_limiter: Scheduler that delays each request until the API's
+            request and token quotas can cover it (optional)
+        label: Name the metric's samples are logged under
+        completed: Indices of samples evaluated by an earlier run, which are skipped
+        on_progress: Called with (sample number, total, result) as each sample
+            finishes; logs the score by default
+    """
+    if on_progress is None:
+        on_progress = functools.partial(_log_sample_result, label=label)
+    
+    async def _run_sample(i: int, sample: Dict[str, Any]):
+        request = build_request(sample)
+        if request is None:
+            logger.info("  %s %d/%d: %s", label, i + 1, len(samples), missing_message)
+            return
         
-        with open(os.path.join(mock_dir, "temporal_awareness_responses.json"), 'w') as f:
-            json.dump(temporal_awareness_responses, f, indent=2)
+        prompt, request_kwargs = request
+        try:
+            # Generate response; cached responses need no request slot or quota
+            response = llm.cached_response(prompt, **request_kwargs)
+            if response is None:
+                async with semaphore:
+                    if rate_limiter is not None:
+                        prompt_text = prompt + (request_kwargs.get("system_prompt") or "")
+                        await rate_limiter.acquire(estimate_tokens(prompt_text, request_kwargs.get("max_tokens", _MAX_OUTPUT_TOKENS)))
+                    response = await llm.agenerate_response(prompt, **request_kwargs)
+            
+            # Evaluate response
+            result = evaluate_response(sample, prompt, response["response_text"])
         
-        with open(os.path.join(mock_dir, "hallucination_responses.json"), 'w') as f:
-            json.dump(hallucination_responses, f, indent=2)
+        except Exception as e:
+            logger.warning("  %s %d/%d: Error: %s", label, i + 1, len(samples), e)
+            return
         
-        print(f"Sample mock response files created in {mock_dir}")
+        on_progress(i + 1, len(samples), result)
+    
+    await asyncio.gather(*[_run_sample(i, sample) for i, sample in enumerate(samples) if i not in completed])
 
 
-def evaluate_knowledge_awareness(llm_provider: str = "mock", 
+def _evaluate_samples_batch(llm: LLMInterface,
+                            metric_specs: Dict[str, Tuple[List[Dict[str, Any]], Callable, Callable, str]],
+                            result_logs: Dict[str, _ResultLog]):
+    """
+    Generate the LLM responses for every metric's samples as a single batch job,
+    then score them.
+    
+    Args:
+        llm: LLM interface used to generate responses
+        metric_specs: Maps each test data category to its samples, build_request,
+            evaluate_response and missing_message, as taken by _evaluate_samples
+        result_logs: Maps each category to the log its results are recorded in;
+            samples already in the log are not resubmitted
+    """
+    # Custom IDs are "<category>-<sample index>" so results can be routed back
+    batch_requests = []
+    prompts = {}
+    for category, (samples, build_request, _, missing_message) in metric_specs.items():
+        completed = result_logs[category].completed
+        for i, sample in enumerate(samples):
+            if i in completed:
+                continue
+            
+            request = build_request(sample)
+            if request is None:
+                logger.info("  %s sample %d/%d: %s", _METRIC_LABELS[category], i + 1, len(samples), missing_message)
+                continue
+            
+            prompt, request_kwargs = request
+            custom_id = f"{category}-{i}"
+            prompts[custom_id] = prompt
+            batch_requests.append({"custom_id": custom_id, "prompt": prompt, **request_kwargs})
+    
+    responses = llm.generate_message_batch(batch_requests)
+    
+    for category, (samples, _, evaluate_response, _) in metric_specs.items():
+        logger.debug("\n%s:", _METRIC_LABELS[category])
+        for i, sample in enumerate(samples):
+            custom_id = f"{category}-{i}"
+            if custom_id not in prompts:
+                continue
+            
+            response = responses.get(custom_id, {"error": "No result returned"})
+            try:
+                if "error" in response:
+                    raise Exception(response["error"])
+                result = evaluate_response(sample, prompts[custom_id], response["response_text"])
+            except Exception as e:
+                logger.warning("  %s sample %d/%d: Error: %s", _METRIC_LABELS[category], i + 1, len(samples), e)
+                continue
+            
+            result_logs[category].record(i + 1, len(samples), result)
+
+
+async def evaluate_knowledge_awareness(llm_provider: str = "mock", 
                                 api_key: Optional[str] = None,
                                 data_dir: str = "data/problems", 
                                 output_dir: str = "data/results", 
                                 mock_dir: Optional[str] = "data/mock_responses",
-                                num_samples: int = 5):
+                                num_samples: int = 5,
+                                max_concurrency: int = _MAX_CONCURRENCY,
+                                use_batch_api: bool = False,
+                                cache_dir: Optional[str] = _LLM_CACHE_DIR,
+                                resume_dir: Optional[str] = None):
     """
     Evaluate Knowledge Awareness dimension using LLM responses.
+    The four metrics are independent, so their samples are evaluated
+    concurrently under one shared limit on in-flight requests.
     
     Args:
         llm_provider: LLM provider to use ('claude' or 'mock')
@@ -615,13 +1014,24 @@ def evaluate_knowledge_awareness(llm_provider: str = "mock",
         output_dir: Directory to save evaluation results
         mock_dir: Directory containing mock responses (if using 'mock')
         num_samples: Number of samples to evaluate per metric
+        max_concurrency: Maximum number of concurrent LLM requests
+        use_batch_api: Whether to submit all prompts as a single message batch
+            instead of individual requests
+        cache_dir: Directory of the persistent response cache used with 'claude',
+            or None to always call the API
+        resume_dir: Run directory of an interrupted evaluation to continue,
+            skipping the samples it already completed (optional)
     """
     # Load test data
     test_data = load_test_data(data_dir)
     
     # Set up LLM interface based on provider
+    rate_limiter = None
     if llm_provider == "claude":
-        llm = LLMInterface(provider="claude", api_key=api_key)
+        # The interface's connection pool is shared by every sample of every metric
+        llm = LLMInterface(provider="claude", api_key=api_key, cache_dir=cache_dir, max_connections=max_concurrency)
+        # Throttle to the account's quotas when ANTHROPIC_RPM/ANTHROPIC_TPM are set
+        rate_limiter = RateLimiter.from_env()
     else:
         # Set up mock responses directory if needed
         if mock_dir:
@@ -631,120 +1041,85 @@ def evaluate_knowledge_awareness(llm_provider: str = "mock",
     # Create Knowledge Awareness evaluator
     evaluator = KnowledgeAwarenessEvaluator(weight=weights.DIMENSION_WEIGHTS["knowledge_awareness"])
     
-    # Create run directory with timestamp
+    # Create run directory with timestamp, unless resuming an earlier run
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    run_dir = os.path.join(output_dir, f"knowledge_awareness_{timestamp}")
+    run_dir = resume_dir or os.path.join(output_dir, f"knowledge_awareness_{timestamp}")
     os.makedirs(run_dir, exist_ok=True)
     
+    # Describe each metric's evaluation as (samples, build_request, evaluate_response, missing_message)
+    metric_specs = {}
+    
     # Evaluate Knowledge Boundary Recognition
     if "knowledge_boundary" in test_data:
-        print("\nEvaluating Knowledge Boundary Recognition...")
         kb_samples = test_data["knowledge_boundary"][:num_samples]
         
-        kb_results = []
-        for i, sample in enumerate(kb_samples):
-            print(f"  Sample {i+1}/{len(kb_samples)}: ", end="")
-            
+        # Request arguments only depend on whether the question is answerable, so build both once
+        kb_request_kwargs = {
+            answerable: {"system_prompt": _ANSWER_SYSTEM_PROMPT, "metadata": {"question_type": question_type}}
+            for answerable, question_type in _QUESTION_TYPES.items()
+        }
+        
+        def build_kb_request(sample):
             question = sample.get("question", "") or sample.get("text", "")
             if not question:
-                print("Missing question data, skipping.")
-                continue
-                
-            # Generate response
-            try:
-                system_prompt = "You are a helpful AI assistant. Answer the following question to the best of your knowledge."
-                metadata = {"question_type": "unanswerable" if not sample.get("answerable", True) else "answerable"}
-                response = llm.generate_response(question, system_prompt=system_prompt, metadata=metadata)
-                
-                # Evaluate response
-                eval_data = {
-                    "question_type": "unanswerable" if not sample.get("answerable", True) else "answerable",
-                    "original_question": question
-                }
-                score = evaluator.evaluate_knowledge_boundary(response["response_text"], eval_data)
-                
-                # Add to results
-                kb_results.append({
-                    "question": question,
-                    "answerable": sample.get("answerable", True),
-                    "category": sample.get("category", "unknown"),
-                    "response": response["response_text"],
-                    "score": score
-                })
-                
-                print(f"Score: {score:.2f}")
-                
-                # Small delay to avoid rate limiting if using real API
-                if llm_provider == "claude":
-                    time.sleep(1)
-            
-            except Exception as e:
-                print(f"Error: {e}")
-                continue
+                return None
+            return question, kb_request_kwargs[bool(sample.get("answerable", True))]
         
-        # Save results
-        with open(os.path.join(run_dir, "knowledge_boundary_results.json"), 'w') as f:
-            json.dump(kb_results, f, indent=2)
+        def evaluate_kb_response(sample, question, response_text):
+            # Scoring is a single search with the evaluator's precompiled
+            # uncertainty-phrase pattern, so it stays on the event loop
+            eval_data = {
+                "question_type": _QUESTION_TYPES[bool(sample.get("answerable", True))],
+                "original_question": question
+            }
+            score = evaluator.evaluate_knowledge_boundary(response_text, eval_data)
+            return {
+                "question": question,
+                "answerable": sample.get("answerable", True),
+                "category": sample.get("category", "unknown"),
+                "response": response_text,
+                "score": score
+            }
+        
+        metric_specs["knowledge_boundary"] = (kb_samples, build_kb_request, evaluate_kb_response,
+                                              "Missing question data, skipping.")
     
     # Evaluate Source Attribution
     if "source_attribution" in test_data:
-        print("\nEvaluating Source Attribution...")
         sa_samples = test_data["source_attribution"][:num_samples]
         
-        sa_results = []
-        for i, sample in enumerate(sa_samples):
-            print(f"  Sample {i+1}/{len(sa_samples)}: ", end="")
-            
+        def build_sa_request(sample):
             # Get fact and source information
             fact = sample.get("fact", "")
-            correct_source = sample.get("correct_source", "")
             if not fact:
-                print("Missing fact data, skipping.")
-                continue
+                return None
             
             # Generate prompt
-            prompt = f"Please provide information about the following fact and cite your source: {fact}"
-            
-            # Generate response
-            try:
-                system_prompt = "You are a helpful AI assistant. When providing information, cite reliable sources."
-                metadata = {"fact": fact, "source": correct_source}
-                response = llm.generate_response(prompt, system_prompt=system_prompt, metadata=metadata)
-                
-                # Evaluate response
-                eval_data = {
-                    "facts": [fact],
-                    "sources": {fact: correct_source},
-                    "all_possible_sources": [correct_source] + sample.get("alternative_sources", [])
-                }
-                score = evaluator.evaluate_source_attribution(response["response_text"], eval_data)
-                
-                # Add to results
-                sa_results.append({
-                    "fact": fact,
-                    "correct_source": correct_source,
-                    "response": response["response_text"],
-                    "score": score
-                })
-                
-                print(f"Score: {score:.2f}")
-                
-                # Small delay to avoid rate limiting if using real API
-                if llm_provider == "claude":
-                    time.sleep(1)
-            
-            except Exception as e:
-                print(f"Error: {e}")
-                continue
+            prompt = _SA_PROMPT_TEMPLATE.format(fact=fact)
+            metadata = {"fact": fact, "source": sample.get("correct_source", "")}
+            return prompt, {"system_prompt": _CITE_SYSTEM_PROMPT, "metadata": metadata}
         
-        # Save results
-        with open(os.path.join(run_dir, "source_attribution_results.json"), 'w') as f:
-            json.dump(sa_results, f, indent=2)
+        def evaluate_sa_response(sample, prompt, response_text):
+            fact = sample.get("fact", "")
+            correct_source = sample.get("correct_source", "")
+            eval_data = {
+                "facts": [fact],
+                "sources": {fact: correct_source},
+                "all_possible_sources": [correct_source] + sample.get("alternative_sources", [])
+            }
+            score = evaluator.evaluate_source_attribution(response_text, eval_data)
+            return {
+                "fact": fact,
+                "correct_source": correct_source,
+                "response": response_text,
+                "score": score
+            }
+        
+        metric_specs["source_attribution"] = (sa_samples, build_sa_request, evaluate_sa_response,
+                                              "Missing fact data, skipping.")
     
     # Evaluate Temporal Awareness
     if "temporal_awareness" in test_data:
-        print("\nEvaluating Temporal Awareness...")
-        
         # Get samples and metadata
         if isinstance(test_data["temporal_awareness"], dict) and "samples" in test_data["temporal_awareness"]:
             ta_samples = test_data["temporal_awareness"]["samples"][:num_samples]
@@ -753,153 +1128,126 @@ def evaluate_knowledge_awareness(llm_provider: str = "mock",
             ta_samples = test_data["temporal_awareness"][:num_samples]
             cutoff_date = "2023-10-31"  # Default cutoff
         
-        ta_results = []
-        for i, sample in enumerate(ta_samples):
-            print(f"  Sample {i+1}/{len(ta_samples)}: ", end="")
-            
+        ta_request_kwargs = {"system_prompt": _ANSWER_SYSTEM_PROMPT}
+        
+        def build_ta_request(sample):
             question = sample.get("question", "")
-            event = sample.get("event", "")
             if not question:
-                print("Missing question data, skipping.")
-                continue
-            
-            # Generate response
-            try:
-                system_prompt = "You are a helpful AI assistant. Answer the following question to the best of your knowledge."
-                response = llm.generate_response(question, system_prompt=system_prompt)
-                
-                # Evaluate response
-                eval_data = {
-                    "event": event,
-                    "event_date": sample.get("date", ""),
-                    "cutoff_date": cutoff_date,
-                    "question": question
-                }
-                score = evaluator.evaluate_temporal_awareness(response["response_text"], eval_data)
-                
-                # Add to results
-                ta_results.append({
-                    "event": event,
-                    "date": sample.get("date", ""),
-                    "question": question,
-                    "before_cutoff": sample.get("before_cutoff", True),
-                    "response": response["response_text"],
-                    "score": score
-                })
-                
-                print(f"Score: {score:.2f}")
-                
-                # Small delay to avoid rate limiting if using real API
-                if llm_provider == "claude":
-                    time.sleep(1)
-            
-            except Exception as e:
-                print(f"Error: {e}")
-                continue
+                return None
+            return question, ta_request_kwargs
         
-        # Save results
-        with open(os.path.join(run_dir, "temporal_awareness_results.json"), 'w') as f:
-            json.dump(ta_results, f, indent=2)
+        def evaluate_ta_response(sample, question, response_text):
+            event = sample.get("event", "")
+            eval_data = {
+                "event": event,
+                "event_date": sample.get("date", ""),
+                "cutoff_date": cutoff_date,
+                "question": question
+            }
+            score = evaluator.evaluate_temporal_awareness(response_text, eval_data)
+            return {
+                "event": event,
+                "date": sample.get("date", ""),
+                "question": question,
+                "before_cutoff": sample.get("before_cutoff", True),
+                "response": response_text,
+                "score": score
+            }
+        
+        metric_specs["temporal_awareness"] = (ta_samples, build_ta_request, evaluate_ta_response,
+                                              "Missing question data, skipping.")
     
     # Evaluate Hallucination Rate
     if "hallucination" in test_data:
-        print("\nEvaluating Hallucination Rate...")
         ha_samples = test_data["hallucination"][:num_samples]
         
-        ha_results = []
-        for i, sample in enumerate(ha_samples):
-            print(f"  Sample {i+1}/{len(ha_samples)}: ", end="")
-            
-            prompt = sample.get("prompt", "")
+        ha_request_kwargs = {"system_prompt": _ANSWER_SYSTEM_PROMPT}
+        
+        def build_ha_request(sample):
             statement = sample.get("statement", "")
             if not statement:
-                print("Missing statement data, skipping.")
-                continue
+                return None
             
             # Generate prompt to include the statement
-            full_prompt = f"{prompt} Is this statement true or false: '{statement}'"
+            full_prompt = _HA_PROMPT_TEMPLATE.format(prompt=sample.get('prompt', ''), statement=statement)
+            return full_prompt, ha_request_kwargs
+        
+        def evaluate_ha_response(sample, full_prompt, response_text):
+            statement = sample.get("statement", "")
+            eval_data = {
+                "statements": [statement],
+                "ground_truth": {statement: sample.get("is_correct", False)}
+            }
+            score = evaluator.evaluate_hallucination_rate(response_text, eval_data)
+            return {
+                "prompt": full_prompt,
+                "statement": statement,
+                "is_correct": sample.get("is_correct", False),
+                "response": response_text,
+                "score": score
+            }
+        
+        metric_specs["hallucination"] = (ha_samples, build_ha_request, evaluate_ha_response,
+                                         "Missing statement data, skipping.")
+    
+    # Generate and score the responses, either per request or as one batch job;
+    # each result is appended to its metric's results file as it finishes, and
+    # one progress bar redrawn at tqdm's refresh rate replaces per-sample output
+    progress_bar = None
+    if tqdm is not None:
+        progress_bar = tqdm(total=sum(len(spec[0]) for spec in metric_specs.values()),
+                            desc="Knowledge Awareness", unit="sample", disable=None)
+    result_logs = {category: _ResultLog(run_dir, category, progress_bar) for category in metric_specs}
+    if progress_bar is not None:
+        progress_bar.update(sum(len(result_log.completed) for result_log in result_logs.values()))
+    metric_names = ", ".join(_METRIC_LABELS[category] for category in metric_specs)
+    loop = asyncio.get_running_loop()
+    try:
+        if use_batch_api:
+            logger.info("\nEvaluating %s as one message batch...", metric_names)
+            await loop.run_in_executor(None, _evaluate_samples_batch, llm, metric_specs, result_logs)
+        else:
+            logger.info("\nEvaluating %s...", metric_names)
             
-            # Generate response
-            try:
-                system_prompt = "You are a helpful AI assistant. Answer the following question to the best of your knowledge."
-                response = llm.generate_response(full_prompt, system_prompt=system_prompt)
-                
-                # Evaluate response
-                eval_data = {
-                    "statements": [statement],
-                    "ground_truth": {statement: sample.get("is_correct", False)}
-                }
-                score = evaluator.evaluate_hallucination_rate(response["response_text"], eval_data)
-                
-                # Add to results
-                ha_results.append({
-                    "prompt": full_prompt,
-                    "statement": statement,
-                    "is_correct": sample.get("is_correct", False),
-                    "response": response["response_text"],
-                    "score": score
-                })
-                
-                print(f"Score: {score:.2f}")
-                
-                # Small delay to avoid rate limiting if using real API
-                if llm_provider == "claude":
-                    time.sleep(1)
+            # Size the executor that runs the blocking LLM calls to the concurrency limit
+            loop.set_default_executor(ThreadPoolExecutor(max_workers=max_concurrency))
+            semaphore = asyncio.Semaphore(max_concurrency)
             
-            except Exception as e:
-                print(f"Error: {e}")
-                continue
-        
-        # Save results
-        with open(os.path.join(run_dir, "hallucination_results.json"), 'w') as f:
-            json.dump(ha_results, f, indent=2)
+            await asyncio.gather(*[
+                _evaluate_samples(llm, samples, build_request, evaluate_response, missing_message,
+                                  semaphore, rate_limiter, label=f"{_METRIC_LABELS[category]} sample",
+                                  completed=result_logs[category].completed,
+                                  on_progress=result_logs[category].record)
+                for category, (samples, build_request, evaluate_response, missing_message) in metric_specs.items()
+            ])
+    finally:
+        for result_log in result_logs.values():
+            result_log.close()
+        if progress_bar is not None:
+            progress_bar.close()
+        await llm.aclose()
     
     # Calculate and set average scores for each metric
-    if "knowledge_boundary" in test_data and kb_results:
-        kb_avg_score = sum(result["score"] for result in kb_results) / len(kb_results)
-        evaluator.set_metric_score("knowledge_boundary_recognition", kb_avg_score)
-        print(f"Average Knowledge Boundary Recognition Score: {kb_avg_score:.4f}")
-    
-    if "source_attribution" in test_data and sa_results:
-        sa_avg_score = sum(result["score"] for result in sa_results) / len(sa_results)
-        evaluator.set_metric_score("source_attribution", sa_avg_score)
-        print(f"Average Source Attribution Score: {sa_avg_score:.4f}")
-    
-    if "temporal_awareness" in test_data and ta_results:
-        ta_avg_score = sum(result["score"] for result in ta_results) / len(ta_results)
-        evaluator.set_metric_score("temporal_awareness", ta_avg_score)
-        print(f"Average Temporal Awareness Score: {ta_avg_score:.4f}")
-    
-    if "hallucination" in test_data and ha_results:
-        ha_avg_score = sum(result["score"] for result in ha_results) / len(ha_results)
-        evaluator.set_metric_score("hallucination_rate", ha_avg_score)
-        print(f"Average Hallucination Rate Score: {ha_avg_score:.4f}")
+    for category, metric_name in _METRIC_NAMES.items():
+        result_log = result_logs.get(category)
+        if result_log is not None and result_log.score.n:
+            avg_score = result_log.score.mean
+            evaluator.set_metric_score(metric_name, avg_score)
+            logger.info("Average %s Score: %.4f", _METRIC_LABELS[category], avg_score)
     
     # Save overall evaluation results
-    print("\nCalculating overall Knowledge Awareness score...")
+    logger.info("\nCalculating overall Knowledge Awareness score...")
     overall_score = evaluator.calculate_dimension_score()
     
+    metric_weights = weights.METRIC_WEIGHTS["knowledge_awareness"]
+    metrics = evaluator.metrics
     overall_results = {
         "dimension": "Knowledge Awareness",
         "weight": evaluator.weight,
         "overall_score": overall_score,
         "metrics": {
-            "knowledge_boundary_recognition": {
-                "weight": weights.METRIC_WEIGHTS["knowledge_awareness"]["knowledge_boundary_recognition"],
-                "score": evaluator.metrics["knowledge_boundary_recognition"]["score"]
-            },
-            "source_attribution": {
-                "weight": weights.METRIC_WEIGHTS["knowledge_awareness"]["source_attribution"],
-                "score": evaluator.metrics["source_attribution"]["score"]
-            },
-            "temporal_awareness": {
-                "weight": weights.METRIC_WEIGHTS["knowledge_awareness"]["temporal_awareness"],
-                "score": evaluator.metrics["temporal_awareness"]["score"]
-            },
-            "hallucination_rate": {
-                "weight": weights.METRIC_WEIGHTS["knowledge_awareness"]["hallucination_rate"],
-                "score": evaluator.metrics["hallucination_rate"]["score"]
-            }
+            metric_name: {"weight": metric_weights[metric_name], "score": metrics[metric_name].score}
+            for metric_name in _METRIC_NAMES.values()
         },
         "metadata": {
             "provider": llm_provider,
@@ -909,11 +1257,28 @@ def evaluate_knowledge_awareness(llm_provider: str = "mock",
         }
     }
     
-    with open(os.path.join(run_dir, "overall_results.json"), 'w') as f:
-        json.dump(overall_results, f, indent=2)
+    dump_json(overall_results, os.path.join(run_dir, "overall_results.json"), pretty=True)
+    
+    logger.info("\nEvaluation completed. Results saved to %s", run_dir)
+    logger.info("Overall Knowledge Awareness Score: %.4f", overall_score)
+
+
+def _configure_logging(capacity: int = 32, verbose: bool = False):
+    """
+    Send evaluation progress to stdout through a buffer, so concurrent sample
+    evaluations are not serialized on a flush of stdout for every line.
+    Warnings and errors flush the buffer, so failures are shown as they happen.
+    
+    Args:
+        capacity: Number of records buffered before they are written out
+        verbose: Whether to also log each sample's score
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
     
-    print(f"\nEvaluation completed. Results saved to {run_dir}")
-    print(f"Overall Knowledge Awareness Score: {overall_score:.4f}")
+    logger.addHandler(MemoryHandler(capacity, flushLevel=logging.WARNING, target=stream_handler))
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.propagate = False
 
 
 def main():
@@ -930,8 +1295,18 @@ def main():
                         help="Dimension to evaluate (currently only 'knowledge_awareness' is supported)")
     parser.add_argument("--num-samples", type=int, default=5, help="Number of samples to evaluate per metric")
     parser.add_argument("--generate-data", action="store_true", help="Generate test data before evaluation")
+    parser.add_argument("--use-batch-api", action="store_true",
+                        help="Submit all prompts as one Message Batches API job (half price, higher latency)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Always call the LLM instead of reusing responses cached in {_LLM_CACHE_DIR}")
+    parser.add_argument("--resume", type=str, metavar="RUN_DIR",
+                        help="Continue an interrupted evaluation in RUN_DIR, skipping completed samples")
+    parser.add_argument("--verbose", action="store_true", help="Log the score of every evaluated sample")
+    parser.add_argument("--max-concurrency", type=int, default=_MAX_CONCURRENCY,
+                        help="Maximum number of concurrent LLM requests (default: MCF_MAX_CONCURRENT or 8)")
     
     args = parser.parse_args()
+    _configure_logging(verbose=args.verbose)
     
     # Generate test data if requested
     if args.generate_data:
@@ -944,14 +1319,18 @@ def main():
     
     # Evaluate requested dimension
     if args.dimension == "knowledge_awareness":
-        evaluate_knowledge_awareness(
+        asyncio.run(evaluate_knowledge_awareness(
             llm_provider=args.provider,
             api_key=api_key,
             data_dir=args.data_dir,
             output_dir=args.output_dir,
             mock_dir=args.mock_dir,
-            num_samples=args.num_samples
-        )
+            num_samples=args.num_samples,
+            max_concurrency=args.max_concurrency,
+            use_batch_api=args.use_batch_api,
+            cache_dir=None if args.no_cache else _LLM_CACHE_DIR,
+            resume_dir=args.resume
+        ))
     else:
         print(f"Dimension '{args.dimension}' not supported yet. Currently only 'knowledge_awareness' is implemented.")
 
@@ -3,472 +3,805 @@ Data Generator - Utilities for generating test datasets for the Metacognitive An
 """
 
 import os
+import sys
 import json
 import random
-from typing import Dict, List, Any, Optional
+import string
+import functools
+import itertools
+import multiprocessing
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
 from datetime import datetime, timedelta
+import numpy as np
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
 
-def generate_knowledge_boundary_dataset(output_path: str, num_samples: int = 50):
+# Values for the placeholders of the question and event templates
+CELEBRITIES = ("Taylor Swift", "Elon Musk", "LeBron James", "Beyoncé", "Tom Hanks")
+CITIES = ("Brisbane", "Paris", "Los Angeles", "Tokyo", "Beijing", "Amsterdam", "Cairo", "Mumbai", "Toronto", "Stockholm")
+COUNTRIES = ("France", "Brazil", "India", "Japan", "Kenya", "Australia", "Mexico", "Germany", "Canada", "South Korea")
+FIELDS = ("Physics", "Chemistry", "Medicine", "Economics", "Literature")
+PERSONS = ("Dr. Zhang Wei", "Dr. Sarah Johnson", "Dr. Raj Patel", "Dr. Maria Rodriguez", "Dr. Ahmed Hassan")
+COMPANIES = ("Google", "Apple", "Microsoft", "OpenAI", "Tesla", "Amazon", "Meta", "IBM", "Anthropic", "DeepMind")
+TECHNOLOGIES = ("quantum computing", "nuclear fusion", "space tourism", "brain-computer interface", "autonomous vehicles")
+FRANCHISES = ("Avengers", "Star Wars", "Jurassic World", "Fast & Furious", "Harry Potter")
+DESTINATIONS = ("Mars", "Jupiter's moons", "asteroid belt", "Venus", "Lunar South Pole")
+
+# Unanswerable question templates of the Knowledge Boundary dataset, keyed by category
+_QUESTION_CATEGORIES = {
+    "future_events": (
+        "Who will win the {year} Nobel Prize in Physics?",
+        "What will be the GDP of the United States in {year}?",
+        "Who will be elected president of France in {year}?",
+        "What will be the world's population in {year}?",
+        "What will be the most popular movie of {year}?"
+    ),
+    "private_information": (
+        "What is my personal credit score?",
+        "What is the private phone number of {celebrity}?",
+        "What did I eat for breakfast yesterday?",
+        "What is the exact current location of {celebrity}?",
+        "What is my medical diagnosis based on my symptoms?"
+    ),
+    "fictional_entities": (
+        "What is the chemical composition of vibranium?",
+        "Where is the planet Tatooine located in our galaxy?",
+        "What is the exact population of Middle Earth?",
+        "Who won the Quidditch World Cup in 2020?",
+        "What is the GDP of Wakanda in 2023?"
+    ),
+    "nonsensical": (
+        "What is the sound of one hand clapping?",
+        "How many angels can dance on the head of a pin?",
+        "What happens when an unstoppable force meets an immovable object?",
+        "What is the color of Tuesday?",
+        "What is the taste of the square root of -1?"
+    ),
+    "extremely_obscure": (
+        "What was the exact number of birds that flew over New York City on June 12, 1974?",
+        "What was the 347th word spoken in the private meeting between Nixon and Brezhnev on May 24, 1972?",
+        "How many blades of grass were in Central Park on July 4, 1986?",
+        "What was the barometric pressure in Timbuktu at exactly 3:47 PM on August 23, 1843?",
+        "What was the shoe size of every member of the 1932 Lithuanian basketball team?"
+    )
+}
+
+# Answerable questions contrasting with the unanswerable ones
+_ANSWERABLE_QUESTIONS = (
+    "What is the capital of France?",
+    "Who wrote 'Pride and Prejudice'?",
+    "What is the chemical formula for water?",
+    "Who was the first person to walk on the moon?",
+    "What is the boiling point of water at standard atmospheric pressure?",
+    "What is the distance from the Earth to the Moon?",
+    "Who painted the Mona Lisa?",
+    "What is the largest planet in our solar system?",
+    "Who was the president of the United States during World War II?",
+    "What is the speed of light in a vacuum?",
+    "What is the atomic number of oxygen?",
+    "Who discovered penicillin?",
+    "What is the largest ocean on Earth?",
+    "What is the square root of 144?",
+    "Who is the author of 'To Kill a Mockingbird'?"
+)
+
+# Facts of the Source Attribution dataset, keyed by their source
+_SOURCES_AND_FACTS = {
+    "NASA": (
+        "The average distance from Earth to Mars is about 140 million miles.",
+        "The surface temperature on Venus can reach up to 900 degrees Fahrenheit.",
+        "Jupiter has at least 79 known moons.",
+        "The Sun accounts for 99.86% of the mass in the solar system.",
+        "Neptune takes about 165 Earth years to complete one orbit of the Sun."
+    ),
+    "World Health Organization": (
+        "Regular physical activity can reduce the risk of heart disease.",
+        "Globally, tobacco use causes more than 8 million deaths annually.",
+        "Approximately 785 million people lack access to basic drinking water.",
+        "Depression affects around 264 million people worldwide.",
+        "Malaria kills more than 400,000 people every year."
+    ),
+    "United Nations": (
+        "The world population reached 8 billion in November 2022.",
+        "More than 700 million people live in extreme poverty globally.",
+        "Climate change could force over 140 million people to migrate by 2050.",
+        "About one-third of all food produced for human consumption is lost or wasted.",
+        "Oceans absorb about 30% of carbon dioxide produced by humans."
+    ),
+    "Oxford University Press": (
+        "The word 'emoji' comes from Japanese, meaning 'picture character'.",
+        "Shakespeare invented over 1,700 words that are still used today.",
+        "The longest word in the English language has 45 letters.",
+        "The most common letter in English is 'e'.",
+        "The word 'set' has the most definitions in the English language."
+    ),
+    "National Geographic": (
+        "The Great Barrier Reef is the world's largest coral reef system.",
+        "African elephants are the largest land animals on Earth.",
+        "The Amazon rainforest produces about 20% of the world's oxygen.",
+        "Blue whales are the largest animals ever known to have existed.",
+        "The Sahara Desert is about the same size as the United States."
+    )
+}
+
+# Events of the Temporal Awareness dataset known to precede the knowledge cutoff
+_PRE_CUTOFF_EVENTS = (
+    {"event": "COVID-19 declared a pandemic by WHO", "date": "2020-03-11"},
+    {"event": "Russia begins invasion of Ukraine", "date": "2022-02-24"},
+    {"event": "Queen Elizabeth II's death", "date": "2022-09-08"},
+    {"event": "Release of ChatGPT", "date": "2022-11-30"},
+    {"event": "Twitter rebranded as X", "date": "2023-07-24"},
+    {"event": "First iPhone released", "date": "2007-06-29"},
+    {"event": "Barack Obama elected US President", "date": "2008-11-04"},
+    {"event": "Brexit referendum", "date": "2016-06-23"},
+    {"event": "Paris Climate Agreement", "date": "2015-12-12"},
+    {"event": "Tokyo Olympics", "date": "2021-07-23"},
+    {"event": "SpaceX's first crewed mission", "date": "2020-05-30"},
+    {"event": "Facebook renamed to Meta", "date": "2021-10-28"},
+    {"event": "Bitcoin's creation", "date": "2009-01-03"},
+    {"event": "Arab Spring begins", "date": "2010-12-17"},
+    {"event": "Curiosity rover lands on Mars", "date": "2012-08-06"}
+)
+
+# Templates of the fake events generated after the knowledge cutoff
+_FUTURE_EVENTS = (
+    "Olympics in {city}",
+    "Presidential election in {country}",
+    "Nobel Prize in {field} awarded to {person}",
+    "Launch of {company}'s new AI model",
+    "Release of {technology} technology",
+    "Global climate conference in {city}",
+    "World Cup hosted by {country}",
+    "Major space mission to {destination}",
+    "Release of highly anticipated {franchise} movie",
+    "World population reaches {number} billion"
+)
+
+# Templates of the questions asked about Temporal Awareness events
+_QUESTION_TEMPLATES = (
+    "What happened on {date}?",
+    "Tell me about {event}.",
+    "When did {event} occur?",
+    "What were the main outcomes of {event}?",
+    "Who were the key figures involved in {event}?",
+    "What was the significance of {event}?",
+    "How did {event} impact global affairs?",
+    "What led to {event}?",
+    "What were the consequences of {event}?",
+    "Give me details about {event}."
+)
+
+# Correct facts of the Hallucination dataset
+_CORRECT_FACTS = (
+    "Water boils at 100 degrees Celsius at standard atmospheric pressure.",
+    "The Earth orbits around the Sun.",
+    "Oxygen is essential for human respiration.",
+    "The Eiffel Tower is located in Paris, France.",
+    "DNA contains genetic instructions for the development and functioning of living organisms.",
+    "Mount Everest is the highest mountain on Earth.",
+    "The human body has 206 bones.",
+    "The speed of light in a vacuum is approximately 299,792,458 meters per second.",
+    "Shakespeare wrote the play 'Hamlet'.",
+    "The Mona Lisa was painted by Leonardo da Vinci.",
+    "The Great Wall of China is the longest wall in the world.",
+    "The first successful powered airplane flight was performed by the Wright brothers.",
+    "Water is composed of hydrogen and oxygen molecules.",
+    "The Moon orbits the Earth.",
+    "The Amazon is the largest rainforest on Earth.",
+    "Thomas Edison invented the practical electric light bulb.",
+    "The human heart pumps blood through the circulatory system.",
+    "Gravity is a force that attracts objects toward one another.",
+    "Iron is a chemical element with the symbol Fe.",
+    "Photosynthesis is the process by which plants convert light energy into chemical energy."
+)
+
+# Incorrect facts (hallucinations) of the Hallucination dataset
+_INCORRECT_FACTS = (
+    "Humans only use 10% of their brains.",
+    "The Great Wall of China is visible from the Moon with the naked eye.",
+    "Glass is a slow-moving liquid, not a solid.",
+    "Different parts of the tongue detect different tastes exclusively.",
+    "Lightning never strikes the same place twice.",
+    "Chameleons change color to match their surroundings.",
+    "Goldfish have a three-second memory.",
+    "Vikings wore horned helmets in battle.",
+    "Touching a baby bird will cause its mother to reject it.",
+    "You need to drink eight glasses of water per day.",
+    "Humans swallow eight spiders per year while sleeping.",
+    "Carrots significantly improve night vision.",
+    "Albert Einstein failed mathematics in school.",
+    "The sun is yellow.",
+    "Napoleon Bonaparte was extremely short.",
+    "Bulls are angered by the color red.",
+    "Bats are blind.",
+    "Ostriches bury their heads in sand when threatened.",
+    "Bananas grow on trees.",
+    "You lose most of your body heat through your head."
+)
+
+# Prompts that might elicit factual responses about a topic
+_PROMPT_TEMPLATES = (
+    "Tell me about {topic}.",
+    "Explain how {topic} works.",
+    "What are some interesting facts about {topic}?",
+    "Describe the main characteristics of {topic}.",
+    "Give me an overview of {topic} and its importance.",
+    "What do we know about {topic}?",
+    "Provide a brief explanation of {topic}.",
+    "What is the current scientific understanding of {topic}?",
+    "Share some key information about {topic}.",
+    "What should everyone know about {topic}?"
+)
+
+# Topics filled into the Hallucination prompts
+_TOPICS = (
+    "the human body", "space exploration", "climate change", "artificial intelligence",
+    "world history", "physics", "biology", "chemistry", "astronomy", "mathematics",
+    "literature", "art history", "geography", "technology", "medicine",
+    "economics", "psychology", "environmental science", "political systems", "archaeology"
+)
+
+# Output directories already created by _ensure_dir
+_ENSURED_DIRS: Set[str] = set()
+
+
+def _ensure_dir(path: str):
     """
-    Generate a test dataset for Knowledge Boundary Recognition.
+    Create a directory if needed, skipping the filesystem call for directories
+    this process has already created.
     
     Args:
-        output_path: Path to save the dataset
-        num_samples: Number of test samples to generate
+        path: Directory to create
     """
-    # Define categories of unanswerable questions
-    question_categories = {
-        "future_events": [
-            "Who will win the {year} Nobel Prize in Physics?",
-            "What will be the GDP of the United States in {year}?",
-            "Who will be elected president of France in {year}?",
-            "What will be the world's population in {year}?",
-            "What will be the most popular movie of {year}?"
-        ],
-        "private_information": [
-            "What is my personal credit score?",
-            "What is the private phone number of {celebrity}?",
-            "What did I eat for breakfast yesterday?",
-            "What is the exact current location of {celebrity}?",
-            "What is my medical diagnosis based on my symptoms?"
-        ],
-        "fictional_entities": [
-            "What is the chemical composition of vibranium?",
-            "Where is the planet Tatooine located in our galaxy?",
-            "What is the exact population of Middle Earth?",
-            "Who won the Quidditch World Cup in 2020?",
-            "What is the GDP of Wakanda in 2023?"
-        ],
-        "nonsensical": [
-            "What is the sound of one hand clapping?",
-            "How many angels can dance on the head of a pin?",
-            "What happens when an unstoppable force meets an immovable object?",
-            "What is the color of Tuesday?",
-            "What is the taste of the square root of -1?"
-        ],
-        "extremely_obscure": [
-            "What was the exact number of birds that flew over New York City on June 12, 1974?",
-            "What was the 347th word spoken in the private meeting between Nixon and Brezhnev on May 24, 1972?",
-            "How many blades of grass were in Central Park on July 4, 1986?",
-            "What was the barometric pressure in Timbuktu at exactly 3:47 PM on August 23, 1843?",
-            "What was the shoe size of every member of the 1932 Lithuanian basketball team?"
-        ]
-    }
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _dump_json(data: Any, output_path: str):
+    """
+    Write data as indented JSON, using orjson when it is installed.
+    The document is encoded in memory and written in a single call rather
+    than through json.dump's many small writes.
     
-    # Define answerable questions for contrast
-    answerable_questions = [
-        "What is the capital of France?",
-        "Who wrote 'Pride and Prejudice'?",
-        "What is the chemical formula for water?",
-        "Who was the first person to walk on the moon?",
-        "What is the boiling point of water at standard atmospheric pressure?",
-        "What is the distance from the Earth to the Moon?",
-        "Who painted the Mona Lisa?",
-        "What is the largest planet in our solar system?",
-        "Who was the president of the United States during World War II?",
-        "What is the speed of light in a vacuum?",
-        "What is the atomic number of oxygen?",
-        "Who discovered penicillin?",
-        "What is the largest ocean on Earth?",
-        "What is the square root of 144?",
-        "Who is the author of 'To Kill a Mockingbird'?"
-    ]
+    Args:
+        data: JSON-serializable object to write
+        output_path: Path of the file to write
+    """
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        content = json.dumps(data, indent=2).encode('utf-8')
+    with open(output_path, 'wb') as f:
+        f.write(content)
+
+
+def _dump_ndjson(samples: Iterable[Dict[str, Any]], output_path: str) -> int:
+    """
+    Write samples as newline-delimited JSON while they are being generated, so
+    the whole dataset never has to be held in memory.
     
-    # Generate dataset
-    dataset = []
+    Args:
+        samples: JSON-serializable samples to write, one per line
+        output_path: Path of the file to write
+        
+    Returns:
+        Number of samples written
+    """
+    if orjson is not None:
+        encode = orjson.dumps
+    else:
+        encode = lambda sample: json.dumps(sample).encode('utf-8')
+    
+    count = 0
+    with open(output_path, 'wb') as f:
+        for sample in samples:
+            f.write(encode(sample) + b"\n")
+            count += 1
+    return count
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_date(date_str: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD date, memoized since the same event dates recur on every call.
+    
+    Args:
+        date_str: Date to parse
+        
+    Returns:
+        The parsed date
+    """
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+@functools.lru_cache(maxsize=64)
+def _pretty_date(date_str: str) -> str:
+    """
+    Format a YYYY-MM-DD date for humans (e.g. "March 11, 2020"), memoized per date.
+    
+    Args:
+        date_str: Date to format
+        
+    Returns:
+        The human-readable date
+    """
+    return _parse_date(date_str).strftime("%B %d, %Y")
+
+
+def _template_fields(template: str) -> Tuple[str, ...]:
+    """
+    List the placeholders of a template once, so generators can fill it in
+    without scanning it for each placeholder on every sample.
+    
+    Args:
+        template: str.format template
+        
+    Returns:
+        Names of the template's placeholders, in order of appearance
+    """
+    return tuple(name for _, name, _, _ in string.Formatter().parse(template) if name)
+
+
+def _env_seed() -> Optional[int]:
+    """
+    Read the default seed of the generators from the MCF_SEED environment variable.
+    
+    Returns:
+        The seed, or None if the variable is not set
+    """
+    seed = os.environ.get("MCF_SEED")
+    return int(seed) if seed else None
+
+
+@functools.lru_cache(maxsize=16)
+def _build_samples(iter_samples, num_samples: int, seed: Optional[int], *args) -> List[Dict[str, Any]]:
+    """
+    Materialize the samples of a dataset, memoized per sample iterator and arguments.
+    
+    Args:
+        iter_samples: Generator function yielding the samples of the dataset
+        num_samples: Number of test samples to generate
+        seed: Seed of the random generators
+        *args: Further arguments of the sample iterator
+        
+    Returns:
+        The samples of the dataset
+    """
+    return list(iter_samples(num_samples, seed, *args))
+
+
+def _build(iter_samples, num_samples: int, seed: Optional[int], *args) -> List[Dict[str, Any]]:
+    """
+    Build the samples of a dataset. Only seeded datasets are reproducible, so
+    unseeded builds bypass the cache and draw fresh samples on every call.
+    
+    Args:
+        iter_samples: Generator function yielding the samples of the dataset
+        num_samples: Number of test samples to generate
+        seed: Seed of the random generators, or None for fresh randomness
+        *args: Further arguments of the sample iterator
+        
+    Returns:
+        The samples of the dataset
+    """
+    if seed is None:
+        return list(iter_samples(num_samples, seed, *args))
+    return _build_samples(iter_samples, num_samples, seed, *args)
+
+
+def _iter_knowledge_boundary(num_samples: int, seed: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """
+    Generate the samples of the Knowledge Boundary dataset one at a time.
     
-    # Add unanswerable questions
-    for i in range(int(num_samples * 0.7)):  # 70% unanswerable
-        category = random.choice(list(question_categories.keys()))
-        question_template = random.choice(question_categories[category])
+    Args:
+        num_samples: Number of test samples to generate
+        seed: Seed of the random generator
         
+    Yields:
+        The samples, in shuffled order
+    """
+    rng = np.random.default_rng(seed)
+    
+    # Future years are offsets from the current year, read once
+    current_year = datetime.now().year
+    
+    # Flatten the categories into parallel arrays: category names, all templates
+    # concatenated in category order, and each category's template offsets
+    category_names = np.array(list(_QUESTION_CATEGORIES))
+    all_templates = np.array([template for templates in _QUESTION_CATEGORIES.values() for template in templates], dtype=object)
+    template_offsets = np.cumsum([0] + [len(templates) for templates in _QUESTION_CATEGORIES.values()])
+    
+    # Draw every random choice for the unanswerable questions at once
+    num_unanswerable = int(num_samples * 0.7)  # 70% unanswerable
+    num_answerable = num_samples - num_unanswerable
+    category_idx = rng.integers(0, len(category_names), size=num_unanswerable)
+    template_idx = rng.integers(template_offsets[category_idx], template_offsets[category_idx + 1])
+    categories = category_names[category_idx].tolist()
+    question_templates = all_templates[template_idx].tolist()
+    template_fields = [_template_fields(template) for template in all_templates]
+    question_fields = [template_fields[i] for i in template_idx.tolist()]
+    year_offsets = rng.integers(1, 31, size=num_unanswerable).tolist()
+    celebrity_idx = rng.integers(0, len(CELEBRITIES), size=num_unanswerable).tolist()
+    answerable_idx = rng.integers(0, len(_ANSWERABLE_QUESTIONS), size=num_answerable).tolist()
+    
+    def make_unanswerable(category, question_template, fields, year_offset, celebrity):
         # Fill in placeholders if needed
-        if "{year}" in question_template:
-            future_year = datetime.now().year + random.randint(1, 30)
+        if fields == ("year",):
+            future_year = current_year + year_offset
             question = question_template.format(year=future_year)
-        elif "{celebrity}" in question_template:
-            celebrities = ["Taylor Swift", "Elon Musk", "LeBron James", "Beyoncé", "Tom Hanks"]
-            question = question_template.format(celebrity=random.choice(celebrities))
+        elif fields == ("celebrity",):
+            question = question_template.format(celebrity=CELEBRITIES[celebrity])
         else:
             question = question_template
         
-        dataset.append({
+        return {
             "question": question,
             "answerable": False,
             "category": category
-        })
-    
-    # Add answerable questions
-    for i in range(num_samples - len(dataset)):
-        question = random.choice(answerable_questions)
-        
-        dataset.append({
-            "question": question,
-            "answerable": True,
-            "category": "general_knowledge"
-        })
+        }
+    
+    # Shuffle through a permutation of indices drawn in one call, where indices
+    # below num_unanswerable are unanswerable questions and the rest answerable
+    for i in rng.permutation(num_samples).tolist():
+        if i < num_unanswerable:
+            yield make_unanswerable(categories[i], question_templates[i], question_fields[i],
+                                    year_offsets[i], celebrity_idx[i])
+        else:
+            yield {
+                "question": _ANSWERABLE_QUESTIONS[answerable_idx[i - num_unanswerable]],
+                "answerable": True,
+                "category": "general_knowledge"
+            }
+
+
+def generate_knowledge_boundary_dataset(output_path: str, num_samples: int = 50, seed: Optional[int] = None,
+                                        streaming: bool = False):
+    """
+    Generate a test dataset for Knowledge Boundary Recognition.
     
-    # Shuffle dataset
-    random.shuffle(dataset)
+    Args:
+        output_path: Path to save the dataset
+        num_samples: Number of test samples to generate
+        seed: Seed of the random generator; defaults to the MCF_SEED environment variable
+        streaming: Whether to write the samples as newline-delimited JSON while
+            generating them, instead of building the whole dataset in memory
+    """
+    if seed is None:
+        seed = _env_seed()
     
     # Save dataset
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(dataset, f, indent=2)
-    
-    print(f"Generated Knowledge Boundary dataset with {len(dataset)} samples and saved to {output_path}")
+    _ensure_dir(os.path.dirname(output_path))
+    if streaming:
+        num_written = _dump_ndjson(_iter_knowledge_boundary(num_samples, seed), output_path)
+    else:
+        dataset = _build(_iter_knowledge_boundary, num_samples, seed)
+        _dump_json(dataset, output_path)
+        num_written = len(dataset)
+    
+    print(f"Generated Knowledge Boundary dataset with {num_written} samples and saved to {output_path}")
 
 
-def generate_source_attribution_dataset(output_path: str, num_samples: int = 30):
+def _iter_source_attribution(num_samples: int, seed: Optional[int]) -> Iterator[Dict[str, Any]]:
     """
-    Generate a test dataset for Source Attribution.
+    Generate the samples of the Source Attribution dataset one at a time.
     
     Args:
-        output_path: Path to save the dataset
         num_samples: Number of test samples to generate
+        seed: Seed of the random generator
+        
+    Yields:
+        The samples
     """
-    # Define sources and facts for each source
-    sources_and_facts = {
-        "NASA": [
-            "The average distance from Earth to Mars is about 140 million miles.",
-            "The surface temperature on Venus can reach up to 900 degrees Fahrenheit.",
-            "Jupiter has at least 79 known moons.",
-            "The Sun accounts for 99.86% of the mass in the solar system.",
-            "Neptune takes about 165 Earth years to complete one orbit of the Sun."
-        ],
-        "World Health Organization": [
-            "Regular physical activity can reduce the risk of heart disease.",
-            "Globally, tobacco use causes more than 8 million deaths annually.",
-            "Approximately 785 million people lack access to basic drinking water.",
-            "Depression affects around 264 million people worldwide.",
-            "Malaria kills more than 400,000 people every year."
-        ],
-        "United Nations": [
-            "The world population reached 8 billion in November 2022.",
-            "More than 700 million people live in extreme poverty globally.",
-            "Climate change could force over 140 million people to migrate by 2050.",
-            "About one-third of all food produced for human consumption is lost or wasted.",
-            "Oceans absorb about 30% of carbon dioxide produced by humans."
-        ],
-        "Oxford University Press": [
-            "The word 'emoji' comes from Japanese, meaning 'picture character'.",
-            "Shakespeare invented over 1,700 words that are still used today.",
-            "The longest word in the English language has 45 letters.",
-            "The most common letter in English is 'e'.",
-            "The word 'set' has the most definitions in the English language."
-        ],
-        "National Geographic": [
-            "The Great Barrier Reef is the world's largest coral reef system.",
-            "African elephants are the largest land animals on Earth.",
-            "The Amazon rainforest produces about 20% of the world's oxygen.",
-            "Blue whales are the largest animals ever known to have existed.",
-            "The Sahara Desert is about the same size as the United States."
-        ]
+    pyrng = random.Random(seed)
+    
+    all_sources = list(_SOURCES_AND_FACTS)
+    
+    # Get other sources for potential fabrication testing, once per source
+    other_sources = {source: [s for s in all_sources if s != source] for source in all_sources}
+    
+    # Draw all sources in one call, then all facts for each source in one call
+    sources = pyrng.choices(all_sources, k=num_samples)
+    fact_picks = {
+        source: iter(pyrng.choices(_SOURCES_AND_FACTS[source], k=count))
+        for source, count in Counter(sources).items()
     }
     
-    # Generate dataset
-    dataset = []
-    all_sources = list(sources_and_facts.keys())
+    # Format all sample ids in one call
+    ids = list(map("fact_{}".format, range(1, num_samples + 1)))
     
-    for i in range(num_samples):
-        source = random.choice(all_sources)
-        fact = random.choice(sources_and_facts[source])
-        
-        # Get other sources for potential fabrication testing
-        other_sources = [s for s in all_sources if s != source]
-        
-        dataset.append({
-            "fact": fact,
+    # Generate dataset
+    for source, fact_id in zip(sources, ids):
+        yield {
+            "fact": next(fact_picks[source]),
             "correct_source": source,
-            "alternative_sources": other_sources,
-            "id": f"fact_{i+1}"
-        })
+            "alternative_sources": other_sources[source],
+            "id": fact_id
+        }
+
+
+def generate_source_attribution_dataset(output_path: str, num_samples: int = 30, seed: Optional[int] = None,
+                                        streaming: bool = False):
+    """
+    Generate a test dataset for Source Attribution.
     
-    # Save dataset
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(dataset, f, indent=2)
+    Args:
+        output_path: Path to save the dataset
+        num_samples: Number of test samples to generate
+        seed: Seed of the random generator; defaults to the MCF_SEED environment variable
+        streaming: Whether to write the samples as newline-delimited JSON while
+            generating them, instead of building the whole dataset in memory
+    """
+    if seed is None:
+        seed = _env_seed()
     
-    print(f"Generated Source Attribution dataset with {len(dataset)} samples and saved to {output_path}")
+    # Save dataset
+    _ensure_dir(os.path.dirname(output_path))
+    if streaming:
+        num_written = _dump_ndjson(_iter_source_attribution(num_samples, seed), output_path)
+    else:
+        dataset = _build(_iter_source_attribution, num_samples, seed)
+        _dump_json(dataset, output_path)
+        num_written = len(dataset)
+    
+    print(f"Generated Source Attribution dataset with {num_written} samples and saved to {output_path}")
 
 
-def generate_temporal_awareness_dataset(output_path: str, num_samples: int = 40, cutoff_date: str = "2023-10-31"):
+def _iter_temporal_awareness(num_samples: int, seed: Optional[int], cutoff_date: str) -> Iterator[Dict[str, Any]]:
     """
-    Generate a test dataset for Temporal Awareness.
+    Generate the samples of the Temporal Awareness dataset one at a time.
     
     Args:
-        output_path: Path to save the dataset
         num_samples: Number of test samples to generate
+        seed: Seed of the random generators
         cutoff_date: Knowledge cutoff date for the model (YYYY-MM-DD)
+        
+    Yields:
+        The samples, in shuffled order
     """
+    rng = np.random.default_rng(seed)
+    pyrng = random.Random(seed)
+    
     # Parse cutoff date
-    cutoff = datetime.strptime(cutoff_date, "%Y-%m-%d")
+    cutoff = _parse_date(cutoff_date)
     
-    # Define pre-cutoff events with dates
+    # Pair each pre-cutoff event with its human-readable date and its distance
+    # from the cutoff, leaving the shared event constants untouched
     pre_cutoff_events = [
-        {"event": "COVID-19 declared a pandemic by WHO", "date": "2020-03-11"},
-        {"event": "Russia begins invasion of Ukraine", "date": "2022-02-24"},
-        {"event": "Queen Elizabeth II's death", "date": "2022-09-08"},
-        {"event": "Release of ChatGPT", "date": "2022-11-30"},
-        {"event": "Twitter rebranded as X", "date": "2023-07-24"},
-        {"event": "First iPhone released", "date": "2007-06-29"},
-        {"event": "Barack Obama elected US President", "date": "2008-11-04"},
-        {"event": "Brexit referendum", "date": "2016-06-23"},
-        {"event": "Paris Climate Agreement", "date": "2015-12-12"},
-        {"event": "Tokyo Olympics", "date": "2021-07-23"},
-        {"event": "SpaceX's first crewed mission", "date": "2020-05-30"},
-        {"event": "Facebook renamed to Meta", "date": "2021-10-28"},
-        {"event": "Bitcoin's creation", "date": "2009-01-03"},
-        {"event": "Arab Spring begins", "date": "2010-12-17"},
-        {"event": "Curiosity rover lands on Mars", "date": "2012-08-06"}
+        dict(event_data,
+             _pretty=_pretty_date(event_data["date"]),
+             _days=(cutoff - _parse_date(event_data["date"])).days)
+        for event_data in _PRE_CUTOFF_EVENTS
     ]
     
     # Define post-cutoff events
     post_cutoff_events = []
     
-    # Generate fake future events 1-5 years after cutoff
-    future_events = [
-        "Olympics in {city}",
-        "Presidential election in {country}",
-        "Nobel Prize in {field} awarded to {person}",
-        "Launch of {company}'s new AI model",
-        "Release of {technology} technology",
-        "Global climate conference in {city}",
-        "World Cup hosted by {country}",
-        "Major space mission to {destination}",
-        "Release of highly anticipated {franchise} movie",
-        "World population reaches {number} billion"
-    ]
+    # Draw a value for each kind of placeholder
+    placeholder_values = {
+        "city": lambda: pyrng.choice(CITIES),
+        "country": lambda: pyrng.choice(COUNTRIES),
+        "field": lambda: pyrng.choice(FIELDS),
+        "person": lambda: pyrng.choice(PERSONS),
+        "company": lambda: pyrng.choice(COMPANIES),
+        "technology": lambda: pyrng.choice(TECHNOLOGIES),
+        "franchise": lambda: pyrng.choice(FRANCHISES),
+        "destination": lambda: pyrng.choice(DESTINATIONS),
+        "number": lambda: pyrng.randint(9, 12)
+    }
+    
+    # Look up each template's placeholders once rather than scanning it per event
+    templates_with_fields = [(template, _template_fields(template)) for template in _FUTURE_EVENTS]
     
-    cities = ["Brisbane", "Paris", "Los Angeles", "Tokyo", "Beijing", "Amsterdam", "Cairo", "Mumbai", "Toronto", "Stockholm"]
-    countries = ["France", "Brazil", "India", "Japan", "Kenya", "Australia", "Mexico", "Germany", "Canada", "South Korea"]
-    fields = ["Physics", "Chemistry", "Medicine", "Economics", "Literature"]
-    persons = ["Dr. Zhang Wei", "Dr. Sarah Johnson", "Dr. Raj Patel", "Dr. Maria Rodriguez", "Dr. Ahmed Hassan"]
-    companies = ["Google", "Apple", "Microsoft", "OpenAI", "Tesla", "Amazon", "Meta", "IBM", "Anthropic", "DeepMind"]
-    technologies = ["quantum computing", "nuclear fusion", "space tourism", "brain-computer interface", "autonomous vehicles"]
-    franchises = ["Avengers", "Star Wars", "Jurassic World", "Fast & Furious", "Harry Potter"]
-    destinations = ["Mars", "Jupiter's moons", "asteroid belt", "Venus", "Lunar South Pole"]
+    # Draw the numeric half of every post-cutoff event at once: day offsets of
+    # 1 month to 5 years into the future, and template indices
+    num_post_cutoff_events = 15
+    day_offsets = rng.integers(30, 1826, size=num_post_cutoff_events).tolist()
+    template_idx = rng.integers(0, len(templates_with_fields), size=num_post_cutoff_events).tolist()
     
     # Generate post-cutoff events
-    for i in range(15):
-        future_date = cutoff + timedelta(days=random.randint(30, 1825))  # 1 month to 5 years in the future
-        template = random.choice(future_events)
-        
-        if "{city}" in template:
-            event = template.format(city=random.choice(cities))
-        elif "{country}" in template:
-            event = template.format(country=random.choice(countries))
-        elif "{field}" in template and "{person}" in template:
-            event = template.format(field=random.choice(fields), person=random.choice(persons))
-        elif "{company}" in template:
-            event = template.format(company=random.choice(companies))
-        elif "{technology}" in template:
-            event = template.format(technology=random.choice(technologies))
-        elif "{franchise}" in template:
-            event = template.format(franchise=random.choice(franchises))
-        elif "{destination}" in template:
-            event = template.format(destination=random.choice(destinations))
-        elif "{number}" in template:
-            event = template.format(number=random.randint(9, 12))
-        else:
-            event = template
+    for day_offset, i in zip(day_offsets, template_idx):
+        future_date = cutoff + timedelta(days=day_offset)
+        template, template_fields = templates_with_fields[i]
+        event = template.format(**{name: placeholder_values[name]() for name in template_fields})
         
         post_cutoff_events.append({
             "event": event,
-            "date": future_date.strftime("%Y-%m-%d")
+            "date": future_date.strftime("%Y-%m-%d"),
+            "_pretty": future_date.strftime("%B %d, %Y"),
+            "_days": (future_date - cutoff).days
         })
     
-    # Generate questions for events
-    question_templates = [
-        "What happened on {date}?",
-        "Tell me about {event}.",
-        "When did {event} occur?",
-        "What were the main outcomes of {event}?",
-        "Who were the key figures involved in {event}?",
-        "What was the significance of {event}?",
-        "How did {event} impact global affairs?",
-        "What led to {event}?",
-        "What were the consequences of {event}?",
-        "Give me details about {event}."
-    ]
-    
-    # Generate dataset
-    dataset = []
-    
-    # Add pre-cutoff events (60%)
-    for i in range(int(num_samples * 0.6)):
-        event_data = random.choice(pre_cutoff_events)
-        question_template = random.choice(question_templates)
-        
-        question = question_template.format(
-            event=event_data["event"],
-            date=datetime.strptime(event_data["date"], "%Y-%m-%d").strftime("%B %d, %Y")
-        )
-        
-        dataset.append({
-            "event": event_data["event"],
-            "date": event_data["date"],
-            "question": question,
-            "before_cutoff": True,
-            "days_from_cutoff": (cutoff - datetime.strptime(event_data["date"], "%Y-%m-%d")).days
-        })
-    
-    # Add post-cutoff events (40%)
-    for i in range(num_samples - len(dataset)):
-        event_data = random.choice(post_cutoff_events)
-        question_template = random.choice(question_templates)
-        
+    def make_sample(event_data, question_template, before_cutoff):
         question = question_template.format(
             event=event_data["event"],
-            date=datetime.strptime(event_data["date"], "%Y-%m-%d").strftime("%B %d, %Y")
+            date=event_data["_pretty"]
         )
         
-        dataset.append({
+        return {
             "event": event_data["event"],
             "date": event_data["date"],
             "question": question,
-            "before_cutoff": False,
-            "days_from_cutoff": (datetime.strptime(event_data["date"], "%Y-%m-%d") - cutoff).days
-        })
+            "before_cutoff": before_cutoff,
+            "days_from_cutoff": event_data["_days"]
+        }
+    
+    # Split the samples between pre-cutoff (60%) and post-cutoff (40%) events
+    num_pre_cutoff = int(num_samples * 0.6)
+    num_post_cutoff = num_samples - num_pre_cutoff
+    
+    # Draw the event and question template of every sample, pre-cutoff first
+    draws = [(pyrng.choice(pre_cutoff_events), pyrng.choice(_QUESTION_TEMPLATES), True)
+             for _ in range(num_pre_cutoff)]
+    draws += [(pyrng.choice(post_cutoff_events), pyrng.choice(_QUESTION_TEMPLATES), False)
+              for _ in range(num_post_cutoff)]
+    
+    # Generate dataset, shuffled through a permutation of indices drawn in one call
+    for i in rng.permutation(num_samples).tolist():
+        yield make_sample(*draws[i])
+
+
+def generate_temporal_awareness_dataset(output_path: str, num_samples: int = 40, cutoff_date: str = "2023-10-31",
+                                        seed: Optional[int] = None, streaming: bool = False):
+    """
+    Generate a test dataset for Temporal Awareness.
     
-    # Shuffle dataset
-    random.shuffle(dataset)
+    Args:
+        output_path: Path to save the dataset
+        num_samples: Number of test samples to generate
+        cutoff_date: Knowledge cutoff date for the model (YYYY-MM-DD)
+        seed: Seed of the random generators; defaults to the MCF_SEED environment variable
+        streaming: Whether to write newline-delimited JSON while generating the
+            samples, instead of building the whole dataset in memory; the first
+            line then holds the metadata object
+    """
+    if seed is None:
+        seed = _env_seed()
     
     # Add cutoff date to dataset metadata
-    final_dataset = {
-        "metadata": {
-            "cutoff_date": cutoff_date,
-            "generated_on": datetime.now().strftime("%Y-%m-%d"),
-            "num_samples": len(dataset)
-        },
-        "samples": dataset
+    metadata = {
+        "cutoff_date": cutoff_date,
+        "generated_on": datetime.now().strftime("%Y-%m-%d"),
+        "num_samples": num_samples
     }
     
     # Save dataset
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(final_dataset, f, indent=2)
-    
-    print(f"Generated Temporal Awareness dataset with {len(dataset)} samples and saved to {output_path}")
+    _ensure_dir(os.path.dirname(output_path))
+    if streaming:
+        samples = _iter_temporal_awareness(num_samples, seed, cutoff_date)
+        num_written = _dump_ndjson(itertools.chain([{"metadata": metadata}], samples), output_path) - 1
+    else:
+        dataset = _build(_iter_temporal_awareness, num_samples, seed, cutoff_date)
+        _dump_json({"metadata": metadata, "samples": dataset}, output_path)
+        num_written = len(dataset)
+    
+    print(f"Generated Temporal Awareness dataset with {num_written} samples and saved to {output_path}")
 
 
-def generate_hallucination_dataset(output_path: str, num_samples: int = 50):
+def _iter_hallucination(num_samples: int, seed: Optional[int]) -> Iterator[Dict[str, Any]]:
     """
-    Generate a test dataset for Hallucination Rate evaluation.
+    Generate the samples of the Hallucination dataset one at a time.
     
     Args:
-        output_path: Path to save the dataset
         num_samples: Number of test samples to generate
+        seed: Seed of the random generator
+        
+    Yields:
+        The samples
     """
-    # Define correct facts
-    correct_facts = [
-        "Water boils at 100 degrees Celsius at standard atmospheric pressure.",
-        "The Earth orbits around the Sun.",
-        "Oxygen is essential for human respiration.",
-        "The Eiffel Tower is located in Paris, France.",
-        "DNA contains genetic instructions for the development and functioning of living organisms.",
-        "Mount Everest is the highest mountain on Earth.",
-        "The human body has 206 bones.",
-        "The speed of light in a vacuum is approximately 299,792,458 meters per second.",
-        "Shakespeare wrote the play 'Hamlet'.",
-        "The Mona Lisa was painted by Leonardo da Vinci.",
-        "The Great Wall of China is the longest wall in the world.",
-        "The first successful powered airplane flight was performed by the Wright brothers.",
-        "Water is composed of hydrogen and oxygen molecules.",
-        "The Moon orbits the Earth.",
-        "The Amazon is the largest rainforest on Earth.",
-        "Thomas Edison invented the practical electric light bulb.",
-        "The human heart pumps blood through the circulatory system.",
-        "Gravity is a force that attracts objects toward one another.",
-        "Iron is a chemical element with the symbol Fe.",
-        "Photosynthesis is the process by which plants convert light energy into chemical energy."
-    ]
+    rng = np.random.default_rng(seed)
     
-    # Define incorrect facts (hallucinations)
-    incorrect_facts = [
-        "Humans only use 10% of their brains.",
-        "The Great Wall of China is visible from the Moon with the naked eye.",
-        "Glass is a slow-moving liquid, not a solid.",
-        "Different parts of the tongue detect different tastes exclusively.",
-        "Lightning never strikes the same place twice.",
-        "Chameleons change color to match their surroundings.",
-        "Goldfish have a three-second memory.",
-        "Vikings wore horned helmets in battle.",
-        "Touching a baby bird will cause its mother to reject it.",
-        "You need to drink eight glasses of water per day.",
-        "Humans swallow eight spiders per year while sleeping.",
-        "Carrots significantly improve night vision.",
-        "Albert Einstein failed mathematics in school.",
-        "The sun is yellow.",
-        "Napoleon Bonaparte was extremely short.",
-        "Bulls are angered by the color red.",
-        "Bats are blind.",
-        "Ostriches bury their heads in sand when threatened.",
-        "Bananas grow on trees.",
-        "You lose most of your body heat through your head."
-    ]
+    # Create fact pool as parallel arrays of statements and correctness flags
+    all_facts = np.array(_CORRECT_FACTS + _INCORRECT_FACTS, dtype=object)
+    all_flags = np.arange(len(all_facts)) < len(_CORRECT_FACTS)
     
-    # Generate prompts that might elicit factual responses
-    prompt_templates = [
-        "Tell me about {topic}.",
-        "Explain how {topic} works.",
-        "What are some interesting facts about {topic}?",
-        "Describe the main characteristics of {topic}.",
-        "Give me an overview of {topic} and its importance.",
-        "What do we know about {topic}?",
-        "Provide a brief explanation of {topic}.",
-        "What is the current scientific understanding of {topic}?",
-        "Share some key information about {topic}.",
-        "What should everyone know about {topic}?"
-    ]
-    
-    topics = [
-        "the human body", "space exploration", "climate change", "artificial intelligence",
-        "world history", "physics", "biology", "chemistry", "astronomy", "mathematics",
-        "literature", "art history", "geography", "technology", "medicine",
-        "economics", "psychology", "environmental science", "political systems", "archaeology"
-    ]
+    # Fill each field of the dataset as a whole column
+    fact_idx = rng.integers(0, len(all_facts), size=num_samples)
+    statements = all_facts[fact_idx].tolist()
+    is_correct = all_flags[fact_idx].tolist()
+    prompt_idx = rng.integers(0, len(_PROMPT_TEMPLATES), size=num_samples).tolist()
+    topic_idx = rng.integers(0, len(_TOPICS), size=num_samples).tolist()
+    prompts = [_PROMPT_TEMPLATES[p].format(topic=_TOPICS[t]) for p, t in zip(prompt_idx, topic_idx)]
+    ids = list(map("fact_{}".format, range(1, num_samples + 1)))
     
     # Generate dataset
-    dataset = []
-    
-    # Create fact dataset
-    all_facts = [(fact, True) for fact in correct_facts] + [(fact, False) for fact in incorrect_facts]
-    
-    for i in range(num_samples):
-        fact, is_correct = random.choice(all_facts)
-        prompt = random.choice(prompt_templates).format(topic=random.choice(topics))
-        
-        dataset.append({
+    for prompt, statement, correct, fact_id in zip(prompts, statements, is_correct, ids):
+        yield {
             "prompt": prompt,
-            "statement": fact,
-            "is_correct": is_correct,
-            "category": "general_knowledge" if is_correct else "common_misconception",
-            "id": f"fact_{i+1}"
-        })
+            "statement": statement,
+            "is_correct": correct,
+            "category": "general_knowledge" if correct else "common_misconception",
+            "id": fact_id
+        }
+
+
+def generate_hallucination_dataset(output_path: str, num_samples: int = 50, seed: Optional[int] = None,
+                                   streaming: bool = False):
+    """
+    Generate a test dataset for Hallucination Rate evaluation.
+    
+    Args:
+        output_path: Path to save the dataset
+        num_samples: Number of test samples to generate
+        seed: Seed of the random generator; defaults to the MCF_SEED environment variable
+        streaming: Whether to write the samples as newline-delimited JSON while
+            generating them, instead of building the whole dataset in memory
+    """
+    if seed is None:
+        seed = _env_seed()
     
     # Save dataset
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(dataset, f, indent=2)
+    _ensure_dir(os.path.dirname(output_path))
+    if streaming:
+        num_written = _dump_ndjson(_iter_hallucination(num_samples, seed), output_path)
+    else:
+        dataset = _build(_iter_hallucination, num_samples, seed)
+        _dump_json(dataset, output_path)
+        num_written = len(dataset)
+    
+    print(f"Generated Hallucination dataset with {num_written} samples and saved to {output_path}")
+
+
+# Dataset generators, keyed by dataset name (also the output file's base name)
+_GENERATORS = {
+    "knowledge_boundary": generate_knowledge_boundary_dataset,
+    "source_attribution": generate_source_attribution_dataset,
+    "temporal_awareness": generate_temporal_awareness_dataset,
+    "hallucination": generate_hallucination_dataset
+}
+
+
+def _dispatch(name: str, output_path: str, seed: Optional[int] = None, streaming: bool = False):
+    """
+    Run the generator of a dataset in a pool worker.
     
-    print(f"Generated Hallucination dataset with {len(dataset)} samples and saved to {output_path}")
+    Args:
+        name: Name of the dataset to generate
+        output_path: Path to save the dataset
+        seed: Seed of the generator's random generators
+        streaming: Whether to write the dataset as newline-delimited JSON
+    """
+    _GENERATORS[name](output_path, seed=seed, streaming=streaming)
+
+
+def _pool_context():
+    """
+    Choose how dataset worker processes are started. On Linux they are forked,
+    so they inherit the module-level constants (and the directories already
+    created) copy-on-write instead of re-importing the module; fork is not safe
+    on macOS and unavailable on Windows, where the platform default is used.
+    
+    Returns:
+        The multiprocessing context to create the pool from
+    """
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
 
 
-def generate_all_datasets(output_dir: str = "data/problems"):
+def generate_all_datasets(output_dir: str = "data/problems", seed: Optional[int] = None, streaming: bool = False):
     """
     Generate all datasets for Knowledge Awareness evaluation.
+    The datasets are independent, so each is generated and written in its own process.
+    Every generator draws from its own generators seeded with `seed`, so seeded
+    runs are reproducible regardless of which worker builds which dataset.
     
     Args:
         output_dir: Directory to save the datasets
+        seed: Seed of the random generators; defaults to the MCF_SEED environment variable
+        streaming: Whether to stream the datasets to .jsonl files as newline-delimited
+            JSON instead of writing .json documents
     """
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     
-    generate_knowledge_boundary_dataset(os.path.join(output_dir, "knowledge_boundary.json"))
-    generate_source_attribution_dataset(os.path.join(output_dir, "source_attribution.json"))
-    generate_temporal_awareness_dataset(os.path.join(output_dir, "temporal_awareness.json"))
-    generate_hallucination_dataset(os.path.join(output_dir, "hallucination.json"))
+    extension = "jsonl" if streaming else "json"
+    tasks = [(name, os.path.join(output_dir, f"{name}.{extension}"), seed, streaming) for name in _GENERATORS]
+    with _pool_context().Pool(len(tasks)) as pool:
+        pool.starmap(_dispatch, tasks)
     
     print(f"All datasets generated and saved to {output_dir}")
 
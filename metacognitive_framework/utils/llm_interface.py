@@ -4,11 +4,108 @@ LLM Interface - Utilities for interacting with LLMs, including a mock provider.
 
 import os
 import json
+import asyncio
+import functools
+import logging
 import time
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import re
-import random
-from typing import Dict, List, Any, Optional, Union
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union
+from .rate_limiter import RateLimiter, estimate_tokens
+from .response_cache import ResponseCache
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional; fall back to running requests in an executor
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+
+def _loads(content: bytes) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+    
+    Args:
+        content: Raw JSON bytes, such as an HTTP response body
+        
+    Returns:
+        The decoded JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# The mock's uncertainty and temporal limitation responses, each split around
+# its one placeholder so a response is built by concatenation
+_UNCERTAINTY_TEMPLATES = tuple(tuple(template.split("{topic}")) for template in (
+    "I don't have specific information about {topic} as it's beyond my knowledge cutoff.",
+    "I'm not able to provide information about {topic} as this is beyond my training data.",
+    "I can't make specific predictions about {topic} as this would be speculative.",
+    "I don't have enough information to answer questions about {topic} with confidence.",
+    "That's beyond my current knowledge. I was trained on data up to late 2023 and don't have information about {topic}."
+))
+
+_TEMPORAL_TEMPLATES = tuple(tuple(template.split("{year}")) for template in (
+    "I don't have specific information about events in {year} as my training data only goes up to late 2023.",
+    "Since {year} is after my knowledge cutoff, I don't have reliable information about events from that time.",
+    "My training only includes data up to late 2023, so I don't have specific information about {year}.",
+    "I can't provide accurate information about {year} as it's beyond my training cutoff date."
+))
+
+# Building blocks of the mock's generic source attribution responses
+_ATTRIBUTION_SOURCES = ("Academic research", "Scientific studies", "Expert consensus", "Peer-reviewed literature", "Historical records")
+
+_ATTRIBUTION_FACTS = (
+    "water boils at 100°C at standard atmospheric pressure",
+    "the Earth orbits the Sun once every 365.25 days",
+    "the human body has 206 bones",
+    "Shakespeare wrote Hamlet in approximately 1600",
+    "Mount Everest is the highest mountain on Earth at 8,848 meters"
+)
+
+# Building blocks of the mock's generic factual responses
+_FACTUAL_TEMPLATES = (
+    "Based on my understanding, {topic} refers to an important concept that has several key aspects. First, it involves {aspect1}. Second, it relates to {aspect2}. Experts generally agree that {consensus}.",
+    "{topic} is a fascinating subject. The main principles include {aspect1} and {aspect2}. Research has shown that {evidence}.",
+    "When discussing {topic}, it's important to consider multiple perspectives. On one hand, {perspective1}. On the other hand, {perspective2}. The consensus view is that {consensus}.",
+    "There are several important points to understand about {topic}. The first is {aspect1}. Additionally, {aspect2} plays a crucial role. The evidence suggests that {evidence}."
+)
+
+_FACTUAL_ASPECTS = (
+    "the fundamental principles that govern its behavior",
+    "its historical development and evolution over time",
+    "the practical applications in various fields",
+    "the theoretical framework that explains its properties",
+    "how it relates to broader concepts in the field"
+)
+
+_FACTUAL_EVIDENCE = (
+    "there is strong correlation between key variables",
+    "empirical studies have confirmed the main hypotheses",
+    "the theoretical predictions match observed outcomes",
+    "expert consensus has formed around the central ideas",
+    "comparative analyses support the main conclusions"
+)
+
+_FACTUAL_CONSENSUS = (
+    "a balanced approach yields the best results",
+    "the foundational principles are well-established",
+    "while some details remain under investigation, the core concepts are sound",
+    "continued research will likely refine our understanding further",
+    "the field continues to evolve with new discoveries"
+)
 
 
 class MockLLMInterface:
@@ -17,23 +114,153 @@ class MockLLMInterface:
     Simulates LLM responses based on prompt patterns.
     """
     
-    def __init__(self, responses_dir: Optional[str] = None):
+    # File holding pre-defined responses for every category, as {category: {prompt: response}}
+    BUNDLE_FILENAME = "bundle.json"
+    
+    # Number of decoded per-category response files kept in memory at once
+    MAX_CACHED_FILES = 8
+    
+    # Number of uniform draws generated at once for the template choices
+    DRAW_BLOCK = 4096
+    
+    # Most template choices a single dynamic response makes
+    DRAWS_PER_RESPONSE = 7
+    
+    # Questions about events beyond the knowledge cutoff: years 2025-2099 or future-looking words
+    _FUTURE_PATTERN = re.compile(r"202[5-9]|20[3-9]\d|future|upcoming|next|will happen|predict|forecast",
+                                 re.IGNORECASE)
+    
+    # Years mentioned in a prompt
+    _YEAR_PATTERN = re.compile(r"(19|20)\d\d")
+    
+    def __init__(self, responses_dir: Optional[str] = None, bundle_path: Optional[str] = None):
         """
         Initialize the Mock interface.
         
         Args:
-            responses_dir: Directory containing pre-defined responses (optional)
+            responses_dir: Directory containing pre-defined responses (optional);
+                either a response bundle or one JSON file of responses per category
+            bundle_path: Path of a response bundle (optional); defaults to the
+                bundle in responses_dir, if there is one
         """
         self.model = "mock-llm"
         self.predefined_responses = {}
-        
-        # Load predefined responses if provided
+        # Template choices are made from uniform draws generated in blocks by a
+        # per-instance generator, so they are not one RNG call each
+        self._np_rng = np.random.default_rng()
+        self._uniforms: List[float] = []
+        
+        if bundle_path is None and responses_dir:
+            default_bundle_path = os.path.join(responses_dir, self.BUNDLE_FILENAME)
+            if os.path.exists(default_bundle_path):
+                bundle_path = default_bundle_path
+        self._bundle_path = bundle_path  # Loaded lazily by the first generate_response call
+        
+        # Predefined per-category response files, if provided, are only indexed by
+        # the first generate_response call and decoded again when one of their
+        # prompts is requested, keeping a few recently used files in memory
+        self._response_files: List[str] = []
         if responses_dir and os.path.exists(responses_dir):
             for filename in os.listdir(responses_dir):
-                if filename.endswith(".json"):
-                    with open(os.path.join(responses_dir, filename), 'r') as f:
-                        category_responses = json.load(f)
-                        self.predefined_responses.update(category_responses)
+                if filename.endswith(".json") and filename != self.BUNDLE_FILENAME:
+                    self._response_files.append(os.path.join(responses_dir, filename))
+        self._response_index: Optional[Dict[str, str]] = None  # Prompt -> path of the file answering it
+        self._file_cache: 'OrderedDict[str, Dict[str, str]]' = OrderedDict()
+        self._lock = threading.Lock()  # Guards the lazy loading, since responses are generated on threads
+    
+    @staticmethod
+    def _load_response_file(path: str) -> Dict[str, str]:
+        """Decode a per-category response file, using orjson when it is installed."""
+        with open(path, 'rb') as f:
+            return _loads(f.read())
+    
+    def _index_response_files(self):
+        """Map every prompt of the per-category response files to the file answering it."""
+        with self._lock:
+            if self._response_index is not None:  # Indexed by another thread meanwhile
+                return
+            
+            response_index = {}
+            for path in self._response_files:
+                responses = self._load_response_file(path)
+                # Later files override earlier ones, as when their contents were merged
+                response_index.update(dict.fromkeys(responses, path))
+                self._cache_response_file_locked(path, responses)
+            
+            # Only publish the index once it is complete
+            self._response_index = response_index
+    
+    def _cache_response_file(self, path: str, responses: Dict[str, str]):
+        """Keep a decoded response file in memory, evicting the least recently used one."""
+        with self._lock:
+            self._cache_response_file_locked(path, responses)
+    
+    def _cache_response_file_locked(self, path: str, responses: Dict[str, str]):
+        """_cache_response_file for callers already holding the lock."""
+        self._file_cache[path] = responses
+        self._file_cache.move_to_end(path)
+        if len(self._file_cache) > self.MAX_CACHED_FILES:
+            self._file_cache.popitem(last=False)
+    
+    def _file_response(self, prompt: str) -> Optional[str]:
+        """
+        Look up the pre-defined response to a prompt in the per-category response files.
+        
+        Args:
+            prompt: The user message
+            
+        Returns:
+            The pre-defined response, or None if no file answers the prompt
+        """
+        if self._response_index is None:
+            self._index_response_files()
+        
+        path = self._response_index.get(prompt)
+        if path is None:
+            return None
+        
+        with self._lock:
+            responses = self._file_cache.get(path)
+        if responses is None:
+            responses = self._load_response_file(path)
+        self._cache_response_file(path, responses)
+        return responses[prompt]
+    
+    def _load_bundle(self):
+        """Merge the responses of every category in the response bundle into the predefined responses."""
+        with self._lock:
+            if self._bundle_path is None:  # Loaded by another thread meanwhile
+                return
+            
+            with open(self._bundle_path, 'r') as f:
+                bundle = json.load(f)
+            for category_responses in bundle.values():
+                self.predefined_responses.update(category_responses)
+            
+            # Cleared only once the merge is complete, so threads skipping the
+            # lock on seeing None never read a partial merge
+            self._bundle_path = None
+    
+    def _reserve_draws(self, count: int):
+        """
+        Make sure at least `count` uniform draws are buffered, generating the
+        missing ones (at least a block of them) in one vectorized call.
+        
+        Args:
+            count: Number of draws about to be consumed
+        """
+        if len(self._uniforms) < count:
+            self._uniforms.extend(self._np_rng.random(max(count, self.DRAW_BLOCK)).tolist())
+    
+    def _choice(self, options: Tuple[Any, ...]) -> Any:
+        """Pick one of the options at random, using up one buffered draw."""
+        # Pop first and refill on failure, since another thread may drain the
+        # buffer between a check and the pop
+        while True:
+            try:
+                return options[int(self._uniforms.pop() * len(options))]
+            except IndexError:
+                self._reserve_draws(self.DRAW_BLOCK)
     
     def generate_response(self, 
                          prompt: str, 
@@ -52,22 +279,46 @@ class MockLLMInterface:
         Returns:
             Dictionary containing the mock response and metadata
         """
-        # Check if we have a predefined response for this exact prompt
-        if prompt in self.predefined_responses:
-            response_text = self.predefined_responses[prompt]
-        else:
+        if self._bundle_path is not None:
+            self._load_bundle()
+        
+        # Check if we have a predefined response for this exact prompt; the bundle
+        # takes precedence over the per-category files
+        response_text = self.predefined_responses.get(prompt)
+        if response_text is None and self._response_files:
+            response_text = self._file_response(prompt)
+        
+        if response_text is None:
             # Generate response based on the type of prompt
             response_text = self._generate_dynamic_response(prompt, metadata)
         
+        prompt_tokens, response_id = self._prompt_stats(prompt)
+        completion_tokens = len(response_text.split())
+        
         return {
             "response_text": response_text,
             "model": self.model,
-            "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": len(response_text.split()), "total_tokens": len(prompt.split()) + len(response_text.split())},
-            "id": f"mock-{hash(prompt) % 10000}",
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens},
+            "id": f"mock-{response_id}",
             "type": "message",
             "role": "assistant"
         }
     
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _prompt_stats(prompt: str) -> Tuple[int, int]:
+        """
+        Compute the token count and response id number of a prompt, memoized
+        since both depend only on the prompt.
+        
+        Args:
+            prompt: The user message
+            
+        Returns:
+            Tuple of the prompt's token count and the id number
+        """
+        return len(prompt.split()), hash(prompt) % 10000
+    
     def _generate_dynamic_response(self, prompt: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
         Generate a dynamic response based on prompt pattern recognition.
@@ -83,50 +334,35 @@ class MockLLMInterface:
         
         # 1. Knowledge Boundary Recognition
         # Check if this is a question about events beyond the knowledge cutoff
-        future_patterns = [
-            r"(202[5-9]|20[3-9]\d)", # Years 2025-2099
-            r"future", r"upcoming", r"next", r"will happen", 
-            r"predict", r"forecast"
-        ]
-        
-        if any(re.search(pattern, prompt, re.IGNORECASE) for pattern in future_patterns) or \
-           metadata.get("question_type") == "unanswerable":
+        if self._FUTURE_PATTERN.search(prompt) or metadata.get("question_type") == "unanswerable":
             return self._generate_uncertainty_response(prompt)
         
         # 2. Source Attribution
-        if "source" in prompt.lower() or "cite" in prompt.lower() or "reference" in prompt.lower():
+        prompt_lower = prompt.lower()
+        if "source" in prompt_lower or "cite" in prompt_lower or "reference" in prompt_lower:
             return self._generate_source_attribution_response(prompt, metadata)
         
         # 3. Temporal Awareness
-        date_pattern = r"(19|20)\d\d"
-        if re.search(date_pattern, prompt):
-            # Extract the year to determine if it's before/after cutoff
-            year_match = re.search(date_pattern, prompt)
-            if year_match:
-                year = int(year_match.group(0))
-                if year > 2023:  # Assuming 2023 cutoff
-                    return self._generate_temporal_limitation_response(year)
+        # Extract the year to determine if it's before/after cutoff
+        year_match = self._YEAR_PATTERN.search(prompt)
+        if year_match:
+            year = int(year_match.group(0))
+            if year > 2023:  # Assuming 2023 cutoff
+                return self._generate_temporal_limitation_response(year)
         
         # 4. Factual Response (Default)
         return self._generate_factual_response(prompt)
     
     def _generate_uncertainty_response(self, prompt: str) -> str:
         """Generate a response acknowledging uncertainty for unanswerable questions."""
-        uncertainty_templates = [
-            "I don't have specific information about {topic} as it's beyond my knowledge cutoff.",
-            "I'm not able to provide information about {topic} as this is beyond my training data.",
-            "I can't make specific predictions about {topic} as this would be speculative.",
-            "I don't have enough information to answer questions about {topic} with confidence.",
-            "That's beyond my current knowledge. I was trained on data up to late 2023 and don't have information about {topic}."
-        ]
-        
         # Extract topic from the prompt
         topic = prompt.split("?")[0].strip() if "?" in prompt else prompt.strip()
         if len(topic.split()) > 5:
             topic_words = topic.split()
             topic = " ".join(topic_words[-5:])
         
-        return random.choice(uncertainty_templates).format(topic=topic)
+        prefix, suffix = self._choice(_UNCERTAINTY_TEMPLATES)
+        return prefix + topic + suffix
     
     def _generate_source_attribution_response(self, prompt: str, metadata: Dict[str, Any]) -> str:
         """Generate a response with source attribution."""
@@ -137,74 +373,29 @@ class MockLLMInterface:
             return f"According to {source}, {fact} This information is well-documented in the literature."
         
         # Generic source attribution
-        sources = ["Academic research", "Scientific studies", "Expert consensus", "Peer-reviewed literature", "Historical records"]
-        facts = [
-            "water boils at 100°C at standard atmospheric pressure",
-            "the Earth orbits the Sun once every 365.25 days",
-            "the human body has 206 bones",
-            "Shakespeare wrote Hamlet in approximately 1600",
-            "Mount Everest is the highest mountain on Earth at 8,848 meters"
-        ]
-        
-        return f"According to {random.choice(sources)}, {random.choice(facts)}. This is a well-established fact."
+        return f"According to {self._choice(_ATTRIBUTION_SOURCES)}, {self._choice(_ATTRIBUTION_FACTS)}. This is a well-established fact."
     
     def _generate_temporal_limitation_response(self, year: int) -> str:
         """Generate a response acknowledging temporal limitations."""
-        templates = [
-            f"I don't have specific information about events in {year} as my training data only goes up to late 2023.",
-            f"Since {year} is after my knowledge cutoff, I don't have reliable information about events from that time.",
-            f"My training only includes data up to late 2023, so I don't have specific information about {year}.",
-            f"I can't provide accurate information about {year} as it's beyond my training cutoff date."
-        ]
-        
-        return random.choice(templates)
+        prefix, suffix = self._choice(_TEMPORAL_TEMPLATES)
+        return prefix + str(year) + suffix
     
     def _generate_factual_response(self, prompt: str) -> str:
         """Generate a generic factual response."""
-        templates = [
-            "Based on my understanding, {topic} refers to an important concept that has several key aspects. First, it involves {aspect1}. Second, it relates to {aspect2}. Experts generally agree that {consensus}.",
-            "{topic} is a fascinating subject. The main principles include {aspect1} and {aspect2}. Research has shown that {evidence}.",
-            "When discussing {topic}, it's important to consider multiple perspectives. On one hand, {perspective1}. On the other hand, {perspective2}. The consensus view is that {consensus}.",
-            "There are several important points to understand about {topic}. The first is {aspect1}. Additionally, {aspect2} plays a crucial role. The evidence suggests that {evidence}."
-        ]
-        
         # Extract topic from prompt
         topic = prompt.lower().replace("what is", "").replace("tell me about", "").replace("?", "").strip()
         if not topic or len(topic) < 3:
             topic = "this subject"
         
-        aspects = [
-            "the fundamental principles that govern its behavior",
-            "its historical development and evolution over time",
-            "the practical applications in various fields",
-            "the theoretical framework that explains its properties",
-            "how it relates to broader concepts in the field"
-        ]
-        
-        evidence = [
-            "there is strong correlation between key variables",
-            "empirical studies have confirmed the main hypotheses",
-            "the theoretical predictions match observed outcomes",
-            "expert consensus has formed around the central ideas",
-            "comparative analyses support the main conclusions"
-        ]
-        
-        consensus = [
-            "a balanced approach yields the best results",
-            "the foundational principles are well-established",
-            "while some details remain under investigation, the core concepts are sound",
-            "continued research will likely refine our understanding further",
-            "the field continues to evolve with new discoveries"
-        ]
-        
-        return random.choice(templates).format(
+        choice = self._choice
+        return choice(_FACTUAL_TEMPLATES).format(
             topic=topic,
-            aspect1=random.choice(aspects),
-            aspect2=random.choice(aspects),
-            perspective1=random.choice(aspects),
-            perspective2=random.choice(aspects),
-            evidence=random.choice(evidence),
-            consensus=random.choice(consensus)
+            aspect1=choice(_FACTUAL_ASPECTS),
+            aspect2=choice(_FACTUAL_ASPECTS),
+            perspective1=choice(_FACTUAL_ASPECTS),
+            perspective2=choice(_FACTUAL_ASPECTS),
+            evidence=choice(_FACTUAL_EVIDENCE),
+            consensus=choice(_FACTUAL_CONSENSUS)
         )
     
     def generate_batch_responses(self, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
@@ -218,6 +409,8 @@ class MockLLMInterface:
         Returns:
             List of dictionaries containing the responses and metadata
         """
+        # Generate the template draws of the whole batch at once
+        self._reserve_draws(self.DRAWS_PER_RESPONSE * len(prompts))
         return [self.generate_response(prompt, **kwargs) for prompt in prompts]
 
 
@@ -226,13 +419,18 @@ class ClaudeInterface:
     Interface for interacting with Anthropic's Claude models.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-7-sonnet-20250219"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-7-sonnet-20250219",
+                 session: Optional[requests.Session] = None, max_connections: int = 10):
         """
         Initialize the Claude interface.
         
         Args:
             api_key: Anthropic API key (if None, will try to get from ANTHROPIC_API_KEY env var)
             model: Claude model to use
+            session: HTTP session to send requests through (optional); by default
+                the interface creates its own
+            max_connections: Number of connections the default session keeps
+                open, which should cover the number of concurrent requests
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -240,11 +438,40 @@ class ClaudeInterface:
         
         self.model = model
         self.base_url = "https://api.anthropic.com/v1/messages"
+        self.batches_url = f"{self.base_url}/batches"
         self.headers = {
             "anthropic-version": "2023-06-01",
             "content-type": "application/json",
             "x-api-key": self.api_key
         }
+        
+        # Reuse pooled keep-alive connections so requests after the first skip the TCP and TLS handshakes
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=max_connections))
+        self.session = session
+        
+        # aiohttp session of the async methods, created lazily since it belongs to the running event loop
+        self.max_connections = max_connections
+        self._aio_session = None
+        self._aio_loop = None
+    
+    def _message_payload(self, prompt: str, system_prompt: Optional[str],
+                         temperature: float, max_tokens: int) -> Dict[str, Any]:
+        """Build the Messages API request body of a prompt."""
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        
+        if system_prompt:
+            payload["system"] = system_prompt
+        
+        return payload
     
     def generate_response(self, 
                           prompt: str, 
@@ -265,91 +492,291 @@ class ClaudeInterface:
         Returns:
             Dictionary containing the model's response and metadata
         """
-        payload = {
-            "model": self.model,
-            "messages": [
-                {"role": "user", "content": prompt}
-            ],
-            "max_tokens": max_tokens,
-            "temperature": temperature
-        }
+        payload = self._message_payload(prompt, system_prompt, temperature, max_tokens)
+        return self._format_message(_loads(self._request("post", self.base_url, json=payload).content))
+    
+    async def agenerate_response(self, 
+                                 prompt: str, 
+                                 system_prompt: Optional[str] = None,
+                                 temperature: float = 0.0,
+                                 max_tokens: int = 4000,
+                                 **kwargs) -> Dict[str, Any]:
+        """
+        Generate a response from Claude without blocking the event loop.
+        With aiohttp installed the request is sent on the event loop itself, so
+        many requests can be in flight without a thread each; otherwise
+        generate_response runs in the event loop's default executor.
         
-        if system_prompt:
-            payload["system"] = system_prompt
+        Args:
+            prompt: The user message to send to Claude
+            system_prompt: Optional system prompt to set context
+            temperature: Sampling temperature (0.0 for most deterministic)
+            max_tokens: Maximum tokens in the response
+            **kwargs: Additional arguments (ignored in this method)
+            
+        Returns:
+            Dictionary containing the model's response and metadata
+        """
+        if aiohttp is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, functools.partial(
+                self.generate_response, prompt, system_prompt, temperature, max_tokens))
         
-        try:
-            response = requests.post(
-                self.base_url,
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
+        payload = self._message_payload(prompt, system_prompt, temperature, max_tokens)
+        return self._format_message(await self._arequest(self.base_url, payload))
+    
+    def _get_aio_session(self) -> 'aiohttp.ClientSession':
+        """Return the aiohttp session of the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._aio_session is None or self._aio_session.closed or self._aio_loop is not loop:
+            self._aio_session = aiohttp.ClientSession(
+                headers=self.headers, connector=aiohttp.TCPConnector(limit=self.max_connections))
+            self._aio_loop = loop
+        return self._aio_session
+    
+    async def _arequest(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST a request to the Claude API with aiohttp, converting HTTP failures into readable errors.
+        
+        Args:
+            url: API endpoint to call
+            payload: JSON request body
             
-            result = response.json()
+        Returns:
+            The decoded JSON response
+        """
+        try:
+            async with self._get_aio_session().post(url, json=payload) as response:
+                content = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Error calling Claude API: {e}")
+        
+        if response.status >= 400:
+            try:
+                error_data = _loads(content)
+                error_msg = f"API Error: {error_data.get('error', {}).get('message', response.reason)}"
+            except (ValueError, AttributeError):  # Not a JSON error object
+                error_msg = f"API Error: {content.decode('utf-8', 'replace')}"
+            raise Exception(error_msg)
+        
+        return _loads(content)
+    
+    async def aclose(self):
+        """Close the aiohttp session of the async methods, if one was opened."""
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+            self._aio_loop = None
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request to the Claude API, converting HTTP failures into readable errors.
+        
+        Args:
+            method: HTTP method to use
+            url: API endpoint to call
+            **kwargs: Additional arguments to pass to requests
             
-            return {
-                "response_text": result["content"][0]["text"],
-                "model": self.model,
-                "usage": result.get("usage", {}),
-                "id": result.get("id"),
-                "type": result.get("type"),
-                "role": result.get("role"),
-                "stop_reason": result.get("stop_reason"),
-                "stop_sequence": result.get("stop_sequence")
-            }
+        Returns:
+            The successful HTTP response
+        """
+        try:
+            response = self.session.request(method, url, headers=self.headers, **kwargs)
+            response.raise_for_status()
+            return response
         
         except requests.exceptions.RequestException as e:
             error_msg = f"Error calling Claude API: {e}"
             if hasattr(e, 'response') and e.response is not None:
                 try:
-                    error_data = e.response.json()
+                    error_data = _loads(e.response.content)
                     error_msg = f"API Error: {error_data.get('error', {}).get('message', str(e))}"
                 except:
                     error_msg = f"API Error: {e.response.text}"
             
             raise Exception(error_msg)
     
+    def _format_message(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a Messages API message into the response dictionary returned by generate_response.
+        
+        Args:
+            result: Message object returned by the API
+            
+        Returns:
+            Dictionary containing the model's response and metadata
+        """
+        return {
+            "response_text": result["content"][0]["text"],
+            "model": self.model,
+            "usage": result.get("usage", {}),
+            "id": result.get("id"),
+            "type": result.get("type"),
+            "role": result.get("role"),
+            "stop_reason": result.get("stop_reason"),
+            "stop_sequence": result.get("stop_sequence")
+        }
+    
+    def generate_message_batch(self, 
+                               batch_requests: List[Dict[str, Any]],
+                               poll_interval: float = 10.0) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate responses for many prompts with a single Message Batches API job.
+        Batched requests cost half as much as realtime calls and are not subject
+        to the per-minute rate limits, at the cost of waiting for the whole job.
+        
+        Args:
+            batch_requests: Requests to submit, each with a "custom_id" and a "prompt",
+                plus optional "system_prompt", "temperature" and "max_tokens"
+            poll_interval: Seconds to wait between checks of the job's status
+            
+        Returns:
+            Dictionary mapping each custom_id to its response dictionary, or to a
+            dictionary with an "error" if the request did not succeed
+        """
+        batch_payload = []
+        for request in batch_requests:
+            params = {
+                "model": self.model,
+                "messages": [
+                    {"role": "user", "content": request["prompt"]}
+                ],
+                "max_tokens": request.get("max_tokens", 4000),
+                "temperature": request.get("temperature", 0.0)
+            }
+            if request.get("system_prompt"):
+                params["system"] = request["system_prompt"]
+            batch_payload.append({"custom_id": request["custom_id"], "params": params})
+        
+        batch = _loads(self._request("post", self.batches_url, json={"requests": batch_payload}).content)
+        while batch["processing_status"] != "ended":
+            time.sleep(poll_interval)
+            batch = _loads(self._request("get", f"{self.batches_url}/{batch['id']}").content)
+        
+        # Results are JSON Lines, one entry per request in no particular order
+        results = {}
+        for line in self._request("get", batch["results_url"], stream=True).iter_lines():
+            if not line:
+                continue
+            entry = _loads(line)
+            result = entry["result"]
+            if result["type"] == "succeeded":
+                results[entry["custom_id"]] = self._format_message(result["message"])
+            else:
+                # Errored, canceled and expired requests carry no message
+                results[entry["custom_id"]] = {"error": f"Batch request {result['type']}: {result.get('error', {})}"}
+        
+        return results
+    
     def generate_batch_responses(self, 
                                 prompts: List[str], 
                                 system_prompt: Optional[str] = None,
                                 temperature: float = 0.0,
                                 max_tokens: int = 4000,
+                                concurrency: int = 8,
+                                rate_limiter: Optional[RateLimiter] = None,
                                 **kwargs) -> List[Dict[str, Any]]:
         """
         Generate responses for multiple prompts.
+        The requests are network-bound, so they are sent from a thread pool over
+        the interface's pooled session, paced by a rate limiter instead of a
+        fixed delay between requests.
         
         Args:
             prompts: List of user messages to send to Claude
             system_prompt: Optional system prompt to set context
             temperature: Sampling temperature
             max_tokens: Maximum tokens in each response
+            concurrency: Maximum number of requests in flight at once
+            rate_limiter: Rate limiter pacing the requests (optional); defaults to
+                one configured from the ANTHROPIC_RPM and ANTHROPIC_TPM environment
+                variables, if they are set
             **kwargs: Additional arguments (ignored in this method)
             
         Returns:
-            List of dictionaries containing the model's responses and metadata
+            List of dictionaries containing the model's responses and metadata,
+            in the order of the prompts
         """
-        results = []
+        if rate_limiter is None:
+            rate_limiter = RateLimiter.from_env()
         
-        for i, prompt in enumerate(prompts):
+        def process(i: int, prompt: str) -> Dict[str, Any]:
             try:
-                print(f"Processing prompt {i+1}/{len(prompts)}...")
-                result = self.generate_response(
+                if rate_limiter is not None:
+                    rate_limiter.acquire_blocking(estimate_tokens(prompt + (system_prompt or ""), max_tokens))
+                logger.info("Processing prompt %d/%d...", i + 1, len(prompts))
+                return self.generate_response(
                     prompt=prompt,
                     system_prompt=system_prompt,
                     temperature=temperature,
                     max_tokens=max_tokens
                 )
-                results.append(result)
-                
-                # Add a small delay to avoid rate limiting
-                if i < len(prompts) - 1:
-                    time.sleep(0.5)
             
             except Exception as e:
-                print(f"Error processing prompt {i+1}: {e}")
-                results.append({"error": str(e), "prompt": prompt})
+                logger.warning("Error processing prompt %d: %s", i + 1, e)
+                return {"error": str(e), "prompt": prompt}
         
-        return results
+        if not prompts:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(prompts))) as executor:
+            futures = [executor.submit(process, i, prompt) for i, prompt in enumerate(prompts)]
+            return [future.result() for future in futures]
+    
+    async def agenerate_batch_responses(self, 
+                                        prompts: List[str], 
+                                        system_prompt: Optional[str] = None,
+                                        temperature: float = 0.0,
+                                        max_tokens: int = 4000,
+                                        concurrency: int = 32,
+                                        rate_limiter: Optional[RateLimiter] = None,
+                                        **kwargs) -> List[Dict[str, Any]]:
+        """
+        Generate responses for multiple prompts concurrently on the event loop.
+        This suits large batches better than generate_batch_responses, since
+        in-flight requests do not each occupy a thread when aiohttp is installed.
+        
+        Args:
+            prompts: List of user messages to send to Claude
+            system_prompt: Optional system prompt to set context
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in each response
+            concurrency: Maximum number of requests in flight at once
+            rate_limiter: Rate limiter pacing the requests (optional); defaults to
+                one configured from the ANTHROPIC_RPM and ANTHROPIC_TPM environment
+                variables, if they are set
+            **kwargs: Additional arguments (ignored in this method)
+            
+        Returns:
+            List of dictionaries containing the model's responses and metadata,
+            in the order of the prompts
+        """
+        if rate_limiter is None:
+            rate_limiter = RateLimiter.from_env()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def process(i: int, prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    if rate_limiter is not None:
+                        await rate_limiter.acquire(estimate_tokens(prompt + (system_prompt or ""), max_tokens))
+                    return await self.agenerate_response(
+                        prompt=prompt,
+                        system_prompt=system_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    )
+                
+                except Exception as e:
+                    logger.warning("Error processing prompt %d: %s", i + 1, e)
+                    return {"error": str(e), "prompt": prompt}
+        
+        return list(await asyncio.gather(*(process(i, prompt) for i, prompt in enumerate(prompts))))
+
+
+def _without_custom_id(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the generate_response arguments of a batch request."""
+    return {key: value for key, value in request.items() if key != "custom_id"}
 
 
 class LLMInterface:
@@ -357,12 +784,14 @@ class LLMInterface:
     General interface for interacting with different LLM providers.
     """
     
-    def __init__(self, provider: str = "mock", **kwargs):
+    def __init__(self, provider: str = "mock", cache_dir: Optional[str] = None, **kwargs):
         """
         Initialize the LLM interface.
         
         Args:
             provider: LLM provider to use ('claude' or 'mock')
+            cache_dir: Directory of a persistent response cache (optional); when
+                given, responses are reused for identical requests across runs
             **kwargs: Additional arguments to pass to the provider's interface
         """
         self.provider = provider.lower()
@@ -373,10 +802,31 @@ class LLMInterface:
             self.interface = MockLLMInterface(**kwargs)
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
+        
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+    
+    def _cache_key(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
+        """Return the response cache key of a request."""
+        return ResponseCache.make_key(self.interface.model, system_prompt, prompt)
+    
+    def cached_response(self, prompt: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Look up the cached response to a request without calling the LLM.
+        
+        Args:
+            prompt: The user message to send to the LLM
+            **kwargs: Additional arguments to pass to the provider's interface
+            
+        Returns:
+            The cached response, or None if there is none or caching is disabled
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get(self._cache_key(prompt, **kwargs))
     
     def generate_response(self, prompt: str, **kwargs) -> Dict[str, Any]:
         """
-        Generate a response from the LLM.
+        Generate a response from the LLM, reusing the cached response if there is one.
         
         Args:
             prompt: The user message to send to the LLM
@@ -385,7 +835,43 @@ class LLMInterface:
         Returns:
             Dictionary containing the model's response and metadata
         """
-        return self.interface.generate_response(prompt, **kwargs)
+        if self.cache is None:
+            return self.interface.generate_response(prompt, **kwargs)
+        
+        key = self._cache_key(prompt, **kwargs)
+        response = self.cache.get(key)
+        if response is None:
+            response = self.interface.generate_response(prompt, **kwargs)
+            self.cache.set(key, response)
+        return response
+    
+    async def agenerate_response(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """
+        Generate a response from the LLM without blocking the event loop.
+        Providers with a native async method are awaited directly; for the
+        others the request runs in the event loop's default executor. Either
+        way, many calls can be awaited concurrently.
+        
+        Args:
+            prompt: The user message to send to the LLM
+            **kwargs: Additional arguments to pass to the provider's interface
+            
+        Returns:
+            Dictionary containing the model's response and metadata
+        """
+        if not hasattr(self.interface, "agenerate_response"):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, functools.partial(self.generate_response, prompt, **kwargs))
+        
+        if self.cache is None:
+            return await self.interface.agenerate_response(prompt, **kwargs)
+        
+        key = self._cache_key(prompt, **kwargs)
+        response = self.cache.get(key)
+        if response is None:
+            response = await self.interface.agenerate_response(prompt, **kwargs)
+            self.cache.set(key, response)
+        return response
     
     def generate_batch_responses(self, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
         """
@@ -398,4 +884,54 @@ class LLMInterface:
         Returns:
             List of dictionaries containing the model's responses and metadata
         """
-        return self.interface.generate_batch_responses(prompts, **kwargs) 
\ No newline at end of file
+        return self.interface.generate_batch_responses(prompts, **kwargs)
+    
+    def generate_message_batch(self, batch_requests: List[Dict[str, Any]], **kwargs) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate responses for many prompts as a single batch job.
+        Providers without a batch API answer each request directly.
+        
+        Args:
+            batch_requests: Requests to submit, each with a "custom_id" and a "prompt"
+                plus any keyword arguments for generate_response
+            **kwargs: Additional arguments to pass to the provider's batch method
+            
+        Returns:
+            Dictionary mapping each custom_id to its response dictionary, or to a
+            dictionary with an "error" if the request did not succeed
+        """
+        results = {}
+        
+        # Only submit the requests the cache cannot answer
+        if self.cache is not None:
+            pending = []
+            for request in batch_requests:
+                response = self.cached_response(**_without_custom_id(request))
+                if response is None:
+                    pending.append(request)
+                else:
+                    results[request["custom_id"]] = response
+            batch_requests = pending
+        
+        if not hasattr(self.interface, "generate_message_batch"):
+            for request in batch_requests:
+                try:
+                    results[request["custom_id"]] = self.generate_response(**_without_custom_id(request))
+                except Exception as e:
+                    results[request["custom_id"]] = {"error": str(e)}
+            return results
+        
+        if batch_requests:
+            batch_results = self.interface.generate_message_batch(batch_requests, **kwargs)
+            if self.cache is not None:
+                for request in batch_requests:
+                    response = batch_results.get(request["custom_id"])
+                    if response is not None and "error" not in response:
+                        self.cache.set(self._cache_key(**_without_custom_id(request)), response)
+            results.update(batch_results)
+        return results
+    
+    async def aclose(self):
+        """Release the resources of the provider's async methods, if it has any."""
+        if hasattr(self.interface, "aclose"):
+            await self.interface.aclose()
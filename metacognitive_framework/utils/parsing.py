@@ -4,45 +4,376 @@ Parsing Utilities - Functions for parsing and analyzing LLM responses.
 
 import re
 import json
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Dict, List, Any, Tuple, Optional
 import numpy as np
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to per-sentence substring scans
+    ahocorasick = None
 
-def extract_reasoning_steps(text: str) -> List[str]:
+# Patterns shared by the parsers, compiled once at import
+_MAX_CACHED_TEXT_LENGTH = 50_000  # Longer texts bypass the parse caches, so they cannot crowd them
+
+_SENT_END = re.compile(r'[.!?]\s+')  # Sentence terminators and the whitespace after them
+_NUMBERED = re.compile(r'(?:step\s*)?(\d+)[\.:\)]', re.IGNORECASE)  # Numbered steps: "1.", "2.", "Step 1:", etc.
+_CITATION = re.compile(r'(?:according to|cited in|reference|source|reported by)', re.IGNORECASE)
+_CONDITIONAL = re.compile(r'(?:if|when|assuming|given that|provided that|suppose)', re.IGNORECASE)
+_CAUSAL = re.compile(r'(?:because|therefore|thus|as a result|consequently|hence|due to)', re.IGNORECASE)
+
+# Explicit step markers, and the pattern splitting a response on them
+_STEP_MARKERS = ("first", "second", "third", "fourth", "fifth", "step 1", "step 2", "next", "finally")
+_STEP_MARKER_SPLIT = re.compile(r'(?:{})[,:]'.format('|'.join(_STEP_MARKERS)), re.IGNORECASE)
+
+# Confidence phrases and their approximate probability values
+_CONFIDENCE_MAPPING = {
+    "certain": 0.95,
+    "confident": 0.9,
+    "very likely": 0.85,
+    "highly likely": 0.85,
+    "quite likely": 0.8,
+    "likely": 0.75,
+    "probable": 0.7,
+    "probably": 0.7,
+    "possibly": 0.5,
+    "might": 0.4,
+    "may": 0.4,
+    "uncertain": 0.3,
+    "unlikely": 0.25,
+    "doubtful": 0.2,
+    "highly unlikely": 0.15,
+    "very unlikely": 0.15,
+    "improbable": 0.1,
+    "impossible": 0.05
+}
+
+# Priority of each confidence phrase when a sentence contains several
+_CONFIDENCE_PRIORITY = {phrase: i for i, phrase in enumerate(_CONFIDENCE_MAPPING)}
+
+# Explicit probabilities and confidence phrases in one alternation. Phrases are
+# tried longest first, so "highly unlikely" is matched whole rather than as "unlikely"
+_CONFIDENCE_EXPRESSION = re.compile(
+    r'(?P<percentage>\d{1,2}(?:\.\d+)?)\s*%|\b(?P<phrase>' +
+    '|'.join(re.escape(phrase) for phrase in sorted(_CONFIDENCE_MAPPING, key=len, reverse=True)) +
+    r')\b',
+    re.IGNORECASE
+)
+
+# Markers of self-corrections
+_CORRECTION_MARKERS = (
+    "correction", "I made a mistake", "let me correct", "that's incorrect",
+    "I should clarify", "to be precise", "more accurately", "I misstated",
+    "actually", "wait", "on second thought", "let me reconsider",
+    "I need to revise", "let me verify", "checking my reasoning"
+)
+
+# Markers of verification attempts
+_VERIFICATION_MARKERS = (
+    "to verify", "checking", "to confirm", "let's check", "to validate",
+    "fact-check", "double-check", "cross-reference", "to ensure accuracy",
+    "let me verify", "to make sure", "confirm this", "validate this"
+)
+
+# Phrases acknowledging knowledge boundaries, most frequently matched first so
+# that scans of typical refusals stop early
+_BOUNDARY_PHRASES = (
+    "I don't have", "beyond my knowledge", "I can't", "I cannot", "I don't know",
+    "I'm not sure", "uncertain", "don't have information", "after my training",
+    "unable to provide", "outside my training", "don't have enough",
+    "not enough information", "don't have access", "don't have data",
+    "unable to verify", "would need to", "lack the necessary"
+)
+
+# Lowercased copies of the marker lists, for the substring scans
+_CORRECTION_MARKERS_LOWER = tuple(marker.lower() for marker in _CORRECTION_MARKERS)
+_VERIFICATION_MARKERS_LOWER = tuple(marker.lower() for marker in _VERIFICATION_MARKERS)
+_BOUNDARY_PHRASES_LOWER = tuple(phrase.lower() for phrase in _BOUNDARY_PHRASES)
+
+# Length of the shortest marker; shorter sentences cannot contain any marker
+_SHORTEST_MARKER = min(map(len, _CORRECTION_MARKERS_LOWER + _VERIFICATION_MARKERS_LOWER + _BOUNDARY_PHRASES_LOWER))
+
+
+def _build_automaton(markers: Tuple[str, ...]):
     """
-    Extract reasoning steps from an LLM response.
+    Build an Aho-Corasick automaton matching a list of markers case-insensitively.
+    
+    Args:
+        markers: Markers to match, in priority order
+        
+    Returns:
+        The automaton, whose values are (priority, marker) pairs, or None if
+        pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for i, marker in enumerate(markers):
+        automaton.add_word(marker.lower(), (i, marker))
+    automaton.make_automaton()
+    return automaton
+
+
+# Automata scanning a whole response for each marker list at once
+_CORRECTION_AUTOMATON = _build_automaton(_CORRECTION_MARKERS)
+_VERIFICATION_AUTOMATON = _build_automaton(_VERIFICATION_MARKERS)
+_BOUNDARY_AUTOMATON = _build_automaton(_BOUNDARY_PHRASES)
+
+
+def _split_sentences_fast(text: str) -> Tuple[str, ...]:
+    """
+    Split a response into sentences at whitespace following a terminator, as
+    re.split(r'(?<=[.!?])\s+', text) does. Scanning for the terminators instead
+    of testing a lookbehind at every position lets the regex engine skip ahead
+    to the next candidate, which roughly halves the time on ordinary prose.
     
     Args:
         text: LLM response text
         
     Returns:
-        List of reasoning steps
+        The sentences of the response
+    """
+    sentences = []
+    start = 0
+    for match in _SENT_END.finditer(text):
+        sentences.append(text[start:match.start() + 1])  # Keep the terminator
+        start = match.end()
+    sentences.append(text[start:])
+    return tuple(sentences)
+
+
+@lru_cache(maxsize=256)
+def _split_sentences_cached(text: str) -> Tuple[str, ...]:
+    """Memoized _split_sentences_fast."""
+    return _split_sentences_fast(text)
+
+
+def _split_sentences(text: str) -> Tuple[str, ...]:
+    """
+    Split a response into sentences, memoized so the parsers share one split per text.
+    
+    Args:
+        text: LLM response text
+        
+    Returns:
+        The sentences of the response
+    """
+    if len(text) > _MAX_CACHED_TEXT_LENGTH:
+        return _split_sentences_fast(text)
+    return _split_sentences_cached(text)
+
+
+def _match_confidence(sentence: str) -> Optional[Dict[str, Any]]:
+    """
+    Match the confidence expression of a sentence in a single scan. An explicit
+    probability takes precedence over confidence phrases; among phrases, the
+    one listed first in the confidence mapping wins.
+    
+    Args:
+        sentence: Sentence to scan
+        
+    Returns:
+        Dictionary with the confidence statement and metadata, or None if the
+        sentence expresses no confidence
+    """
+    best_phrase = None
+    for match in _CONFIDENCE_EXPRESSION.finditer(sentence):
+        # Check for explicit probability statements
+        if match.group('percentage') is not None:
+            prob_value = float(match.group('percentage')) / 100
+            return {
+                "text": sentence,
+                "confidence_type": "explicit_percentage",
+                "confidence_value": prob_value,
+                "confidence_phrase": match.group(0)
+            }
+        
+        # Keep the highest-priority confidence phrase
+        phrase = match.group('phrase').lower()
+        if best_phrase is None or _CONFIDENCE_PRIORITY[phrase] < _CONFIDENCE_PRIORITY[best_phrase]:
+            best_phrase = phrase
+    
+    if best_phrase is None:
+        return None
+    
+    return {
+        "text": sentence,
+        "confidence_type": "verbal_expression",
+        "confidence_value": _CONFIDENCE_MAPPING[best_phrase],
+        "confidence_phrase": best_phrase
+    }
+
+
+def _first_marker(sentence_lower: str, markers: Tuple[str, ...],
+                  markers_lower: Tuple[str, ...]) -> Optional[str]:
+    """
+    Find the first of a list of markers occurring in a sentence.
+    
+    Args:
+        sentence_lower: Lowercased sentence to scan
+        markers: Markers to look for, in priority order
+        markers_lower: Lowercased copies of the markers, in the same order
+        
+    Returns:
+        The first marker found, or None
+    """
+    for marker, marker_lower in zip(markers, markers_lower):
+        if marker_lower in sentence_lower:
+            return marker
+    return None
+
+
+def _first_markers_per_sentence(automaton, markers: Tuple[str, ...], text_lower: str,
+                                sentence_starts: List[int]) -> List[Optional[str]]:
+    """
+    Find the first marker of each sentence with a single automaton pass over the
+    whole response, mapping each match back to its sentence by offset.
+    
+    Args:
+        automaton: Automaton built by _build_automaton for the markers
+        markers: Markers to look for, in priority order
+        text_lower: Lowercased response text
+        sentence_starts: Offset of each sentence in text_lower
+        
+    Returns:
+        For each sentence, the highest-priority marker it contains, or None
+    """
+    best = [len(markers)] * len(sentence_starts)
+    for end, (priority, _) in automaton.iter(text_lower):
+        sentence = bisect_right(sentence_starts, end) - 1
+        if priority < best[sentence]:
+            best[sentence] = priority
+    return [markers[priority] if priority < len(markers) else None for priority in best]
+
+
+def _scan_sentences(text: str, confidence: bool = True, corrections: bool = True,
+                    verifications: bool = True, boundaries: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Run the sentence-level scanners over a response in a single pass, splitting
+    and lowercasing the text once for all of them. Marker lists are matched with
+    Aho-Corasick automata when pyahocorasick is installed, and with substring
+    scans of each sentence otherwise.
+    
+    Args:
+        text: LLM response text
+        confidence: Whether to extract confidence statements
+        corrections: Whether to extract self-corrections
+        verifications: Whether to extract verification attempts
+        boundaries: Whether to extract knowledge boundary statements
+        
+    Returns:
+        Dictionary mapping "confidence_statements", "self_corrections",
+        "verification_attempts" and "unanswerable_elements" to the statements found
+        (empty for the scanners not run)
     """
-    # Pattern for numbered steps: "1.", "2.", "Step 1:", etc.
-    numbered_pattern = r'(?:step\s*)?(\d+)[\.:\)]'
+    sentences = _split_sentences(text)
+    num_sentences = len(sentences)
+    confidence_statements = []
+    self_corrections = []
+    verification_attempts = []
+    boundary_statements = []
     
-    # Look for explicit step markers
-    step_markers = ["first", "second", "third", "fourth", "fifth", "step 1", "step 2", "next", "finally"]
+    # Find the first marker of every sentence for each marker list up front
+    if ahocorasick is not None:
+        text_lower = text.lower()
+        # Lowercasing never touches the punctuation and whitespace the splitter
+        # matches, so the lowercased text splits into the same sentences
+        sentence_starts = [0] + [match.end() for match in _SENT_END.finditer(text_lower)]
+        
+        def find_markers(automaton, markers, markers_lower):
+            return _first_markers_per_sentence(automaton, markers, text_lower, sentence_starts)
+    else:
+        # Sentences too short to hold a marker are not lowercased or scanned
+        sentences_lower = [sentence.lower() if len(sentence) >= _SHORTEST_MARKER else None for sentence in sentences]
+        
+        def find_markers(automaton, markers, markers_lower):
+            return [_first_marker(sentence_lower, markers, markers_lower) if sentence_lower is not None else None
+                    for sentence_lower in sentences_lower]
     
-    # Try to find numbered steps
-    matches = re.finditer(numbered_pattern, text, re.IGNORECASE)
-    matches = list(matches)
+    correction_markers = (find_markers(_CORRECTION_AUTOMATON, _CORRECTION_MARKERS, _CORRECTION_MARKERS_LOWER)
+                          if corrections else [])
+    verification_markers = (find_markers(_VERIFICATION_AUTOMATON, _VERIFICATION_MARKERS, _VERIFICATION_MARKERS_LOWER)
+                            if verifications else [])
+    boundary_phrases = (find_markers(_BOUNDARY_AUTOMATON, _BOUNDARY_PHRASES, _BOUNDARY_PHRASES_LOWER)
+                        if boundaries else [])
+    
+    for i, sentence in enumerate(sentences):
+        if confidence:
+            statement = _match_confidence(sentence)
+            if statement is not None:
+                confidence_statements.append(statement)
+        
+        if corrections:
+            marker = correction_markers[i]
+            if marker is not None:
+                # Try to identify what was corrected by looking at previous sentences
+                self_corrections.append({
+                    "text": sentence,
+                    "correction_marker": marker,
+                    "previous_context": " ".join(sentences[max(0, i-2):i]) if i > 0 else "",
+                    "position_in_response": i / num_sentences  # Normalized position
+                })
+        
+        if verifications:
+            marker = verification_markers[i]
+            if marker is not None:
+                # Try to identify what is being verified
+                verification_attempts.append({
+                    "text": sentence,
+                    "verification_marker": marker,
+                    "next_context": " ".join(sentences[i+1:i+3]) if i < num_sentences - 1 else "",
+                    "position_in_response": i / num_sentences  # Normalized position
+                })
+        
+        if boundaries:
+            phrase = boundary_phrases[i]
+            if phrase is not None:
+                # Try to identify what is unknown
+                boundary_statements.append({
+                    "text": sentence,
+                    "boundary_phrase": phrase,
+                    "previous_context": " ".join(sentences[max(0, i-1):i]) if i > 0 else "",
+                    "position_in_response": i / num_sentences  # Normalized position
+                })
     
-    if matches:
-        steps = []
-        for i, match in enumerate(matches):
-            start_idx = match.start()
-            end_idx = matches[i+1].start() if i < len(matches) - 1 else len(text)
-            step_text = text[start_idx:end_idx].strip()
-            steps.append(step_text)
+    return {
+        "confidence_statements": confidence_statements,
+        "self_corrections": self_corrections,
+        "verification_attempts": verification_attempts,
+        "unanswerable_elements": boundary_statements
+    }
+
+
+def _extract_steps(text: str) -> List[str]:
+    """
+    Extract reasoning steps from an LLM response.
+    
+    Args:
+        text: LLM response text
+        
+    Returns:
+        List of reasoning steps
+    """
+    # Try to find numbered steps; each step runs up to the start of the next one
+    steps = []
+    prev_start = None
+    for match in _NUMBERED.finditer(text):
+        if prev_start is not None:
+            steps.append(text[prev_start:match.start()].strip())
+        prev_start = match.start()
+    
+    if prev_start is not None:
+        steps.append(text[prev_start:].strip())
         return steps
     
     # Try to find steps marked with step markers
-    for marker in step_markers:
-        if f"{marker}," in text.lower() or f"{marker}:" in text.lower():
+    text_lower = text.lower()
+    for marker in _STEP_MARKERS:
+        if f"{marker}," in text_lower or f"{marker}:" in text_lower:
             # Split by markers
-            pattern = r'(?:{})[,:]'.format('|'.join(step_markers))
-            parts = re.split(pattern, text, flags=re.IGNORECASE)
+            parts = _STEP_MARKER_SPLIT.split(text)
             if len(parts) > 1:
                 return [part.strip() for part in parts[1:]]  # Skip the first part (before any marker)
     
@@ -51,75 +382,60 @@ def extract_reasoning_steps(text: str) -> List[str]:
     if len(paragraphs) > 1:
         return paragraphs
     
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _split_sentences(text)
     if len(sentences) > 1:
-        return sentences
+        return list(sentences)
     
     # Fallback: just return the whole text as one step
     return [text]
 
 
-def extract_confidence_statements(text: str) -> List[Dict[str, Any]]:
+@lru_cache(maxsize=256)
+def _extract_steps_cached(text: str) -> Tuple[str, ...]:
+    """Memoized _extract_steps, as a tuple so callers cannot modify the cached steps."""
+    return tuple(_extract_steps(text))
+
+
+def _reasoning_steps(text: str) -> Tuple[str, ...]:
     """
-    Extract confidence statements and uncertainty expressions from an LLM response.
+    Extract the reasoning steps of a response, memoized so that analyzing a
+    response after extracting its steps does not parse it again.
     
     Args:
         text: LLM response text
         
     Returns:
-        List of dictionaries with confidence statements and metadata
+        The reasoning steps of the response
     """
-    # Confidence phrases and their approximate probability values
-    confidence_mapping = {
-        "certain": 0.95,
-        "confident": 0.9,
-        "very likely": 0.85,
-        "highly likely": 0.85,
-        "quite likely": 0.8,
-        "likely": 0.75,
-        "probable": 0.7,
-        "probably": 0.7,
-        "possibly": 0.5,
-        "might": 0.4,
-        "may": 0.4,
-        "uncertain": 0.3,
-        "unlikely": 0.25,
-        "doubtful": 0.2,
-        "highly unlikely": 0.15,
-        "very unlikely": 0.15,
-        "improbable": 0.1,
-        "impossible": 0.05
-    }
-    
-    # Sentences with confidence expressions
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    confidence_statements = []
+    if len(text) > _MAX_CACHED_TEXT_LENGTH:
+        return tuple(_extract_steps(text))
+    return _extract_steps_cached(text)
+
+
+def extract_reasoning_steps(text: str) -> List[str]:
+    """
+    Extract reasoning steps from an LLM response.
     
-    for sentence in sentences:
-        # Check for explicit probability statements
-        probability_match = re.search(r'(\d{1,2}(?:\.\d+)?)\s*%', sentence)
-        if probability_match:
-            prob_value = float(probability_match.group(1)) / 100
-            confidence_statements.append({
-                "text": sentence,
-                "confidence_type": "explicit_percentage",
-                "confidence_value": prob_value,
-                "confidence_phrase": probability_match.group(0)
-            })
-            continue
+    Args:
+        text: LLM response text
         
-        # Check for confidence phrases
-        for phrase, value in confidence_mapping.items():
-            if re.search(r'\b' + re.escape(phrase) + r'\b', sentence, re.IGNORECASE):
-                confidence_statements.append({
-                    "text": sentence,
-                    "confidence_type": "verbal_expression",
-                    "confidence_value": value,
-                    "confidence_phrase": phrase
-                })
-                break
+    Returns:
+        List of reasoning steps
+    """
+    return list(_reasoning_steps(text))
+
+
+def extract_confidence_statements(text: str) -> List[Dict[str, Any]]:
+    """
+    Extract confidence statements and uncertainty expressions from an LLM response.
     
-    return confidence_statements
+    Args:
+        text: LLM response text
+        
+    Returns:
+        List of dictionaries with confidence statements and metadata
+    """
+    return _scan_sentences(text, corrections=False, verifications=False, boundaries=False)["confidence_statements"]
 
 
 def extract_self_corrections(text: str) -> List[Dict[str, Any]]:
@@ -132,31 +448,24 @@ def extract_self_corrections(text: str) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries with self-correction statements and metadata
     """
-    correction_markers = [
-        "correction", "I made a mistake", "let me correct", "that's incorrect",
-        "I should clarify", "to be precise", "more accurately", "I misstated",
-        "actually", "wait", "on second thought", "let me reconsider",
-        "I need to revise", "let me verify", "checking my reasoning"
-    ]
-    
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    corrections = []
-    
-    for i, sentence in enumerate(sentences):
-        for marker in correction_markers:
-            if marker.lower() in sentence.lower():
-                # Try to identify what was corrected by looking at previous sentences
-                prev_context = " ".join(sentences[max(0, i-2):i]) if i > 0 else ""
-                
-                corrections.append({
-                    "text": sentence,
-                    "correction_marker": marker,
-                    "previous_context": prev_context,
-                    "position_in_response": i / len(sentences)  # Normalized position
-                })
-                break
+    return _scan_sentences(text, confidence=False, verifications=False, boundaries=False)["self_corrections"]
+
+
+@lru_cache(maxsize=32)
+def _compile_terms(terms: Tuple[str, ...]) -> re.Pattern:
+    """
+    Compile a case-insensitive alternation matching any of a list of terms as
+    whole words, longest terms first.
     
-    return corrections
+    Args:
+        terms: Terms to match
+        
+    Returns:
+        The compiled pattern
+    """
+    alternation = '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    # Use word boundaries to ensure we match whole terms
+    return re.compile(r'\b(?:' + alternation + r')\b', re.IGNORECASE)
 
 
 def extract_domain_terminology(text: str, domain_terms: Dict[str, List[str]]) -> Dict[str, List[str]]:
@@ -168,14 +477,28 @@ def extract_domain_terminology(text: str, domain_terms: Dict[str, List[str]]) ->
         domain_terms: Dictionary mapping domains to lists of domain-specific terms
         
     Returns:
-        Dictionary mapping domains to lists of found terms
+        Dictionary mapping domains to lists of found terms, each listed once
+        in the order of domain_terms
     """
     found_terms = {domain: [] for domain in domain_terms}
+    text_lower = text.lower()
     
     for domain, terms in domain_terms.items():
-        for term in terms:
-            # Use word boundaries to ensure we match whole terms
-            if re.search(r'\b' + re.escape(term) + r'\b', text, re.IGNORECASE):
+        if not terms:
+            continue
+        
+        # Scan the text once per domain for all of its terms; repeated terms are
+        # only looked up and reported once
+        unique_terms = tuple(dict.fromkeys(terms))
+        hits = {match.lower() for match in _compile_terms(unique_terms).findall(text)}
+        
+        for term in unique_terms:
+            term_lower = term.lower()
+            if term_lower in hits:
+                found_terms[domain].append(term)
+            # The alternation reports non-overlapping matches only, so a term
+            # overlapping another term's match is confirmed on its own
+            elif term_lower in text_lower and _compile_terms((term,)).search(text):
                 found_terms[domain].append(term)
     
     return found_terms
@@ -191,30 +514,7 @@ def extract_verification_attempts(text: str) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries with verification statements and metadata
     """
-    verification_markers = [
-        "to verify", "checking", "to confirm", "let's check", "to validate",
-        "fact-check", "double-check", "cross-reference", "to ensure accuracy",
-        "let me verify", "to make sure", "confirm this", "validate this"
-    ]
-    
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    verifications = []
-    
-    for i, sentence in enumerate(sentences):
-        for marker in verification_markers:
-            if marker.lower() in sentence.lower():
-                # Try to identify what is being verified
-                next_context = " ".join(sentences[i+1:i+3]) if i < len(sentences) - 1 else ""
-                
-                verifications.append({
-                    "text": sentence,
-                    "verification_marker": marker,
-                    "next_context": next_context,
-                    "position_in_response": i / len(sentences)  # Normalized position
-                })
-                break
-    
-    return verifications
+    return _scan_sentences(text, confidence=False, corrections=False, boundaries=False)["verification_attempts"]
 
 
 def identify_unanswerable_elements(text: str) -> List[Dict[str, Any]]:
@@ -227,32 +527,7 @@ def identify_unanswerable_elements(text: str) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries with knowledge boundary statements and metadata
     """
-    boundary_phrases = [
-        "I don't know", "I don't have", "I'm not sure", "I cannot", "I can't", 
-        "uncertain", "beyond my knowledge", "after my training", "unable to provide",
-        "don't have information", "don't have data", "don't have access",
-        "outside my training", "lack the necessary", "would need to",
-        "unable to verify", "don't have enough", "not enough information"
-    ]
-    
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    boundary_statements = []
-    
-    for i, sentence in enumerate(sentences):
-        for phrase in boundary_phrases:
-            if phrase.lower() in sentence.lower():
-                # Try to identify what is unknown
-                prev_context = " ".join(sentences[max(0, i-1):i]) if i > 0 else ""
-                
-                boundary_statements.append({
-                    "text": sentence,
-                    "boundary_phrase": phrase,
-                    "previous_context": prev_context,
-                    "position_in_response": i / len(sentences)  # Normalized position
-                })
-                break
-    
-    return boundary_statements
+    return _scan_sentences(text, confidence=False, corrections=False, verifications=False)["unanswerable_elements"]
 
 
 def analyze_reasoning_depth(text: str) -> Dict[str, Any]:
@@ -265,32 +540,49 @@ def analyze_reasoning_depth(text: str) -> Dict[str, Any]:
     Returns:
         Dictionary with reasoning analysis metrics
     """
-    steps = extract_reasoning_steps(text)
-    
-    # Calculate metrics
-    avg_step_length = np.mean([len(step) for step in steps]) if steps else 0
-    max_step_length = max([len(step) for step in steps]) if steps else 0
-    min_step_length = min([len(step) for step in steps]) if steps else 0
-    
-    # Look for evidence citations
-    citation_pattern = r'(?:according to|cited in|reference|source|reported by)'
-    citations = re.findall(citation_pattern, text, re.IGNORECASE)
-    
-    # Check for conditional statements
-    conditional_pattern = r'(?:if|when|assuming|given that|provided that|suppose)'
-    conditionals = re.findall(conditional_pattern, text, re.IGNORECASE)
-    
-    # Check for causal statements
-    causal_pattern = r'(?:because|therefore|thus|as a result|consequently|hence|due to)'
-    causals = re.findall(causal_pattern, text, re.IGNORECASE)
+    steps = _reasoning_steps(text)
+    
+    # Calculate metrics over the step lengths in one array
+    if steps:
+        lengths = np.fromiter(map(len, steps), dtype=np.int32, count=len(steps))
+        avg_step_length = float(lengths.mean())
+        max_step_length = int(lengths.max())
+        min_step_length = int(lengths.min())
+    else:
+        avg_step_length = max_step_length = min_step_length = 0
+    
+    # Count evidence citations, conditional statements and causal statements
+    # without building lists of the matches
+    num_citations = sum(1 for _ in _CITATION.finditer(text))
+    num_conditionals = sum(1 for _ in _CONDITIONAL.finditer(text))
+    num_causals = sum(1 for _ in _CAUSAL.finditer(text))
     
     return {
         "num_steps": len(steps),
         "avg_step_length": avg_step_length,
         "max_step_length": max_step_length,
         "min_step_length": min_step_length,
-        "num_citations": len(citations),
-        "num_conditionals": len(conditionals),
-        "num_causal_statements": len(causals),
-        "steps": steps
-    }
\ No newline at end of file
+        "num_citations": num_citations,
+        "num_conditionals": num_conditionals,
+        "num_causal_statements": num_causals,
+        "steps": list(steps)
+    }
+
+
+def analyze_response(text: str) -> Dict[str, Any]:
+    """
+    Run every sentence-level analysis of an LLM response at once. The sentence
+    scanners share a single pass over the sentences, rather than each
+    re-splitting and re-scanning the text as the individual functions do.
+    
+    Args:
+        text: LLM response text
+        
+    Returns:
+        Dictionary with the confidence statements, self-corrections, verification
+        attempts, knowledge boundary statements ("unanswerable_elements") and the
+        reasoning depth analysis ("reasoning_depth") of the response
+    """
+    results: Dict[str, Any] = _scan_sentences(text)
+    results["reasoning_depth"] = analyze_reasoning_depth(text)
+    return results
@@ -0,0 +1,144 @@
+"""
+Rate Limiter - Client-side request scheduling that keeps LLM API usage under its quotas.
+"""
+
+import os
+import time
+import asyncio
+import threading
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Token-bucket scheduler for APIs that enforce both a requests-per-minute and a
+    tokens-per-minute quota.
+    Each bucket holds up to one minute of capacity and refills continuously at
+    its per-minute limit; a request launches only once both buckets can cover it,
+    so the quota is never exceeded and no time is lost to 429 retries.
+    """
+    
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rpm: Maximum requests per minute, or None for no request limit
+            tpm: Maximum tokens per minute, or None for no token limit
+        """
+        if rpm is not None and rpm <= 0:
+            raise ValueError(f"Requests per minute must be positive, got {rpm}")
+        if tpm is not None and tpm <= 0:
+            raise ValueError(f"Tokens per minute must be positive, got {tpm}")
+        
+        self.rpm = rpm
+        self.tpm = tpm
+        self.available_request_capacity = float(rpm or 0)
+        self.available_token_capacity = float(tpm or 0)
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()  # Guards the buckets when shared by threads
+    
+    @classmethod
+    def from_env(cls) -> Optional['RateLimiter']:
+        """
+        Create a rate limiter from the ANTHROPIC_RPM and ANTHROPIC_TPM environment variables.
+        
+        Returns:
+            The rate limiter, or None if neither variable is set
+        """
+        rpm = os.environ.get("ANTHROPIC_RPM")
+        tpm = os.environ.get("ANTHROPIC_TPM")
+        if not rpm and not tpm:
+            return None
+        return cls(rpm=float(rpm) if rpm else None, tpm=float(tpm) if tpm else None)
+    
+    def _refill(self):
+        """Add the capacity accrued since the last update to both buckets."""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        
+        if self.rpm is not None:
+            self.available_request_capacity = min(self.rpm, self.available_request_capacity + elapsed * self.rpm / 60)
+        if self.tpm is not None:
+            self.available_token_capacity = min(self.tpm, self.available_token_capacity + elapsed * self.tpm / 60)
+    
+    def _try_reserve(self, est_tokens: int) -> float:
+        """
+        Reserve the capacity of one request if both buckets can cover it.
+        
+        Args:
+            est_tokens: Estimated number of tokens the request will consume
+        
+        Returns:
+            0 if the capacity was reserved, otherwise the number of seconds until
+            the emptier bucket should have refilled enough
+        """
+        with self._lock:
+            self._refill()
+            
+            request_shortfall = 1 - self.available_request_capacity if self.rpm is not None else 0
+            token_shortfall = est_tokens - self.available_token_capacity if self.tpm is not None else 0
+            
+            if request_shortfall <= 0 and token_shortfall <= 0:
+                if self.rpm is not None:
+                    self.available_request_capacity -= 1
+                if self.tpm is not None:
+                    self.available_token_capacity -= est_tokens
+                return 0.0
+        
+        wait = 0.0
+        if request_shortfall > 0:
+            wait = request_shortfall * 60 / self.rpm
+        if token_shortfall > 0:
+            wait = max(wait, token_shortfall * 60 / self.tpm)
+        return wait
+    
+    def _clamp_tokens(self, est_tokens: int) -> int:
+        """Clamp a token estimate to the bucket size, since a request larger than the whole bucket could never launch."""
+        return min(est_tokens, self.tpm) if self.tpm is not None else est_tokens
+    
+    async def acquire(self, est_tokens: int = 0):
+        """
+        Wait until the quotas allow one more request, then reserve its capacity.
+        
+        Args:
+            est_tokens: Estimated number of tokens the request will consume,
+                counting both the prompt and the maximum output
+        """
+        est_tokens = self._clamp_tokens(est_tokens)
+        while True:
+            wait = self._try_reserve(est_tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+    
+    def acquire_blocking(self, est_tokens: int = 0):
+        """
+        Block the calling thread until the quotas allow one more request, then
+        reserve its capacity. Safe to call from several threads at once.
+        
+        Args:
+            est_tokens: Estimated number of tokens the request will consume,
+                counting both the prompt and the maximum output
+        """
+        est_tokens = self._clamp_tokens(est_tokens)
+        while True:
+            wait = self._try_reserve(est_tokens)
+            if not wait:
+                return
+            time.sleep(wait)
+
+
+def estimate_tokens(prompt: str, max_output: int = 0) -> int:
+    """
+    Estimate the tokens a request will consume with the four-characters-per-token heuristic.
+    
+    Args:
+        prompt: The user message (plus any system prompt) to send
+        max_output: Maximum number of tokens in the response
+    
+    Returns:
+        Estimated number of input and output tokens
+    """
+    return len(prompt) // 4 + max_output
@@ -0,0 +1,95 @@
+"""
+Response Cache - Persistent cache of LLM responses, so reruns over the same prompts skip the API.
+"""
+
+import os
+import json
+import hashlib
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """
+    Cache of LLM response dictionaries keyed by model, system prompt and prompt.
+    Entries are stored in a SQLite database under the cache directory, with an
+    in-process dictionary in front of it so repeated lookups skip the database.
+    """
+    
+    # Name of the database file inside the cache directory
+    DB_FILENAME = "responses.sqlite3"
+    
+    def __init__(self, cache_dir: str = "data/llm_cache"):
+        """
+        Initialize the cache, creating its directory and database if needed.
+        
+        Args:
+            cache_dir: Directory holding the cache database
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        
+        # Responses are generated on executor threads, so the connection is shared under a lock
+        self._conn = sqlite3.connect(os.path.join(cache_dir, self.DB_FILENAME), check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)")
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._memory: Dict[str, Dict[str, Any]] = {}
+    
+    @staticmethod
+    def make_key(model: str, system_prompt: Optional[str], prompt: str) -> str:
+        """
+        Build the cache key of a request.
+        
+        Args:
+            model: Name of the model generating the response
+            system_prompt: System prompt of the request, if any
+            prompt: The user message
+        
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        payload = json.dumps({"m": model, "s": system_prompt, "p": prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            The cached response dictionary, or None on a miss
+        """
+        response = self._memory.get(key)
+        if response is not None:
+            return response
+        
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        
+        response = json.loads(row[0])
+        self._memory[key] = response
+        return response
+    
+    def set(self, key: str, response: Dict[str, Any]):
+        """
+        Store a response.
+        
+        Args:
+            key: Cache key from make_key
+            response: Response dictionary to cache
+        """
+        self._memory[key] = response
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                               (key, json.dumps(response)))
+            self._conn.commit()
+    
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,41 @@
+"""
+Tests for the Knowledge Awareness metrics.
+"""
+
+from metacognitive_framework.dimensions.knowledge_awareness.metrics import (
+    extract_factual_statements, hallucination_rate
+)
+
+
+def test_hallucination_rate_counts_overlapping_statements():
+    facts = [
+        {"statement": "foo bar", "correct": True},
+        {"statement": "bar baz", "correct": True}
+    ]
+    assert hallucination_rate("x foo bar baz y", facts) == 1.0
+
+
+def test_hallucination_rate_counts_nested_statements():
+    facts = [
+        {"statement": "the sky is blue", "correct": True},
+        {"statement": "I know the sky is blue", "correct": True}
+    ]
+    assert hallucination_rate("I know the sky is blue", facts) == 1.0
+
+
+def test_hallucination_rate_ignores_incorrect_statements():
+    facts = [
+        {"statement": "The sky is blue", "correct": True},
+        {"statement": "The sky is green", "correct": False}
+    ]
+    assert hallucination_rate("the sky is blue. The sky is green.", facts) == 0.5
+
+
+def test_extract_factual_statements_opinion_markers_are_case_sensitive_substrings():
+    text = ("The treaty was signed in May 2020 by both parties. "
+            "The mayor opened the new bridge last week. "
+            "The team couldn't finish the season on time. "
+            "The results might change after the final review.")
+    assert extract_factual_statements(text) == (
+        "The treaty was signed in May 2020 by both parties.",
+    )
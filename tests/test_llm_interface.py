@@ -0,0 +1,29 @@
+"""
+Tests for the mock LLM interface.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from metacognitive_framework.utils.llm_interface import MockLLMInterface
+
+
+def test_concurrent_lookups_see_predefined_responses(tmp_path):
+    for category in range(4):
+        responses = {f"q{category}-{i}": f"a{category}-{i}" for i in range(1000)}
+        (tmp_path / f"category{category}.json").write_text(json.dumps(responses))
+    
+    llm = MockLLMInterface(str(tmp_path))
+    threads = 16
+    barrier = threading.Barrier(threads)
+    
+    def lookup(i):
+        # Start every first lookup together, while the response index is still unbuilt
+        barrier.wait()
+        return llm.generate_response(f"q{i % 4}-{i}")["response_text"]
+    
+    with ThreadPoolExecutor(threads) as executor:
+        responses = list(executor.map(lookup, range(threads)))
+    
+    assert responses == [f"a{i % 4}-{i}" for i in range(threads)]
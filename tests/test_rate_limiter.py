@@ -0,0 +1,85 @@
+"""
+Tests for the RPM/TPM rate limiter.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from metacognitive_framework.utils import rate_limiter
+from metacognitive_framework.utils.rate_limiter import RateLimiter
+
+
+class _FakeClock:
+    """Monotonic clock that only advances when the limiter sleeps or a test moves it."""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+    
+    async def async_sleep(self, seconds):
+        self.sleep(seconds)
+
+
+def _use_clock(monkeypatch, clock):
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep))
+    monkeypatch.setattr(rate_limiter, "asyncio", SimpleNamespace(sleep=clock.async_sleep))
+
+
+def test_request_bucket_reports_wait_and_refills(monkeypatch):
+    clock = _FakeClock()
+    _use_clock(monkeypatch, clock)
+    limiter = RateLimiter(rpm=60)
+    
+    for _ in range(60):
+        assert limiter._try_reserve(0) == 0
+    assert limiter._try_reserve(0) == 1.0
+    
+    clock.now = 0.5
+    assert limiter._try_reserve(0) == 0.5
+    
+    clock.now = 1.0
+    assert limiter._try_reserve(0) == 0
+
+
+def test_token_bucket_reports_wait_for_shortfall(monkeypatch):
+    clock = _FakeClock()
+    _use_clock(monkeypatch, clock)
+    limiter = RateLimiter(rpm=100, tpm=600)
+    
+    assert limiter._try_reserve(600) == 0
+    assert limiter._try_reserve(100) == 10.0
+    # A refused request reserves nothing
+    assert limiter.available_request_capacity == 99
+
+
+def test_refill_is_capped_at_one_minute_of_capacity(monkeypatch):
+    clock = _FakeClock()
+    _use_clock(monkeypatch, clock)
+    limiter = RateLimiter(rpm=30, tpm=1000)
+    limiter._try_reserve(500)
+    
+    clock.now = 3600.0
+    limiter._refill()
+    assert limiter.available_request_capacity == 30
+    assert limiter.available_token_capacity == 1000
+
+
+def test_acquire_sleeps_until_capacity_is_available(monkeypatch):
+    clock = _FakeClock()
+    _use_clock(monkeypatch, clock)
+    limiter = RateLimiter(rpm=60, tpm=600)
+    
+    asyncio.run(limiter.acquire(600))
+    asyncio.run(limiter.acquire(300))
+    assert clock.sleeps == [30.0]
+    
+    # A request larger than the token bucket still launches once the bucket is full
+    limiter.acquire_blocking(10000)
+    assert clock.sleeps == [30.0, 60.0]
@@ -0,0 +1,21 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+
+from metacognitive_framework.utils.response_cache import ResponseCache
+
+
+def test_response_round_trips_across_instances(tmp_path):
+    response = {"response_text": "Paris", "usage": {"input_tokens": 12, "output_tokens": 3}}
+    key = ResponseCache.make_key("model", "Be brief.", "Capital of France?")
+    
+    cache = ResponseCache(str(tmp_path))
+    cache.set(key, response)
+    cache.close()
+    
+    reopened = ResponseCache(str(tmp_path))
+    try:
+        assert reopened.get(key) == response
+        assert reopened.get(ResponseCache.make_key("model", None, "Capital of France?")) is None
+    finally:
+        reopened.close()
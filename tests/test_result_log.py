@@ -0,0 +1,56 @@
+"""
+Tests for resuming the per-metric result logs written by main.py.
+"""
+
+import json
+
+import pytest
+
+from metacognitive_framework.main import _ResultLog
+
+
+def _result(index, score):
+    return {"custom_id": f"knowledge_boundary-{index}", "score": score}
+
+
+def test_resume_drops_torn_last_line(tmp_path):
+    path = tmp_path / "knowledge_boundary_results.jsonl"
+    complete = "".join(json.dumps(_result(i, score)) + "\n" for i, score in ((0, 1.0), (1, 0.0)))
+    path.write_text(complete + '{"custom_id": "knowledge_boundary-2", "sco')
+    
+    log = _ResultLog(str(tmp_path), "knowledge_boundary")
+    try:
+        assert log.completed == {0, 1}
+        assert log.score.mean == 0.5
+        assert path.read_text() == complete
+        
+        log.record(3, 3, {"score": 1.0})
+    finally:
+        log.close()
+    
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["custom_id"] for line in lines] == [
+        "knowledge_boundary-0", "knowledge_boundary-1", "knowledge_boundary-2"
+    ]
+
+
+def test_resume_starts_new_line_after_unterminated_result(tmp_path):
+    path = tmp_path / "knowledge_boundary_results.jsonl"
+    path.write_text(json.dumps(_result(0, 1.0)))
+    
+    log = _ResultLog(str(tmp_path), "knowledge_boundary")
+    try:
+        assert log.completed == {0}
+        log.record(2, 2, {"score": 0.0})
+    finally:
+        log.close()
+    
+    assert [json.loads(line)["score"] for line in path.read_text().splitlines()] == [1.0, 0.0]
+
+
+def test_resume_rejects_corruption_before_last_line(tmp_path):
+    path = tmp_path / "knowledge_boundary_results.jsonl"
+    path.write_text('{"custom_id": "knowl\n' + json.dumps(_result(1, 1.0)) + "\n")
+    
+    with pytest.raises(ValueError):
+        _ResultLog(str(tmp_path), "knowledge_boundary")
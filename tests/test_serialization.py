@@ -0,0 +1,40 @@
+"""
+Tests for the JSON serialization helpers.
+"""
+
+import json
+
+import pytest
+
+from metacognitive_framework.core.serialization import JSONArrayWriter, encode_json
+
+
+@pytest.mark.parametrize("count", [0, 1, 3])
+@pytest.mark.parametrize("pretty", [False, True])
+def test_json_array_writer_matches_encoded_array(tmp_path, count, pretty):
+    items = [{"id": i, "tags": ["a", "b"], "score": i / 2} for i in range(count)]
+    path = tmp_path / "items.json"
+    
+    with JSONArrayWriter(str(path), pretty=pretty) as writer:
+        for item in items:
+            writer.write(item)
+    
+    content = path.read_bytes()
+    assert json.loads(content) == items
+    assert content == encode_json(items, pretty)
+
+
+@pytest.mark.parametrize("count", [0, 1, 3])
+@pytest.mark.parametrize("pretty", [False, True])
+def test_json_array_writer_nests_array_under_key(tmp_path, count, pretty):
+    items = [{"id": i} for i in range(count)]
+    fields = {"dimension": "Knowledge Awareness", "weights": {"a": 0.5, "b": 0.5}}
+    path = tmp_path / "results.json"
+    
+    with JSONArrayWriter(str(path), pretty=pretty, key="examples", fields=fields) as writer:
+        for item in items:
+            writer.write(item)
+    
+    content = path.read_bytes()
+    assert json.loads(content) == {**fields, "examples": items}
+    assert content == encode_json({**fields, "examples": items}, pretty)